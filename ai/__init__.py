@@ -4,6 +4,11 @@ AI algorithms package for the Survival Arena game.
 
 from .astar import AStarPathfinder
 from .minimax import MinimaxAI
-from .fuzzy_logic import FuzzyLogic
+from .fuzzy_logic import FuzzyLogic, FuzzyRuleSet
+from .metrics import METRICS, MetricsRegistry
+from .profiles import AIProfile
 
-__all__ = ['AStarPathfinder', 'MinimaxAI', 'FuzzyLogic']
+__all__ = [
+    'AStarPathfinder', 'MinimaxAI', 'FuzzyLogic', 'FuzzyRuleSet', 'AIProfile', 'METRICS',
+    'MetricsRegistry',
+]
@@ -5,6 +5,15 @@ Used by ally bots to navigate to resources while avoiding obstacles.
 
 import heapq
 
+from ai.metrics import METRICS
+
+
+# Search effort, recorded while METRICS.enabled is set
+_SEARCHES = METRICS.counter("astar.searches")
+_NO_PATH = METRICS.counter("astar.no_path")
+_NODES_EXPANDED = METRICS.histogram("astar.nodes_expanded")
+_PATH_LENGTH = METRICS.histogram("astar.path_length")
+
 
 class Node:
     """Node class for A* pathfinding."""
@@ -64,6 +73,8 @@ class AStarPathfinder:
         """
         # If start equals goal, return immediately
         if start == goal:
+            if METRICS.enabled:
+                AStarPathfinder._record_search(0, 0)
             return [start]
 
         # Initialize start and goal nodes
@@ -75,10 +86,12 @@ class AStarPathfinder:
         closed_set = set()
 
         heapq.heappush(open_list, start_node)
+        expanded = 0
 
         while open_list:
             # Get node with lowest f score
             current_node = heapq.heappop(open_list)
+            expanded += 1
 
             # Add to closed set
             closed_set.add(current_node.position)
@@ -91,6 +104,8 @@ class AStarPathfinder:
                 while current is not None:
                     path.append(current.position)
                     current = current.parent
+                if METRICS.enabled:
+                    AStarPathfinder._record_search(expanded, len(path) - 1)
                 return path[::-1]  # Reverse to get start -> goal
 
             # Get neighbors
@@ -125,8 +140,48 @@ class AStarPathfinder:
                     heapq.heappush(open_list, neighbor_node)
 
         # No path found, return start position
+        if METRICS.enabled:
+            AStarPathfinder._record_search(expanded, None)
         return [start]
 
+    @staticmethod
+    def _record_search(expanded, path_length):
+        """Feed one search into the metrics (path_length None = unreachable)."""
+        _SEARCHES.inc()
+        _NODES_EXPANDED.observe(expanded)
+        if path_length is None:
+            _NO_PATH.inc()
+        else:
+            _PATH_LENGTH.observe(path_length)
+
+    @staticmethod
+    def greedy_step(start, goal, obstacles, grid_size):
+        """
+        Take one step that most reduces the Manhattan distance to the goal.
+
+        A constant-time fallback for find_path: it ignores obstacles further
+        ahead, so it can get stuck behind walls.
+
+        Args:
+            start: (x, y) starting position
+            goal: (x, y) goal position
+            obstacles: set of (x, y) positions that are blocked
+            grid_size: size of the grid
+
+        Returns:
+            (x, y) next position, or start if no neighbor is closer
+        """
+        best = start
+        best_distance = AStarPathfinder.manhattan_distance(start, goal)
+        for neighbor in AStarPathfinder.get_neighbors(start, grid_size):
+            if neighbor in obstacles:
+                continue
+            distance = AStarPathfinder.manhattan_distance(neighbor, goal)
+            if distance < best_distance:
+                best = neighbor
+                best_distance = distance
+        return best
+
     @staticmethod
     def get_next_move(start, goal, obstacles, grid_size):
         """
@@ -3,7 +3,76 @@ Fuzzy Logic Decision System
 Used by AI players to make strategic decisions based on game state.
 """
 
+from dataclasses import asdict, dataclass, fields, replace
+
 from constants import ACTIONS
+from ai.metrics import METRICS
+
+
+# Decisions made, recorded while METRICS.enabled is set
+_DECISIONS = METRICS.counter("fuzzy.decisions")
+_ACTION_COUNTS = {
+    action: METRICS.counter(f"fuzzy.action.{action.lower()}") for action in ACTIONS.values()
+}
+
+# Distance breakpoints are in cells of a grid this size; distances on other
+# grids are scaled to it, the way health is scaled to 0-100 of max_health
+DISTANCE_SCALE = 20
+
+
+@dataclass(frozen=True)
+class FuzzyRuleSet:
+    """
+    Membership breakpoints and rule weights of the fuzzy decision system.
+
+    Trapezoids are (left, left_peak, right_peak, right) and triangles
+    (left, peak, right). Health and score breakpoints are on a 0-100 scale
+    of max_health and the win score; distances are in cells of a
+    DISTANCE_SCALE grid, and FAR stays fully true past its right peak.
+    ``weights`` scales rules 1-8 of apply_fuzzy_rules. The defaults are the
+    original hand-tuned rules.
+    """
+
+    health_low: tuple = (0, 0, 20, 35)
+    health_medium: tuple = (30, 50, 70)
+    health_high: tuple = (65, 80, 100, 100)
+    score_low: tuple = (0, 0, 20, 40)
+    score_medium: tuple = (30, 50, 70)
+    score_high: tuple = (60, 80, 100, 100)
+    distance_near: tuple = (0, 0, 2, 4)
+    distance_medium: tuple = (3, 5, 8)
+    distance_far: tuple = (7, 10, 20, 20)
+    weights: tuple = (1.5, 1.0, 1.0, 1.0, 1.0, 0.7, 1.0, 1.2)
+
+    def __post_init__(self):
+        """Validate the breakpoints and weights."""
+        for field in fields(self):
+            value = tuple(getattr(self, field.name))
+            # Stored as tuples so rule sets loaded from JSON lists stay hashable
+            object.__setattr__(self, field.name, value)
+            if field.name == "weights":
+                if len(value) != 8 or min(value) < 0:
+                    raise ValueError("weights must be 8 non-negative numbers (rules 1-8)")
+            elif len(value) != len(field.default) or list(value) != sorted(value):
+                raise ValueError(
+                    f"{field.name} must be {len(field.default)} non-decreasing breakpoints"
+                )
+
+    def with_changes(self, **changes):
+        """Return a copy of this rule set with some parameters replaced."""
+        return replace(self, **changes)
+
+    def to_dict(self):
+        """JSON-compatible dict of the parameters (see from_dict)."""
+        return {name: list(value) for name, value in asdict(self).items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a rule set from to_dict() output; missing keys keep their defaults."""
+        return cls(**data)
+
+
+DEFAULT_RULES = FuzzyRuleSet()
 
 
 class FuzzyLogic:
@@ -57,21 +126,24 @@ class FuzzyLogic:
             return (right - value) / (right - right_peak)
 
     @staticmethod
-    def health_membership(health):
+    def health_membership(health, max_health=100, rules=DEFAULT_RULES):
         """
         Calculate fuzzy membership for health levels.
 
         Returns:
             Dictionary with LOW, MEDIUM, HIGH membership values
         """
-        low = FuzzyLogic.trapezoidal_membership(health, 0, 0, 20, 35)
-        medium = FuzzyLogic.triangular_membership(health, 30, 50, 70)
-        high = FuzzyLogic.trapezoidal_membership(health, 65, 80, 100, 100)
+        # Normalize health to 0-100 scale (exact for the default max_health)
+        health = health * 100 / max_health
+
+        low = FuzzyLogic.trapezoidal_membership(health, *rules.health_low)
+        medium = FuzzyLogic.triangular_membership(health, *rules.health_medium)
+        high = FuzzyLogic.trapezoidal_membership(health, *rules.health_high)
 
         return {"LOW": low, "MEDIUM": medium, "HIGH": high}
 
     @staticmethod
-    def score_membership(score, max_score=500):
+    def score_membership(score, max_score=500, rules=DEFAULT_RULES):
         """
         Calculate fuzzy membership for score levels.
 
@@ -81,28 +153,38 @@ class FuzzyLogic:
         # Normalize score to 0-100 scale
         normalized = (score / max_score) * 100
 
-        low = FuzzyLogic.trapezoidal_membership(normalized, 0, 0, 20, 40)
-        medium = FuzzyLogic.triangular_membership(normalized, 30, 50, 70)
-        high = FuzzyLogic.trapezoidal_membership(normalized, 60, 80, 100, 100)
+        low = FuzzyLogic.trapezoidal_membership(normalized, *rules.score_low)
+        medium = FuzzyLogic.triangular_membership(normalized, *rules.score_medium)
+        high = FuzzyLogic.trapezoidal_membership(normalized, *rules.score_high)
 
         return {"LOW": low, "MEDIUM": medium, "HIGH": high}
 
     @staticmethod
-    def distance_membership(distance):
+    def distance_membership(distance, rules=DEFAULT_RULES, grid_size=DISTANCE_SCALE):
         """
         Calculate fuzzy membership for distance levels.
 
         Returns:
             Dictionary with NEAR, MEDIUM, FAR membership values
         """
-        near = FuzzyLogic.trapezoidal_membership(distance, 0, 0, 2, 4)
-        medium = FuzzyLogic.triangular_membership(distance, 3, 5, 8)
-        far = FuzzyLogic.trapezoidal_membership(distance, 7, 10, 20, 20)
+        # Normalize distance to a DISTANCE_SCALE grid (exact for the default grid)
+        distance = distance * DISTANCE_SCALE / grid_size
+
+        near = FuzzyLogic.trapezoidal_membership(distance, *rules.distance_near)
+        medium = FuzzyLogic.triangular_membership(distance, *rules.distance_medium)
+        # FAR is open-ended: Manhattan distances reach twice the grid size
+        if distance >= rules.distance_far[2]:
+            far = 1.0
+        else:
+            far = FuzzyLogic.trapezoidal_membership(distance, *rules.distance_far)
 
         return {"NEAR": near, "MEDIUM": medium, "FAR": far}
 
     @staticmethod
-    def apply_fuzzy_rules(health, score, nearest_enemy_dist, nearest_resource_dist):
+    def apply_fuzzy_rules(
+        health, score, nearest_enemy_dist, nearest_resource_dist, max_health=100, max_score=500,
+        rules=DEFAULT_RULES, grid_size=DISTANCE_SCALE,
+    ):
         """
         Apply fuzzy rules to determine action.
 
@@ -118,15 +200,20 @@ class FuzzyLogic:
             score: current score
             nearest_enemy_dist: distance to nearest enemy
             nearest_resource_dist: distance to nearest resource
+            max_health: health that counts as full
+            max_score: score that counts as maximal (the win score)
+            rules: FuzzyRuleSet with the breakpoints and rule weights
+            grid_size: size of the grid the distances were measured on
 
         Returns:
             Best action based on fuzzy logic
         """
         # Calculate memberships
-        health_fuzzy = FuzzyLogic.health_membership(health)
-        score_fuzzy = FuzzyLogic.score_membership(score)
-        enemy_dist_fuzzy = FuzzyLogic.distance_membership(nearest_enemy_dist)
-        resource_dist_fuzzy = FuzzyLogic.distance_membership(nearest_resource_dist)
+        health_fuzzy = FuzzyLogic.health_membership(health, max_health, rules)
+        score_fuzzy = FuzzyLogic.score_membership(score, max_score, rules)
+        enemy_dist_fuzzy = FuzzyLogic.distance_membership(nearest_enemy_dist, rules, grid_size)
+        resource_dist_fuzzy = FuzzyLogic.distance_membership(nearest_resource_dist, rules, grid_size)
+        weights = rules.weights
 
         # Initialize action strengths
         action_strengths = {
@@ -141,49 +228,49 @@ class FuzzyLogic:
         # Rule 1: IF health LOW AND enemy NEAR → FLEE_ENEMY
         rule1_strength = min(health_fuzzy["LOW"], enemy_dist_fuzzy["NEAR"])
         action_strengths[ACTIONS["FLEE_ENEMY"]] = max(
-            action_strengths[ACTIONS["FLEE_ENEMY"]], rule1_strength * 1.5
-        )  # High priority
+            action_strengths[ACTIONS["FLEE_ENEMY"]], rule1_strength * weights[0]
+        )  # High priority (1.5 by default)
 
         # Rule 2: IF health LOW AND enemy FAR → SEEK_HEALTH
         rule2_strength = min(health_fuzzy["LOW"], enemy_dist_fuzzy["FAR"])
         action_strengths[ACTIONS["SEEK_HEALTH"]] = max(
-            action_strengths[ACTIONS["SEEK_HEALTH"]], rule2_strength
+            action_strengths[ACTIONS["SEEK_HEALTH"]], rule2_strength * weights[1]
         )
 
         # Rule 3: IF health HIGH AND score LOW → COLLECT_COINS
         rule3_strength = min(health_fuzzy["HIGH"], score_fuzzy["LOW"])
         action_strengths[ACTIONS["COLLECT_COINS"]] = max(
-            action_strengths[ACTIONS["COLLECT_COINS"]], rule3_strength
+            action_strengths[ACTIONS["COLLECT_COINS"]], rule3_strength * weights[2]
         )
 
         # Rule 4: IF health HIGH AND score HIGH → AGGRESSIVE_PLAY
         rule4_strength = min(health_fuzzy["HIGH"], score_fuzzy["HIGH"])
         action_strengths[ACTIONS["AGGRESSIVE_PLAY"]] = max(
-            action_strengths[ACTIONS["AGGRESSIVE_PLAY"]], rule4_strength
+            action_strengths[ACTIONS["AGGRESSIVE_PLAY"]], rule4_strength * weights[3]
         )
 
         # Rule 5: IF health MEDIUM → DEFENSIVE_PLAY
         rule5_strength = health_fuzzy["MEDIUM"]
         action_strengths[ACTIONS["DEFENSIVE_PLAY"]] = max(
-            action_strengths[ACTIONS["DEFENSIVE_PLAY"]], rule5_strength
+            action_strengths[ACTIONS["DEFENSIVE_PLAY"]], rule5_strength * weights[4]
         )
 
         # Rule 6: IF health LOW AND enemy MEDIUM → COLLECT_RESOURCES (cautiously)
         rule6_strength = min(health_fuzzy["LOW"], enemy_dist_fuzzy["MEDIUM"])
         action_strengths[ACTIONS["COLLECT_RESOURCES"]] = max(
-            action_strengths[ACTIONS["COLLECT_RESOURCES"]], rule6_strength * 0.7
+            action_strengths[ACTIONS["COLLECT_RESOURCES"]], rule6_strength * weights[5]
         )
 
         # Rule 7: IF health MEDIUM AND score LOW → COLLECT_RESOURCES
         rule7_strength = min(health_fuzzy["MEDIUM"], score_fuzzy["LOW"])
         action_strengths[ACTIONS["COLLECT_RESOURCES"]] = max(
-            action_strengths[ACTIONS["COLLECT_RESOURCES"]], rule7_strength
+            action_strengths[ACTIONS["COLLECT_RESOURCES"]], rule7_strength * weights[6]
         )
 
         # Rule 8: IF enemy NEAR AND health MEDIUM → DEFENSIVE_PLAY (boost)
         rule8_strength = min(enemy_dist_fuzzy["NEAR"], health_fuzzy["MEDIUM"])
         action_strengths[ACTIONS["DEFENSIVE_PLAY"]] = max(
-            action_strengths[ACTIONS["DEFENSIVE_PLAY"]], rule8_strength * 1.2
+            action_strengths[ACTIONS["DEFENSIVE_PLAY"]], rule8_strength * weights[7]
         )
 
         # Defuzzification: Return action with maximum membership
@@ -192,7 +279,10 @@ class FuzzyLogic:
         return best_action
 
     @staticmethod
-    def decide_action(health, score, nearest_enemy_dist, nearest_resource_dist):
+    def decide_action(
+        health, score, nearest_enemy_dist, nearest_resource_dist, max_health=100, max_score=500,
+        rules=DEFAULT_RULES, grid_size=DISTANCE_SCALE,
+    ):
         """
         Main decision function for AI players.
 
@@ -201,10 +291,21 @@ class FuzzyLogic:
             score: current score
             nearest_enemy_dist: distance to nearest enemy
             nearest_resource_dist: distance to nearest resource
+            max_health: health that counts as full
+            max_score: score that counts as maximal (the win score)
+            rules: FuzzyRuleSet with the breakpoints and rule weights
+            grid_size: size of the grid the distances were measured on
 
         Returns:
             Action string (from ACTIONS constants)
         """
-        return FuzzyLogic.apply_fuzzy_rules(
-            health, score, nearest_enemy_dist, nearest_resource_dist
+        action = FuzzyLogic.apply_fuzzy_rules(
+            health, score, nearest_enemy_dist, nearest_resource_dist, max_health, max_score, rules,
+            grid_size,
         )
+
+        if METRICS.enabled:
+            _DECISIONS.inc()
+            _ACTION_COUNTS[action].inc()
+
+        return action
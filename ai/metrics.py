@@ -0,0 +1,147 @@
+"""
+Lightweight metrics for the AI algorithms
+Counters and histograms the ai package feeds with search effort (A* nodes
+expanded, minimax nodes and cutoffs, fuzzy decisions). Collection is off
+until METRICS.enabled is set, so games pay only a flag check per search.
+"""
+
+
+class Counter:
+    """Monotonic event count."""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name):
+        self.name = name
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def reset(self):
+        self.value = 0
+
+
+class Histogram:
+    """
+    Distribution of non-negative integer observations.
+
+    Values are bucketed by bit length (0, 1, 2-3, 4-7, ...), so percentiles
+    are reported as the upper bound of the bucket they fall in.
+    """
+
+    __slots__ = ("name", "count", "total", "min", "max", "buckets")
+
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        bucket = int(value).bit_length()
+        buckets = self.buckets
+        if bucket >= len(buckets):
+            buckets.extend([0] * (bucket + 1 - len(buckets)))
+        buckets[bucket] += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """Approximate percentile (upper bound of the containing bucket)."""
+        if not self.count:
+            return 0
+        rank = self.count * percent / 100.0
+        seen = 0
+        for bucket, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(self.max, (1 << bucket) - 1)
+        return self.max
+
+    def reset(self):
+        self.count = 0
+        self.total = 0
+        self.min = float("inf")
+        self.max = 0
+        self.buckets = []
+
+
+class MetricsRegistry:
+    """Named counters and histograms shared by the AI algorithms."""
+
+    def __init__(self, enabled=False):
+        """
+        Initialize an empty registry.
+
+        Args:
+            enabled: start collecting immediately
+        """
+        self.enabled = enabled
+        self.counters = {}
+        self.histograms = {}
+
+    def counter(self, name):
+        """Get (or create) a counter."""
+        if name not in self.counters:
+            self.counters[name] = Counter(name)
+        return self.counters[name]
+
+    def histogram(self, name):
+        """Get (or create) a histogram."""
+        if name not in self.histograms:
+            self.histograms[name] = Histogram(name)
+        return self.histograms[name]
+
+    def reset(self):
+        """Zero every metric (registered metrics stay registered)."""
+        for counter in self.counters.values():
+            counter.reset()
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def snapshot(self):
+        """
+        Get the current values as plain data.
+
+        Returns:
+            Dict with "counters" (name -> value) and "histograms"
+            (name -> {"count", "mean", "p50", "p95", "max"})
+        """
+        return {
+            "counters": {name: c.value for name, c in sorted(self.counters.items())},
+            "histograms": {
+                name: {
+                    "count": h.count,
+                    "mean": h.mean,
+                    "p50": h.percentile(50),
+                    "p95": h.percentile(95),
+                    "max": h.max,
+                }
+                for name, h in sorted(self.histograms.items())
+            },
+        }
+
+    def format_lines(self):
+        """Render the metrics as short text lines (for logs and the debug overlay)."""
+        lines = []
+        for name, counter in sorted(self.counters.items()):
+            if counter.value:
+                lines.append(f"{name}: {counter.value}")
+        for name, h in sorted(self.histograms.items()):
+            if h.count:
+                lines.append(
+                    f"{name}: mean {h.mean:.1f}  p95 {h.percentile(95)}  max {h.max}"
+                )
+        return lines
+
+
+# Registry fed by the ai package
+METRICS = MetricsRegistry()
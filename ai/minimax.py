@@ -5,6 +5,15 @@ Used by enemy agents to choose optimal targets between two players.
 
 import math
 from ai.astar import AStarPathfinder
+from ai.metrics import METRICS
+
+
+# Search effort, recorded while METRICS.enabled is set
+_SEARCHES = METRICS.counter("minimax.searches")
+_NODES = METRICS.counter("minimax.nodes")
+_BETA_CUTOFFS = METRICS.counter("minimax.beta_cutoffs")
+_ALPHA_CUTOFFS = METRICS.counter("minimax.alpha_cutoffs")
+_NODES_PER_SEARCH = METRICS.histogram("minimax.nodes_per_search")
 
 
 class MinimaxAI:
@@ -103,6 +112,9 @@ class MinimaxAI:
         Returns:
             Tuple of (score, best_move)
         """
+        if METRICS.enabled:
+            _NODES.value += 1
+
         # Base case: depth reached
         if depth == 0:
             # Evaluate both targets and return best score
@@ -139,6 +151,8 @@ class MinimaxAI:
 
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
+                    if METRICS.enabled:
+                        _BETA_CUTOFFS.value += 1
                     break  # Beta cutoff
 
             return max_eval, best_move
@@ -170,6 +184,8 @@ class MinimaxAI:
                     min_eval = min(min_eval, eval_score)
                     beta = min(beta, eval_score)
                     if beta <= alpha:
+                        if METRICS.enabled:
+                            _ALPHA_CUTOFFS.value += 1
                         break  # Alpha cutoff
 
                 if beta <= alpha:
@@ -207,6 +223,8 @@ class MinimaxAI:
         else:
             target = player2_pos
 
+        nodes_before = _NODES.value
+
         # Use minimax to find best move
         _, best_move = MinimaxAI.minimax(
             enemy_pos,
@@ -222,6 +240,10 @@ class MinimaxAI:
             True,
         )
 
+        if METRICS.enabled:
+            _SEARCHES.inc()
+            _NODES_PER_SEARCH.observe(_NODES.value - nodes_before)
+
         return target, best_move
 
     @staticmethod
@@ -0,0 +1,86 @@
+"""
+AI profiles for the Survival Arena players
+A profile is everything that distinguishes one player AI from another: its
+fuzzy rule set and how it moves toward the target the rules pick
+"""
+
+import json
+from dataclasses import dataclass
+
+from ai.fuzzy_logic import DEFAULT_RULES, FuzzyRuleSet
+
+
+# How a player steps toward its target: a full A* search or one greedy step
+PLAYER_PATHFINDERS = ("astar", "greedy")
+
+
+@dataclass(frozen=True)
+class AIProfile:
+    """Decision rules and pathfinder of one player AI."""
+
+    rules: FuzzyRuleSet = DEFAULT_RULES
+    pathfinder: str = "astar"
+
+    def __post_init__(self):
+        """Validate the parameters."""
+        if self.pathfinder not in PLAYER_PATHFINDERS:
+            raise ValueError(f"pathfinder must be one of {', '.join(PLAYER_PATHFINDERS)}")
+
+    def to_dict(self):
+        """JSON-compatible dict of the profile (see from_dict)."""
+        return {"rules": self.rules.to_dict(), "pathfinder": self.pathfinder}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a profile from to_dict() output; missing keys keep their defaults."""
+        data = dict(data)
+        if "rules" in data:
+            data["rules"] = FuzzyRuleSet.from_dict(data["rules"])
+        return cls(**data)
+
+
+DEFAULT_PROFILE = AIProfile()
+
+# Ready-made variants for tournaments
+BUILTIN_PROFILES = {
+    "default": DEFAULT_PROFILE,
+    "greedy": AIProfile(pathfinder="greedy"),
+    "cautious": AIProfile(
+        DEFAULT_RULES.with_changes(
+            health_low=(0, 0, 35, 50),
+            health_medium=(45, 60, 80),
+            health_high=(75, 90, 100, 100),
+            weights=(2.0, 1.2, 1.0, 0.6, 1.0, 0.9, 1.0, 1.5),
+        )
+    ),
+    "aggressive": AIProfile(
+        DEFAULT_RULES.with_changes(
+            health_low=(0, 0, 10, 20),
+            health_high=(45, 60, 100, 100),
+            score_high=(30, 50, 100, 100),
+            weights=(1.0, 1.0, 1.0, 1.5, 0.7, 0.5, 1.0, 0.8),
+        )
+    ),
+}
+
+
+def load_profiles(path):
+    """
+    Load named profiles from a JSON file of {name: AIProfile.to_dict()}.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Dict of name -> AIProfile
+    """
+    with open(path) as f:
+        data = json.load(f)
+    return {name: AIProfile.from_dict(profile) for name, profile in data.items()}
+
+
+def save_profiles(path, profiles):
+    """Write named profiles in the format load_profiles() reads."""
+    with open(path, "w") as f:
+        json.dump({name: profile.to_dict() for name, profile in profiles.items()}, f, indent=1)
+        f.write("\n")
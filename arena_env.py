@@ -0,0 +1,337 @@
+"""
+Reinforcement-learning environments for the AI vs AI Survival Arena
+Gym-style reset/step wrappers in which one or both players are controlled by
+the caller, with NumPy occupancy-grid observations: a batch of games stepped
+in lockstep on the batch_sim engine, and single SurvivalArenaGame games
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by the environments
+    np = None
+
+from batch_sim import BatchArena, REASONS
+from config import DEFAULT_CONFIG
+from game import SurvivalArenaGame
+
+# Observation channels, from the observing player's point of view
+CHANNELS = ("obstacle", "self", "opponent", "own_ally", "opponent_ally", "enemy", "health", "coin")
+
+# Scalar features: own health, own score, opponent health, opponent score
+# (as shares of max_health and the win score) and the share of max_turns played
+STATS = ("health", "score", "opponent_health", "opponent_score", "turn")
+
+# Discrete actions: stay, then the four A* neighbor directions
+MOVES = ((0, 0), (0, 1), (0, -1), (1, 0), (-1, 0))
+
+# Reward for winning (negated for losing) on top of score gained / win score
+WIN_REWARD = 1.0
+
+# Channel order for each player's view of the absolute player 1 / player 2 layout
+_PERSPECTIVES = (
+    (0, 1, 2, 3, 4, 5, 6, 7),
+    (0, 2, 1, 4, 3, 5, 6, 7),
+)
+_STAT_PERSPECTIVES = ((0, 1, 2, 3, 4), (2, 3, 0, 1, 4))
+
+
+def _check_controlled(controlled):
+    """Validate the controlled player indices of an environment."""
+    if np is None:
+        raise ImportError("The arena environments require NumPy")
+    if not controlled or any(p not in (0, 1) for p in controlled):
+        raise ValueError("controlled must list player indices 0 and/or 1")
+
+
+class VectorArenaEnv:
+    """
+    K games stepped in lockstep in one process.
+
+    The games run on batch_sim.BatchArena: every phase of a turn is one set
+    of array operations over all K games, and the controlled players take
+    the actions as external moves. step() takes one action per game and
+    controlled player and returns arrays with a leading game dimension.
+    Observations are scattered straight from the engine's arrays, and the
+    second player's view is a channel permutation of the same grid. The
+    returned arrays are buffers reused by the next call; copy them to keep
+    them. With autoreset, a finished game starts a new map in the same step,
+    and the observation of its final state is in info["final_observation"].
+
+    The engine plays the same rules as SurvivalArenaGame but draws from its
+    own random stream (see BatchArena), so a seed gives other maps than
+    ArenaEnv.reset(seed).
+    """
+
+    def __init__(self, num_envs, config=None, controlled=(0,), profiles=None, autoreset=True, movement="flow"):
+        """
+        Initialize the environments (call reset() before step()).
+
+        Args:
+            num_envs: number of games K
+            config: GameConfig of every game
+            controlled: player indices (0 = Blue, 1 = Red) moved by step()
+                actions; the others use the built-in AI
+            profiles: (player 1, player 2) AIProfile pair for the built-in AI
+            autoreset: start a new game as soon as one ends (otherwise a
+                finished game stays finished, with zero rewards)
+            movement: how the built-in AI follows paths (see batch_sim.MOVEMENT_MODES)
+        """
+        _check_controlled(controlled)
+        self.num_envs = num_envs
+        self.config = config if config is not None else DEFAULT_CONFIG
+        self.controlled = tuple(controlled)
+        self.profiles = profiles
+        self.autoreset = autoreset
+        self.movement = movement
+        self.arena = None
+
+        grid_size = self.config.grid_size
+        agents = len(self.controlled)
+        self.observation_shape = (len(CHANNELS), grid_size, grid_size)
+        self.action_count = len(MOVES)
+
+        self._moves = np.array(MOVES)
+        self._grid = np.zeros((num_envs, agents, len(CHANNELS), grid_size, grid_size), np.uint8)
+        self._stats = np.zeros((num_envs, agents, len(STATS)), np.float32)
+        self._layout = np.zeros((num_envs, len(CHANNELS), grid_size, grid_size), np.uint8)
+        self._channel_order = np.array([_PERSPECTIVES[p] for p in self.controlled])
+        self._stat_order = np.array([_STAT_PERSPECTIVES[p] for p in self.controlled])
+        self._rewards = np.zeros((num_envs, agents), np.float32)
+        self._terminated = np.zeros(num_envs, bool)
+        self._truncated = np.zeros(num_envs, bool)
+        self._scores = np.zeros((num_envs, 2), np.int64)
+
+    def reset(self, seed=None):
+        """
+        Start a new game in every environment.
+
+        Args:
+            seed: seed of the engine's random stream (random if omitted)
+
+        Returns:
+            Tuple of (observation dict, info dict)
+        """
+        self.arena = BatchArena(
+            self.num_envs, self.config, self.profiles, self.movement, seed, self.controlled
+        )
+        self._scores[:] = self.arena.player_score
+        return self._observe(), {}
+
+    def step(self, actions):
+        """
+        Advance every game by one turn.
+
+        Args:
+            actions: (K, controlled players) action indices into MOVES (or a
+                flat sequence of K with one controlled player)
+
+        Returns:
+            Tuple of (observation dict, rewards (K, players), terminated (K,),
+            truncated (K,), info dict); a game ending at the turn limit is
+            truncated, one ending by score or elimination terminated
+        """
+        arena = self.arena
+        config = self.config
+        rewards = self._rewards
+        rewards.fill(0)
+        self._terminated.fill(False)
+        self._truncated.fill(False)
+        info = {}
+        if arena.active == 0:
+            return self._observe(), rewards, self._terminated, self._truncated, info
+
+        # Rows of the arena are the environments arena.index (all of them with autoreset)
+        slots = arena.index
+        actions = np.asarray(actions).reshape(self.num_envs, len(self.controlled))
+        ended = arena.play_turn(self._moves[actions[slots]])
+
+        controlled = list(self.controlled)
+        score = arena.player_score
+        rewards[slots] = (score[:, controlled] - self._scores[slots][:, controlled]) / config.win_score
+        self._scores[slots] = score
+
+        if ended.any():
+            done = slots[ended]
+            winner = arena.winner[done]
+            for slot, player in enumerate(controlled):
+                rewards[done, slot] += np.where(winner == player, WIN_REWARD, 0.0)
+                rewards[done, slot] -= np.where((winner >= 0) & (winner != player), WIN_REWARD, 0.0)
+            limit = arena.reason[done] == REASONS.index("turn_limit")
+            self._truncated[done] = limit
+            self._terminated[done] = ~limit
+
+            if self.autoreset:
+                final = self._observe()
+                info["final_observation"] = {
+                    "index": done,
+                    "grid": final["grid"][done],
+                    "stats": final["stats"][done],
+                }
+                arena.restart(ended)
+                self._scores[done] = arena.player_score[ended]
+            else:
+                self._observe()
+                arena.remove(ended)
+        return self._observe(), rewards, self._terminated, self._truncated, info
+
+    def _observe(self):
+        """Build the observations of every game still in the arena."""
+        arena = self.arena
+        config = self.config
+        slots = arena.index
+        layout = self._layout
+        layout[slots] = 0
+
+        # Grids are [game, x, y] in the engine and [channel, y, x] in observations
+        layout[slots, 0] = arena.walls.transpose(0, 2, 1)
+        for player in (0, 1):
+            alive = arena.alive[:, player]
+            cells = arena.players[alive, player]
+            layout[slots[alive], 1 + player, cells[:, 1], cells[:, 0]] = 1
+        allies = arena.allies
+        owner = 3 + arena._ally_owner
+        layout[slots[:, None], owner, allies[..., 1], allies[..., 0]] = 1
+        enemies = arena.enemies
+        layout[slots[:, None], 5, enemies[..., 1], enemies[..., 0]] = 1
+        game, slot = np.nonzero(arena.resource_active)
+        cells = arena.resources[game, slot]
+        layout[slots[game], 6 + arena._resource_type[slot], cells[:, 1], cells[:, 0]] = 1
+
+        stats = np.empty((len(slots), len(STATS)), np.float32)
+        stats[:, 0:4:2] = arena.player_health / config.max_health
+        stats[:, 1:4:2] = arena.player_score / config.win_score
+        stats[:, 4] = arena.turn / config.max_turns
+
+        # Every controlled player's view is a channel permutation of the layout
+        self._grid[slots] = layout[slots[:, None, None], self._channel_order]
+        self._stats[slots] = stats[:, self._stat_order]
+        return {"grid": self._grid, "stats": self._stats}
+
+
+class ArenaEnv:
+    """
+    Single-game environment: reset(seed) starts the map of that seed and
+    step(actions) plays one turn of a SurvivalArenaGame. Observations have a
+    leading dimension of one entry per controlled player and are fresh
+    copies.
+    """
+
+    def __init__(self, config=None, controlled=(0,), profiles=None):
+        """
+        Initialize the environment.
+
+        Args:
+            config: GameConfig of the game
+            controlled: player indices (0 = Blue, 1 = Red) moved by step()
+            profiles: (player 1, player 2) AIProfile pair for the built-in AI
+        """
+        _check_controlled(controlled)
+        self.config = config if config is not None else DEFAULT_CONFIG
+        self.controlled = tuple(controlled)
+        self.profiles = profiles
+        grid_size = self.config.grid_size
+        self.observation_shape = (len(CHANNELS), grid_size, grid_size)
+        self.action_count = len(MOVES)
+        self.game = None
+
+        self._channel_order = np.array([_PERSPECTIVES[p] for p in self.controlled])
+        self._stat_order = np.array([_STAT_PERSPECTIVES[p] for p in self.controlled])
+        self._obstacles = np.zeros((grid_size, grid_size), np.uint8)
+        self._scores = (0, 0)
+
+    def reset(self, seed=None):
+        """
+        Start a new game.
+
+        Args:
+            seed: game seed (SurvivalArenaGame(seed=...)), random if omitted
+
+        Returns:
+            Tuple of (observation dict, info dict)
+        """
+        game = self.game = SurvivalArenaGame(config=self.config, seed=seed, profiles=self.profiles)
+        self._obstacles.fill(0)
+        if game.obstacles:
+            xs, ys = zip(*game.obstacle_positions)
+            self._obstacles[list(ys), list(xs)] = 1
+        self._scores = (game.player1.score, game.player2.score)
+        return self._observe(), {}
+
+    def step(self, actions):
+        """
+        Play one turn.
+
+        Args:
+            actions: one action index into MOVES per controlled player (or
+                a single index with one controlled player)
+
+        Returns:
+            Tuple of (observation dict, rewards per player, terminated,
+            truncated, info dict with the winner and game over reason)
+        """
+        game = self.game
+        config = self.config
+        actions = np.asarray(actions).reshape(len(self.controlled)).tolist()
+        players = (game.player1, game.player2)
+        rewards = np.zeros(len(self.controlled), np.float32)
+        terminated = truncated = False
+
+        if game.game_active:
+            moves = [None, None]
+            for slot, player in enumerate(self.controlled):
+                moves[player] = MOVES[actions[slot]]
+            game.execute_turn(moves)
+
+            for slot, player in enumerate(self.controlled):
+                rewards[slot] = (players[player].score - self._scores[player]) / config.win_score
+            self._scores = (game.player1.score, game.player2.score)
+
+            if not game.game_active:
+                for slot, player in enumerate(self.controlled):
+                    if game.winner is players[player]:
+                        rewards[slot] += WIN_REWARD
+                    elif game.winner is not None:
+                        rewards[slot] -= WIN_REWARD
+                truncated = (
+                    game.turn_count >= config.max_turns
+                    and game.player1.alive and game.player2.alive
+                    and max(game.player1.score, game.player2.score) < config.win_score
+                )
+                terminated = not truncated
+
+        info = {"turn": game.turn_count}
+        if not game.game_active:
+            winner = game.winner
+            info["winner"] = None if winner is None else (0 if winner is game.player1 else 1)
+            info["reason"] = game.game_over_reason
+        return self._observe(), rewards, terminated, truncated, info
+
+    def _observe(self):
+        """Build the game's observations."""
+        game = self.game
+        config = self.config
+        player1, player2 = game.player1, game.player2
+        layout = np.zeros(self.observation_shape, np.uint8)
+        layout[0] = self._obstacles
+
+        cells = []
+        if player1.alive:
+            cells.append((1, player1.position))
+        if player2.alive:
+            cells.append((2, player2.position))
+        for ally in game.allies:
+            cells.append((3 if ally.owner is player1 else 4, ally.position))
+        for enemy in game.enemies:
+            cells.append((5, enemy.position))
+        for resource in game.resources:
+            if not resource.collected:
+                cells.append((6 if resource.type == "health" else 7, resource.position))
+        for channel, (x, y) in cells:
+            layout[channel, y, x] = 1
+
+        stats = np.array((
+            player1.health / config.max_health, player1.score / config.win_score,
+            player2.health / config.max_health, player2.score / config.win_score,
+            game.turn_count / config.max_turns,
+        ), np.float32)
+        return {"grid": layout[self._channel_order], "stats": stats[self._stat_order]}
@@ -1,17 +1,84 @@
 """
 Asset loader for the AI vs AI Survival Arena
-Loads all PNG images from the icons folder
+Loads all PNG images from the icons folder, from a single pre-scaled
+texture atlas when one has been built (scripts/build_assets.py)
 """
 
+import json
 import pygame
 import os
 
+ICONS_PATH = os.path.join(os.path.dirname(__file__), "icons")
+
+# Every image the game uses: (group, name, file under icons/, size it is drawn at)
+ASSET_MANIFEST = (
+    # Entity icons (game grid size)
+    ("entities", "player_blue", "entities/player_blue.png", (30, 30)),
+    ("entities", "player_red", "entities/player_red.png", (30, 30)),
+    ("entities", "ally_blue", "entities/ally_blue.png", (28, 28)),
+    ("entities", "ally_red", "entities/ally_red.png", (28, 28)),
+    ("entities", "enemy", "entities/enemy.png", (28, 28)),
+    ("entities", "health_pack", "entities/health_pack.png", (28, 28)),
+    ("entities", "coin", "entities/coin.png", (28, 28)),
+    ("entities", "wall", "entities/wall.png", (30, 30)),
+    # UI icons (stat card size)
+    ("ui", "clock", "ui/icon_clock.png", (20, 20)),
+    ("ui", "heart", "ui/icon_heart.png", (20, 20)),
+    ("ui", "skull", "ui/icon_skull.png", (20, 20)),
+    ("ui", "gamepad", "ui/icon_gamepad.png", (35, 35)),
+    ("ui", "brain", "ui/icon_brain.png", (20, 20)),
+    ("ui", "star", "ui/icon_star.png", (18, 18)),
+    ("ui", "restart", "ui/icon_restart.png", (18, 18)),
+    # Legend icons (small size for sidebar)
+    ("legend", "player_blue", "legend/player_blue.png", (16, 16)),
+    ("legend", "player_red", "legend/player_red.png", (16, 16)),
+    ("legend", "ally_blue", "legend/ally_blue.png", (16, 16)),
+    ("legend", "ally_red", "legend/ally_red.png", (16, 16)),
+    ("legend", "enemy", "legend/enemy.png", (16, 16)),
+    ("legend", "health_pack", "legend/health_pack.png", (16, 16)),
+    ("legend", "coin", "legend/coin.png", (16, 16)),
+    ("legend", "wall", "legend/wall.png", (16, 16)),
+)
+
+# Texture atlas: every manifest image, already scaled, packed into one PNG
+ATLAS_IMAGE = "atlas.png"
+ATLAS_INDEX = "atlas.json"
+ATLAS_WIDTH = 96
+ATLAS_VERSION = 1
+
+
+def load_image(filepath, size=None):
+    """
+    Load an image file and optionally scale it.
+
+    Args:
+        filepath: Path to the image file
+        size: Optional tuple (width, height) to scale the image
+
+    Returns:
+        Loaded pygame Surface, or None if file doesn't exist
+    """
+    try:
+        image = pygame.image.load(filepath).convert_alpha()
+        if size:
+            image = pygame.transform.smoothscale(image, size)
+        return image
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"Warning: Could not load {filepath}: {e}")
+        return None
+
 
 class AssetLoader:
     """Loads and manages all game assets (images)."""
 
-    def __init__(self):
-        """Initialize the asset loader."""
+    def __init__(self, use_atlas=True):
+        """
+        Initialize the asset loader.
+
+        Args:
+            use_atlas: load from the texture atlas when it is present and
+                matches ASSET_MANIFEST (otherwise the individual files)
+        """
         self.base_path = os.path.dirname(__file__)
         self.icons_path = os.path.join(self.base_path, "icons")
 
@@ -19,69 +86,56 @@ class AssetLoader:
         self.entities = {}
         self.ui_icons = {}
         self.legend_icons = {}
+        self.from_atlas = False
 
         # Load all assets
-        self._load_all_assets()
+        if use_atlas:
+            self.from_atlas = self._load_atlas()
+        if not self.from_atlas:
+            self._load_all_assets()
 
-    def _load_image(self, filepath, size=None):
-        """
-        Load an image file and optionally scale it.
+    def _group(self, group):
+        """Storage dict of an asset group."""
+        return {"entities": self.entities, "ui": self.ui_icons, "legend": self.legend_icons}[group]
 
-        Args:
-            filepath: Path to the image file
-            size: Optional tuple (width, height) to scale the image
+    def _load_all_assets(self):
+        """Load all game assets from the individual files in the icons folder."""
+        for group, name, file, size in ASSET_MANIFEST:
+            self._group(group)[name] = load_image(os.path.join(self.icons_path, file), size)
+
+    def _load_atlas(self):
+        """
+        Load every asset as a subsurface of the texture atlas.
 
         Returns:
-            Loaded pygame Surface, or None if file doesn't exist
+            True if the atlas was loaded, False if it is missing or stale
         """
+        index_path = os.path.join(self.icons_path, ATLAS_INDEX)
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return False
+        except ValueError as e:
+            print(f"Warning: Could not read {index_path}: {e}")
+            return False
+
+        entries = index.get("entries", [])
+        listed = {(e["group"], e["name"], e["file"], tuple(e["size"])) for e in entries}
+        if index.get("version") != ATLAS_VERSION or listed != set(ASSET_MANIFEST):
+            print("Warning: texture atlas is out of date; run scripts/build_assets.py")
+            return False
+
+        atlas_path = os.path.join(self.icons_path, index["image"])
         try:
-            image = pygame.image.load(filepath).convert_alpha()
-            if size:
-                image = pygame.transform.smoothscale(image, size)
-            return image
+            atlas = pygame.image.load(atlas_path).convert_alpha()
         except (pygame.error, FileNotFoundError) as e:
-            print(f"Warning: Could not load {filepath}: {e}")
-            return None
+            print(f"Warning: Could not load {atlas_path}: {e}")
+            return False
 
-    def _load_all_assets(self):
-        """Load all game assets from the icons folder."""
-        # Load entity icons (game grid size)
-        entities_path = os.path.join(self.icons_path, "entities")
-        self.entities = {
-            "player_blue": self._load_image(os.path.join(entities_path, "player_blue.png"), (30, 30)),
-            "player_red": self._load_image(os.path.join(entities_path, "player_red.png"), (30, 30)),
-            "ally_blue": self._load_image(os.path.join(entities_path, "ally_blue.png"), (28, 28)),
-            "ally_red": self._load_image(os.path.join(entities_path, "ally_red.png"), (28, 28)),
-            "enemy": self._load_image(os.path.join(entities_path, "enemy.png"), (28, 28)),
-            "health_pack": self._load_image(os.path.join(entities_path, "health_pack.png"), (28, 28)),
-            "coin": self._load_image(os.path.join(entities_path, "coin.png"), (28, 28)),
-            "wall": self._load_image(os.path.join(entities_path, "wall.png"), (30, 30)),
-        }
-
-        # Load UI icons (stat card size)
-        ui_path = os.path.join(self.icons_path, "ui")
-        self.ui_icons = {
-            "clock": self._load_image(os.path.join(ui_path, "icon_clock.png"), (20, 20)),
-            "heart": self._load_image(os.path.join(ui_path, "icon_heart.png"), (20, 20)),
-            "skull": self._load_image(os.path.join(ui_path, "icon_skull.png"), (20, 20)),
-            "gamepad": self._load_image(os.path.join(ui_path, "icon_gamepad.png"), (35, 35)),
-            "brain": self._load_image(os.path.join(ui_path, "icon_brain.png"), (20, 20)),
-            "star": self._load_image(os.path.join(ui_path, "icon_star.png"), (18, 18)),
-            "restart": self._load_image(os.path.join(ui_path, "icon_restart.png"), (18, 18)),
-        }
-
-        # Load legend icons (small size for sidebar)
-        legend_path = os.path.join(self.icons_path, "legend")
-        self.legend_icons = {
-            "player_blue": self._load_image(os.path.join(legend_path, "player_blue.png"), (16, 16)),
-            "player_red": self._load_image(os.path.join(legend_path, "player_red.png"), (16, 16)),
-            "ally_blue": self._load_image(os.path.join(legend_path, "ally_blue.png"), (16, 16)),
-            "ally_red": self._load_image(os.path.join(legend_path, "ally_red.png"), (16, 16)),
-            "enemy": self._load_image(os.path.join(legend_path, "enemy.png"), (16, 16)),
-            "health_pack": self._load_image(os.path.join(legend_path, "health_pack.png"), (16, 16)),
-            "coin": self._load_image(os.path.join(legend_path, "coin.png"), (16, 16)),
-            "wall": self._load_image(os.path.join(legend_path, "wall.png"), (16, 16)),
-        }
+        for entry in entries:
+            self._group(entry["group"])[entry["name"]] = atlas.subsurface(entry["rect"])
+        return True
 
     def get_entity(self, name):
         """Get an entity image by name."""
@@ -104,8 +158,9 @@ def get_assets():
     """Get the global asset loader instance."""
     global _asset_loader
     if _asset_loader is None:
-        # Initialize pygame if not already done
-        if not pygame.get_init():
-            pygame.init()
+        # Images are converted to the display format; no other pygame
+        # subsystem (audio, joystick) is needed to load them
+        if not pygame.display.get_init():
+            pygame.display.init()
         _asset_loader = AssetLoader()
     return _asset_loader
@@ -0,0 +1,875 @@
+"""
+Batched simulation engine for the AI vs AI Survival Arena
+Plays many games in lockstep as NumPy arrays with a leading game dimension,
+following the rules of SurvivalArenaGame.execute_turn: fuzzy player
+decisions, minimax enemies, flow-field or greedy movement, collisions,
+resource spawns and the game-over checks
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by the batch engine
+    np = None
+
+from ai.fuzzy_logic import DISTANCE_SCALE
+from ai.profiles import DEFAULT_PROFILE
+from config import DEFAULT_CONFIG
+
+# 4-directional movement, same order as AStarPathfinder.get_neighbors
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+# Player actions in the order FuzzyLogic.apply_fuzzy_rules breaks ties in
+ACTION_ORDER = (
+    "FLEE_ENEMY", "SEEK_HEALTH", "COLLECT_COINS", "AGGRESSIVE_PLAY", "DEFENSIVE_PLAY",
+    "COLLECT_RESOURCES",
+)
+FLEE, SEEK_HEALTH, COLLECT_COINS, AGGRESSIVE, DEFENSIVE, COLLECT = range(len(ACTION_ORDER))
+
+# How A*-driven agents move: "flow" steps along a breadth-first distance
+# field (a shortest path, like A*, with other tie-breaking); "greedy" takes
+# AStarPathfinder.greedy_step, which can get stuck behind walls
+MOVEMENT_MODES = ("flow", "greedy")
+
+# Why a game ended, as stored in the "reason" result array
+REASONS = ("score", "survival", "eliminated", "turn_limit")
+
+# Resource types of the resource slots
+HEALTH, COIN = 0, 1
+
+# Games simulated together by simulate_batch (bounds the memory of one batch)
+DEFAULT_CHUNK = 4096
+
+# Enemy searches evaluated together (a depth-3 search has 64 leaves each)
+SEARCH_CHUNK = 4096
+
+# Game length bins compared by compare_outcomes (last bin: that many turns or more)
+TURN_BINS = (0, 6, 9, 12, 15, 20, 30, 50)
+
+_UNREACHABLE = 1 << 20
+
+# Per-game state arrays of a BatchArena, with the game as the leading axis
+_STATE = (
+    "walls", "players", "allies", "enemies", "player_health", "player_score", "alive",
+    "turn", "index", "resources", "resource_active", "resource_order", "_spawned",
+)
+
+
+def _offsets():
+    """Cell offsets in the order SurvivalArenaGame._find_free_position tries them."""
+    offsets = [(0, 0)]
+    for radius in range(1, 5):
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                offsets.append((dx, dy))
+    return offsets
+
+
+def _triangle(value, left, peak, right):
+    """FuzzyLogic.triangular_membership over an array."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rising = (value - left) / (peak - left)
+        falling = (right - value) / (right - peak)
+    out = np.where(value < peak, rising, falling)
+    out = np.where(value == peak, 1.0, out)
+    return np.where((value < left) | (value > right), 0.0, out)
+
+
+def _trapezoid(value, left, left_peak, right_peak, right):
+    """FuzzyLogic.trapezoidal_membership over an array."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rising = (value - left) / (left_peak - left)
+        falling = (right - value) / (right - right_peak)
+    out = np.where(value < left_peak, rising, falling)
+    out = np.where((left_peak <= value) & (value <= right_peak), 1.0, out)
+    return np.where((value < left) | (value > right), 0.0, out)
+
+
+def fuzzy_actions(health, score, enemy_distance, rules, max_health, win_score, grid_size=DISTANCE_SCALE):
+    """
+    FuzzyLogic.apply_fuzzy_rules for arrays of players.
+
+    Returns:
+        Array of indices into ACTION_ORDER
+    """
+    health = health * 100 / max_health
+    score = (score / win_score) * 100
+    enemy_distance = enemy_distance * DISTANCE_SCALE / grid_size
+    low = _trapezoid(health, *rules.health_low)
+    medium = _triangle(health, *rules.health_medium)
+    high = _trapezoid(health, *rules.health_high)
+    score_low = _trapezoid(score, *rules.score_low)
+    score_high = _trapezoid(score, *rules.score_high)
+    near = _trapezoid(enemy_distance, *rules.distance_near)
+    middle = _triangle(enemy_distance, *rules.distance_medium)
+    far = np.where(
+        enemy_distance >= rules.distance_far[2], 1.0, _trapezoid(enemy_distance, *rules.distance_far)
+    )
+    weights = rules.weights
+
+    strengths = np.stack([
+        np.minimum(low, near) * weights[0],
+        np.minimum(low, far) * weights[1],
+        np.minimum(high, score_low) * weights[2],
+        np.minimum(high, score_high) * weights[3],
+        np.maximum(medium * weights[4], np.minimum(near, medium) * weights[7]),
+        np.maximum(np.minimum(low, middle) * weights[5], np.minimum(medium, score_low) * weights[6]),
+    ], axis=-1)
+    # Every rule starts from 0 and the first strongest action wins, as in the dict
+    return np.argmax(np.maximum(strengths, 0.0), axis=-1)
+
+
+class BatchArena:
+    """
+    A batch of games stepped together, turn by turn.
+
+    Every entity is a row of an array with the game as the leading axis
+    (players, allies, enemies and a fixed set of resource slots: the first
+    max_health_packs hold health packs, the rest coins). Grids are indexed
+    [game, x, y]. Each phase of execute_turn runs over all games at once;
+    within a phase the same ordering rules apply (player 1 moves before
+    player 2, player 1 wins a shared resource, the first ally on a resource
+    collects it, ties go to the earliest spawned resource). Enemy moves are
+    an exact vectorized minimax. Finished games are dropped from the arrays
+    after every turn and their results kept by original game index.
+
+    The games use one NumPy random stream, so they are not the same games
+    the reference engine plays for a given seed; they are meant to match
+    its outcome distributions (see compare_outcomes).
+
+    Controlled players skip their fuzzy AI and take the (dx, dy) moves
+    passed to step() or play_turn(), as SurvivalArenaGame.execute_turn(moves)
+    applies them. play_turn() keeps finished games in place so a caller can
+    read their final state and then remove() or restart() them.
+    """
+
+    def __init__(self, num_games, config=None, profiles=None, movement="flow", seed=None, controlled=()):
+        """
+        Set up a batch of new games.
+
+        Args:
+            num_games: number of games
+            config: GameConfig of every game
+            profiles: (player 1, player 2) AIProfile pair
+            movement: "flow" or "greedy" for the moves SurvivalArenaGame makes with A*
+            seed: seed (or NumPy Generator) of the batch's random stream
+            controlled: player indices (0 = Blue, 1 = Red) moved by the
+                caller instead of the built-in AI
+        """
+        if np is None:
+            raise ImportError("The batch simulation engine requires NumPy")
+        if movement not in MOVEMENT_MODES:
+            raise ValueError(f"movement must be one of {', '.join(MOVEMENT_MODES)}")
+        if any(p not in (0, 1) for p in controlled):
+            raise ValueError("controlled must list player indices 0 and/or 1")
+
+        self.config = config if config is not None else DEFAULT_CONFIG
+        self.profiles = tuple(profiles) if profiles is not None else (DEFAULT_PROFILE, DEFAULT_PROFILE)
+        self.movement = movement
+        self.controlled = tuple(controlled)
+        self.rng = np.random.default_rng(seed)
+        self.num_games = num_games
+
+        self._directions = np.array(DIRECTIONS)
+        self._offsets = np.array(_offsets())
+        self._ally_owner = np.array([0, 0, 1, 1])
+        config = self.config
+        self._resource_type = np.array([HEALTH] * config.max_health_packs + [COIN] * config.max_coins)
+
+        # Results by original game index
+        self.winner = np.full(num_games, -1, np.int8)
+        self.reason = np.zeros(num_games, np.int8)
+        self.turns = np.zeros(num_games, np.int32)
+        self.score = np.zeros((num_games, 2), np.int32)
+        self.health = np.zeros((num_games, 2), np.int32)
+
+        self._setup()
+
+    # Helpers
+
+    def _free(self, cells, games):
+        """Whether cells (..., 2) are on the grid and not walls of the given games."""
+        size = self.config.grid_size
+        x, y = cells[..., 0], cells[..., 1]
+        inside = (x >= 0) & (x < size) & (y >= 0) & (y < size)
+        return inside & ~self.walls[games, np.clip(x, 0, size - 1), np.clip(y, 0, size - 1)]
+
+    def _find_free(self, preferred, blocked):
+        """
+        SurvivalArenaGame._find_free_position for every game.
+
+        Args:
+            preferred: (N, 2) preferred cells
+            blocked: (N, size, size) walls and occupied cells
+
+        Returns:
+            (N, 2) cells
+        """
+        size = self.config.grid_size
+        games = np.arange(len(preferred))
+        cells = preferred[:, None, :] + self._offsets
+        x, y = cells[..., 0], cells[..., 1]
+        inside = (x >= 0) & (x < size) & (y >= 0) & (y < size)
+        ok = inside & ~blocked[games[:, None], np.clip(x, 0, size - 1), np.clip(y, 0, size - 1)]
+        found = cells[games, np.argmax(ok, axis=1)]
+
+        # Fallback: the first free cell scanning x, then y; the preferred cell if none
+        missing = ~ok.any(axis=1)
+        if missing.any():
+            free = ~blocked[missing].reshape(int(missing.sum()), size * size)
+            first = np.argmax(free, axis=1)
+            fallback = np.stack([first // size, first % size], axis=1)
+            found[missing] = np.where(free.any(axis=1)[:, None], fallback, preferred[missing])
+        return found
+
+    def _occupancy(self):
+        """Walls plus every entity cell, as blocked by the resource spawner."""
+        games = np.arange(len(self.walls))
+        blocked = self.walls.copy()
+        for positions in (self.players, self.allies, self.enemies):
+            if positions.shape[1]:
+                blocked[games[:, None], positions[..., 0], positions[..., 1]] = True
+        live = np.nonzero(self.resource_active)
+        cells = self.resources[live]
+        blocked[live[0], cells[:, 0], cells[:, 1]] = True
+        return blocked
+
+    def _spawn(self, slot_mask, blocked, resource_type):
+        """Place one resource of a type in each game of slot_mask (the first free slot)."""
+        size = self.config.grid_size
+        games = np.flatnonzero(slot_mask)
+        preferred = self.rng.integers(0, size, (len(slot_mask), 2))[games]
+        cells = self._find_free(preferred, blocked[games])
+        free_slots = ~self.resource_active[games] & (self._resource_type == resource_type)
+        slots = np.argmax(free_slots, axis=1)
+        self.resources[games, slots] = cells
+        self.resource_active[games, slots] = True
+        self.resource_order[games, slots] = self._spawned[games]
+        self._spawned[games] += 1
+        blocked[games, cells[:, 0], cells[:, 1]] = True
+
+    # Setup
+
+    def _setup(self):
+        """SurvivalArenaGame.setup_game for every game."""
+        config = self.config
+        size = config.grid_size
+        count = self.num_games
+        games = np.arange(count)
+
+        # Obstacles: distinct uniformly random cells
+        keys = self.rng.random((count, size * size))
+        cells = np.argpartition(keys, config.max_obstacles, axis=1)[:, :config.max_obstacles]
+        self.walls = np.zeros((count, size, size), bool)
+        self.walls[games[:, None], cells // size, cells % size] = True
+
+        blocked = self.walls.copy()
+
+        def place(preferred):
+            cell = self._find_free(np.broadcast_to(np.array(preferred), (count, 2)).copy(), blocked)
+            blocked[games, cell[:, 0], cell[:, 1]] = True
+            return cell
+
+        # Player 1 only avoids walls; everything after it avoids the cells taken so far
+        player1 = place((2, 2))
+        player2 = place((size - 3, size - 3))
+        self.players = np.stack([player1, player2], axis=1)
+        self.allies = np.stack([
+            place((1, 2)), place((2, 1)), place((size - 2, size - 3)), place((size - 3, size - 2)),
+        ], axis=1)
+        enemies = [place((size // 2, size // 2)) for _ in range(config.max_enemies)]
+        self.enemies = np.stack(enemies, axis=1) if enemies else np.zeros((count, 0, 2), np.int64)
+
+        self.player_health = np.full((count, 2), config.max_health, np.int64)
+        self.player_score = np.zeros((count, 2), np.int64)
+        self.alive = np.ones((count, 2), bool)
+        self.turn = np.zeros(count, np.int64)
+        self.index = games
+
+        slots = len(self._resource_type)
+        self.resources = np.zeros((count, slots, 2), np.int64)
+        self.resource_active = np.zeros((count, slots), bool)
+        self.resource_order = np.zeros((count, slots), np.int64)
+        self._spawned = np.zeros(count, np.int64)
+
+        # Initial resources: every health pack, then every coin
+        all_games = np.ones(count, bool)
+        for _ in range(config.max_health_packs):
+            self._spawn(all_games, blocked, HEALTH)
+        for _ in range(config.max_coins):
+            self._spawn(all_games, blocked, COIN)
+
+    # Queries
+
+    def _nearest_resource(self, positions, games, resource_type=None):
+        """
+        Nearest live resource of the given games to each position (the
+        earliest spawned on ties, as the resource list order decides).
+
+        Returns:
+            Tuple of ((M, 2) cells, (M,) found flags)
+        """
+        resources = self.resources[games]
+        live = self.resource_active[games]
+        if resource_type is not None:
+            live = live & (self._resource_type == resource_type)
+        distance = np.abs(resources - positions[:, None, :]).sum(axis=-1)
+        key = np.where(live, distance * 4096 + self.resource_order[games], np.iinfo(np.int64).max)
+        slot = np.argmin(key, axis=1)
+        return resources[np.arange(len(games)), slot], live.any(axis=1)
+
+    def _flee_targets(self, positions, games):
+        """SurvivalArenaGame._get_flee_position for arrays of players."""
+        size = self.config.grid_size
+        if self.enemies.shape[1] == 0:
+            return positions.copy()
+
+        enemies = self.enemies[games]
+        rows = np.arange(len(games))
+        distance = np.abs(enemies - positions[:, None, :]).sum(axis=-1)
+        nearest = enemies[rows, np.argmin(distance, axis=1)]
+        dx = positions[:, 0] - nearest[:, 0]
+        dy = positions[:, 1] - nearest[:, 1]
+
+        along_x = np.abs(dx) > np.abs(dy)
+        step = np.stack([
+            np.where(along_x, np.sign(dx), 0),
+            np.where(along_x, 0, np.where(dy > 0, 1, -1)),
+        ], axis=1)
+        targets = np.clip(positions + step * 4, 0, size - 1)
+
+        # On an enemy's cell: the open direction farthest from every enemy
+        same = np.flatnonzero((dx == 0) & (dy == 0))
+        if len(same):
+            tests = np.clip(positions[same, None, :] + self._directions * 4, 0, size - 1)
+            spread = np.abs(tests[:, :, None, :] - enemies[same, None, :, :]).sum(axis=-1).min(axis=-1)
+            open_cell = ~self.walls[games[same, None], tests[..., 0], tests[..., 1]]
+            best = np.argmax(np.where(open_cell, spread, -1), axis=1)
+            targets[same] = np.where(
+                open_cell.any(axis=1)[:, None], tests[np.arange(len(same)), best], positions[same]
+            )
+        return targets
+
+    # Movement
+
+    def _greedy_steps(self, starts, goals, games):
+        """AStarPathfinder.greedy_step for arrays of agents."""
+        neighbors = starts[:, None, :] + self._directions
+        distance = np.abs(neighbors - goals[:, None, :]).sum(axis=-1)
+        distance = np.where(self._free(neighbors, games[:, None]), distance, _UNREACHABLE)
+        best = np.argmin(distance, axis=1)
+        closer = distance[np.arange(len(starts)), best] < np.abs(starts - goals).sum(axis=1)
+        return np.where(closer[:, None], neighbors[np.arange(len(starts)), best], starts)
+
+    def _flow_steps(self, starts, goals, games):
+        """
+        One step along a shortest path to each goal (A*'s next move).
+
+        Grows a breadth-first frontier from every goal at once. When it
+        reaches an agent at distance d, the agent steps to its first neighbor
+        (in A*'s neighbor order) inside the distance d - 1 region; agents
+        that are reached or whose frontier stops growing leave the batch.
+        """
+        size = self.config.grid_size
+        moves = starts.copy()
+        rows = np.flatnonzero((starts != goals).any(axis=1))
+        if len(rows) == 0:
+            return moves
+
+        open_cells = np.zeros((len(rows), size + 2, size + 2), bool)
+        open_cells[:, 1:-1, 1:-1] = ~self.walls[games[rows]]
+        reached = np.zeros_like(open_cells)
+        gx, gy = goals[rows, 0] + 1, goals[rows, 1] + 1
+        index = np.arange(len(rows))
+        reached[index, gx, gy] = open_cells[index, gx, gy]
+        sx, sy = starts[rows, 0] + 1, starts[rows, 1] + 1
+        neighbors = starts[rows, None, :] + self._directions + 1
+
+        while len(rows):
+            grown = reached.copy()
+            grown[:, 1:-1, 1:-1] |= (
+                reached[:, :-2, 1:-1] | reached[:, 2:, 1:-1] | reached[:, 1:-1, :-2] | reached[:, 1:-1, 2:]
+            )
+            grown &= open_cells
+            index = np.arange(len(rows))
+            arrived = grown[index, sx, sy]
+            if arrived.any():
+                at = np.flatnonzero(arrived)
+                inside = reached[at[:, None], neighbors[at, :, 0], neighbors[at, :, 1]]
+                moves[rows[at]] = neighbors[at, np.argmax(inside, axis=1)] - 1
+            stuck = (grown == reached).all(axis=(1, 2))
+            keep = ~(arrived | stuck)
+            if not keep.all():
+                rows, sx, sy, neighbors = rows[keep], sx[keep], sy[keep], neighbors[keep]
+                grown, open_cells = grown[keep], open_cells[keep]
+            reached = grown
+        return moves
+
+    def _path_steps(self, starts, goals, games, mode=None):
+        """Next cells toward goals with the batch's movement mode (or another)."""
+        if (mode or self.movement) == "greedy":
+            return self._greedy_steps(starts, goals, games)
+        return self._flow_steps(starts, goals, games)
+
+    # Minimax
+
+    def _enemy_options(self, positions, games):
+        """MinimaxAI.get_valid_moves for arrays: (..., 4, 2) moves and their validity."""
+        moves = positions[..., None, :] + self._directions
+        valid = self._free(moves, games[..., None])
+        stuck = ~valid.any(axis=-1)
+        if stuck.any():
+            moves[stuck, 0] = positions[stuck]
+            valid[stuck, 0] = True
+        return moves, valid
+
+    def _player_options(self, positions, games):
+        """The first two of a player's valid moves, as the minimax players' nodes sample them."""
+        moves, valid = self._enemy_options(positions, games)
+        order = np.argsort(~valid, axis=-1, kind="stable")[..., :2]
+        return (
+            np.take_along_axis(moves, order[..., None], axis=-2),
+            np.take_along_axis(valid, order, axis=-1),
+        )
+
+    def _search(self, enemy, player1, player2, health1, health2, games, depth, maximizing):
+        """
+        Minimax value of enemy searches.
+
+        Every node adds trailing axes for its moves: the enemy's four moves
+        at max nodes and the 2 x 2 player move pairs at min nodes. Inputs
+        only get real axes where they vary (size 1 elsewhere), so move lists
+        are computed once for all the sibling nodes sharing them and arrays
+        broadcast to the full tree only at the leaves.
+        """
+        if depth == 0:
+            score1 = -np.abs(enemy - player1).sum(axis=-1) + (100 - health1) / 10
+            score2 = -np.abs(enemy - player2).sum(axis=-1) + (100 - health2) / 10
+            return np.maximum(score1, score2)
+
+        if maximizing:
+            moves, valid = self._enemy_options(enemy, games)
+            values = self._search(
+                moves, player1[..., None, :], player2[..., None, :],
+                health1[..., None], health2[..., None], games[..., None], depth - 1, False,
+            )
+            return np.where(valid, values, -np.inf).max(axis=-1)
+
+        moves1, valid1 = self._player_options(player1, games)
+        moves2, valid2 = self._player_options(player2, games)
+        values = self._search(
+            enemy[..., None, None, :], moves1[..., :, None, :], moves2[..., None, :, :],
+            health1[..., None, None], health2[..., None, None], games[..., None, None], depth - 1, True,
+        )
+        valid = valid1[..., :, None] & valid2[..., None, :]
+        return np.where(valid, values, np.inf).min(axis=(-2, -1))
+
+    def _minimax_moves(self, enemies, games):
+        """MinimaxAI.choose_target_and_move's move for (M, 2) enemies of the given games."""
+        depth = self.config.minimax_depth
+        if depth <= 0 or len(enemies) == 0:
+            return enemies.copy()
+
+        moves = np.empty_like(enemies)
+        for start in range(0, len(enemies), SEARCH_CHUNK):
+            part = slice(start, start + SEARCH_CHUNK)
+            game = games[part]
+            options, valid = self._enemy_options(enemies[part], game)
+            values = self._search(
+                options, self.players[game, None, 0], self.players[game, None, 1],
+                self.player_health[game, None, 0], self.player_health[game, None, 1],
+                game[:, None], depth - 1, False,
+            )
+            # The first best move in neighbor order, as the strict > in minimax picks it
+            best = np.argmax(np.where(valid, values, -np.inf), axis=1)
+            moves[part] = options[np.arange(len(game)), best]
+        return moves
+
+    # Turn phases
+
+    def _update_player(self, player):
+        """SurvivalArenaGame._update_player for one side of every game."""
+        config = self.config
+        profile = self.profiles[player]
+        games = np.flatnonzero(self.alive[:, player])
+        if len(games) == 0:
+            return
+        positions = self.players[games, player]
+
+        if self.enemies.shape[1]:
+            enemy_distance = np.abs(self.enemies[games] - positions[:, None, :]).sum(axis=-1).min(axis=1)
+        else:
+            enemy_distance = np.full(len(games), config.grid_size)
+        action = fuzzy_actions(
+            self.player_health[games, player], self.player_score[games, player], enemy_distance,
+            profile.rules, config.max_health, config.win_score, config.grid_size,
+        )
+
+        # Targets by action; resource seekers stay put when there is none
+        targets = positions.copy()
+        for code, resource_type in (
+            (SEEK_HEALTH, HEALTH), (COLLECT_COINS, COIN), (COLLECT, None), (DEFENSIVE, None)
+        ):
+            chosen = np.flatnonzero(action == code)
+            if len(chosen):
+                cells, found = self._nearest_resource(positions[chosen], games[chosen], resource_type)
+                targets[chosen[found]] = cells[found]
+        chosen = np.flatnonzero(action == FLEE)
+        if len(chosen):
+            targets[chosen] = self._flee_targets(positions[chosen], games[chosen])
+        chosen = action == AGGRESSIVE
+        targets[chosen] = self.players[games[chosen], 1 - player]
+
+        mode = "greedy" if profile.pathfinder == "greedy" else None
+        self.players[games, player] = self._path_steps(positions, targets, games, mode)
+
+    def _move_player(self, player, moves):
+        """Apply (N, 2) external moves to one side; moves off the grid or into a wall stay put."""
+        games = np.flatnonzero(self.alive[:, player])
+        cells = self.players[games, player] + moves[games]
+        free = self._free(cells, games)
+        self.players[games[free], player] = cells[free]
+
+    def _update_allies(self):
+        """SurvivalArenaGame._update_allies: every ally steps toward its nearest resource."""
+        count = len(self.allies)
+        games = np.repeat(np.arange(count), 4)
+        positions = self.allies.reshape(-1, 2).copy()
+        cells, found = self._nearest_resource(positions, games)
+        positions[found] = self._path_steps(positions[found], cells[found], games[found])
+        self.allies = positions.reshape(count, 4, 2)
+
+    def _update_enemies(self):
+        """SurvivalArenaGame._update_enemies: minimax while both players live, else a chase."""
+        count, enemies = self.enemies.shape[:2]
+        if enemies == 0:
+            return
+        games = np.repeat(np.arange(count), enemies)
+        positions = self.enemies.reshape(-1, 2).copy()
+
+        both = np.repeat(self.alive.all(axis=1), enemies)
+        positions[both] = self._minimax_moves(positions[both], games[both])
+        for player in (0, 1):
+            chase = np.repeat(self.alive[:, player] & ~self.alive[:, 1 - player], enemies)
+            if chase.any():
+                target = self.players[games[chase], player]
+                positions[chase] = self._path_steps(positions[chase], target, games[chase])
+        self.enemies = positions.reshape(count, enemies, 2)
+
+    def _collect(self, games, slots, player):
+        """Resource.collect for arrays of (game, slot) pairs and collecting sides."""
+        config = self.config
+        self.resource_active[games, slots] = False
+        is_health = self._resource_type[slots] == HEALTH
+        heal = games[is_health], player[is_health]
+        self.player_health[heal] = np.minimum(
+            config.max_health, self.player_health[heal] + config.health_pack_restore
+        )
+        np.add.at(self.player_score, (games[~is_health], player[~is_health]), config.coin_value)
+
+    def _check_collisions(self):
+        """SurvivalArenaGame._check_collisions for every game."""
+        config = self.config
+
+        # Player-enemy collisions
+        if self.enemies.shape[1]:
+            hits = (self.enemies[:, None, :, :] == self.players[:, :, None, :]).all(axis=-1).sum(axis=-1)
+            damaged = self.alive & (hits > 0)
+            self.player_health = np.where(
+                damaged, np.maximum(0, self.player_health - hits * config.enemy_damage), self.player_health
+            )
+            self.alive &= self.player_health > 0
+
+        # Player-resource collisions (player 1 first on a shared cell)
+        on = (self.resources[:, None, :, :] == self.players[:, :, None, :]).all(axis=-1)
+        on &= self.resource_active[:, None, :] & self.alive[:, :, None]
+        taker = np.where(on[:, 0], 0, np.where(on[:, 1], 1, -1))
+        game, slot = np.nonzero(taker >= 0)
+        self._collect(game, slot, taker[game, slot])
+
+        # Ally-resource collisions, ally by ally
+        for ally, owner in enumerate(self._ally_owner):
+            on = (self.resources == self.allies[:, None, ally, :]).all(axis=-1) & self.resource_active
+            game, slot = np.nonzero(on)
+            self._collect(game, slot, np.full(len(game), owner))
+
+        # Player-player collision
+        bump = self.alive.all(axis=1) & (self.players[:, 0] == self.players[:, 1]).all(axis=1)
+        self.player_health[bump] = np.maximum(0, self.player_health[bump] - config.player_collision_damage)
+        self.alive[bump] = self.player_health[bump] > 0
+
+    def _try_spawn(self):
+        """SurvivalArenaGame._try_spawn_new_resources for every game."""
+        config = self.config
+        for resource_type, limit in ((HEALTH, config.max_health_packs), (COIN, config.max_coins)):
+            roll = self.rng.random(len(self.players)) < config.resource_spawn_chance
+            live = (self.resource_active & (self._resource_type == resource_type)).sum(axis=1)
+            spawn = roll & (live < limit)
+            if spawn.any():
+                self._spawn(spawn, self._occupancy(), resource_type)
+
+    def _check_game_over(self):
+        """
+        SurvivalArenaGame.check_game_over: record finished games.
+
+        Returns:
+            Boolean array of the games that ended this turn
+        """
+        config = self.config
+        score = self.player_score
+        alive = self.alive
+        winner = np.full(len(score), -1)
+        reason = np.full(len(score), -1)
+
+        def decide(condition, side, code):
+            undecided = condition & (reason < 0)
+            winner[undecided] = side
+            reason[undecided] = code
+
+        decide(score[:, 0] >= config.win_score, 0, 0)
+        decide(score[:, 1] >= config.win_score, 1, 0)
+        decide(~alive[:, 0] & alive[:, 1], 1, 1)
+        decide(~alive[:, 1] & alive[:, 0], 0, 1)
+        decide(~alive[:, 0] & ~alive[:, 1], -1, 2)
+        at_limit = self.turn >= config.max_turns
+        decide(at_limit & (score[:, 0] > score[:, 1]), 0, 3)
+        decide(at_limit & (score[:, 1] > score[:, 0]), 1, 3)
+        decide(at_limit, -1, 3)
+
+        ended = reason >= 0
+        done = self.index[ended]
+        self.winner[done] = winner[ended]
+        self.reason[done] = reason[ended]
+        self.turns[done] = self.turn[ended]
+        self.score[done] = score[ended]
+        self.health[done] = self.player_health[ended]
+        return ended
+
+    def _drop(self, keep):
+        """Remove finished games from the state arrays."""
+        for name in _STATE:
+            setattr(self, name, getattr(self, name)[keep])
+
+    def remove(self, rows):
+        """Drop the games in the given rows (a boolean mask or row indices)."""
+        keep = np.ones(self.active, bool)
+        keep[rows] = False
+        self._drop(keep)
+
+    def restart(self, rows):
+        """
+        Replace the games in the given rows with new games, in place.
+
+        The new games are drawn from the batch's random stream and keep the
+        rows' game indices, so their results overwrite the old ones.
+        """
+        rows = np.flatnonzero(rows) if np.asarray(rows).dtype == bool else np.asarray(rows)
+        if len(rows) == 0:
+            return
+        fresh = BatchArena(len(rows), self.config, self.profiles, self.movement, self.rng, self.controlled)
+        for name in _STATE:
+            if name != "index":
+                getattr(self, name)[rows] = getattr(fresh, name)
+
+    @property
+    def active(self):
+        """Number of games still being played."""
+        return len(self.index)
+
+    def play_turn(self, moves=None):
+        """
+        Play one turn of every game in the batch, keeping finished games.
+
+        Args:
+            moves: (active games, controlled players, 2) array of (dx, dy)
+                steps, in the order of the controlled players
+
+        Returns:
+            Boolean array of the rows whose game ended this turn
+        """
+        for player in (0, 1):
+            if player in self.controlled:
+                self._move_player(player, np.asarray(moves)[:, self.controlled.index(player)])
+            else:
+                self._update_player(player)
+        self._update_allies()
+        self._update_enemies()
+        self._check_collisions()
+        self._try_spawn()
+        self.turn += 1
+        return self._check_game_over()
+
+    def step(self, moves=None):
+        """Play one turn of every unfinished game (moves as in play_turn)."""
+        if self.active == 0:
+            return
+        ended = self.play_turn(moves)
+        if ended.any():
+            self._drop(~ended)
+
+    def run(self):
+        """
+        Play every game to the end.
+
+        Returns:
+            Dict of result arrays by game: "winner" (0 = Blue, 1 = Red,
+            -1 = draw), "reason" (index into REASONS), "turns", "score"
+            and "health" ((games, 2) final values)
+        """
+        while self.active:
+            self.step()
+        return {
+            "winner": self.winner, "reason": self.reason, "turns": self.turns,
+            "score": self.score, "health": self.health,
+        }
+
+
+def simulate_batch(num_games, config=None, profiles=None, movement="flow", seed=None, chunk=DEFAULT_CHUNK):
+    """
+    Play games on the batch engine, chunk by chunk.
+
+    Args:
+        num_games: number of games
+        config: GameConfig of every game
+        profiles: (player 1, player 2) AIProfile pair
+        movement: "flow" or "greedy"
+        seed: seed of the random streams (each chunk gets its own)
+        chunk: games simulated together
+
+    Returns:
+        BatchArena.run() result dict covering every game
+    """
+    if np is None:
+        raise ImportError("The batch simulation engine requires NumPy")
+    seeds = np.random.SeedSequence(seed).spawn(max(1, -(-num_games // chunk)))
+    parts = [
+        BatchArena(min(chunk, num_games - start), config, profiles, movement, seeds[i]).run()
+        for i, start in enumerate(range(0, num_games, chunk))
+    ]
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def reference_results(num_games, config=None, profiles=None, seed=0):
+    """
+    Play games on SurvivalArenaGame, in the result format of BatchArena.run().
+
+    Game i uses seed + i.
+    """
+    from game import SurvivalArenaGame
+
+    reasons = {"wins by score!": 0, "wins by survival!": 1, "eliminated!": 2, "turns!": 3}
+    results = {
+        "winner": np.full(num_games, -1, np.int8), "reason": np.zeros(num_games, np.int8),
+        "turns": np.zeros(num_games, np.int32), "score": np.zeros((num_games, 2), np.int32),
+        "health": np.zeros((num_games, 2), np.int32),
+    }
+    for i in range(num_games):
+        game = SurvivalArenaGame(config=config, seed=seed + i, profiles=profiles)
+        while game.is_active():
+            game.execute_turn()
+        if game.winner is not None:
+            results["winner"][i] = 0 if game.winner is game.player1 else 1
+        results["reason"][i] = next(
+            code for ending, code in reasons.items() if game.game_over_reason.endswith(ending)
+        )
+        results["turns"][i] = game.turn_count
+        results["score"][i] = (game.player1.score, game.player2.score)
+        results["health"][i] = (game.player1.health, game.player2.health)
+    return results
+
+
+def _gamma_q(a, x):
+    """Regularized upper incomplete gamma function Q(a, x)."""
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        # Series for P(a, x)
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Continued fraction (modified Lentz)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def chi_square_homogeneity(counts_a, counts_b, min_expected=5):
+    """
+    Chi-square test that two samples of a categorical variable share one distribution.
+
+    Categories expected fewer than min_expected times in either sample are
+    pooled into one.
+
+    Args:
+        counts_a: category counts of the first sample
+        counts_b: counts of the same categories in the second sample
+
+    Returns:
+        Tuple of (statistic, degrees of freedom, p-value)
+    """
+    total_a, total_b = sum(counts_a), sum(counts_b)
+    total = total_a + total_b
+    kept, pooled = [], [0, 0]
+    for a, b in zip(counts_a, counts_b):
+        if min((a + b) * total_a / total, (a + b) * total_b / total) >= min_expected:
+            kept.append((a, b))
+        else:
+            pooled[0] += a
+            pooled[1] += b
+    if sum(pooled):
+        kept.append(tuple(pooled))
+    if len(kept) < 2:
+        return 0.0, 0, 1.0
+
+    statistic = 0.0
+    for a, b in kept:
+        expected_a = (a + b) * total_a / total
+        expected_b = (a + b) * total_b / total
+        statistic += (a - expected_a) ** 2 / expected_a + (b - expected_b) ** 2 / expected_b
+    df = len(kept) - 1
+    return statistic, df, _gamma_q(df / 2, statistic / 2)
+
+
+def compare_outcomes(reference, batch):
+    """
+    Compare the outcome distributions of two result dicts.
+
+    Tests the joint distribution of winner and game-over reason, and the
+    distribution of game lengths, with chi_square_homogeneity.
+
+    Returns:
+        Dict of test name -> (statistic, degrees of freedom, p-value)
+    """
+    def outcomes(results):
+        codes = (results["winner"].astype(int) + 1) * len(REASONS) + results["reason"]
+        return np.bincount(codes, minlength=3 * len(REASONS))
+
+    def lengths(results):
+        bins = np.searchsorted(TURN_BINS, results["turns"], side="right") - 1
+        return np.bincount(bins, minlength=len(TURN_BINS))
+
+    return {
+        "outcome": chi_square_homogeneity(outcomes(reference), outcomes(batch)),
+        "turns": chi_square_homogeneity(lengths(reference), lengths(batch)),
+    }
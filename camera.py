@@ -0,0 +1,156 @@
+"""
+Camera for the AI vs AI Survival Arena board
+Maps grid cells to pixels inside the fixed board area with pan and zoom,
+and finds the entities in view through a chunked spatial index
+"""
+
+from constants import CELL_SIZE
+
+# Largest zoom, in pixels per cell
+MAX_CELL_SIZE = CELL_SIZE * 2
+
+# Factor one zoom step scales the cell size by
+ZOOM_STEP = 1.25
+
+# Cells per side of a SpatialIndex bucket
+SPATIAL_CHUNK = 16
+
+
+class Camera:
+    """
+    Visible part of the grid and its scale.
+
+    The board is laid out at ``cell_size`` pixels per cell; ``left`` and
+    ``top`` are the board pixel shown at the top-left corner of the view.
+    A board smaller than the view sits in its top-left corner. The camera
+    can't zoom out past the size that fits the whole board (or one pixel
+    per cell, for boards that never fit).
+    """
+
+    def __init__(self, width, height):
+        """
+        Initialize a camera for a view of the given size.
+
+        Args:
+            width: view width in pixels
+            height: view height in pixels
+        """
+        self.width = width
+        self.height = height
+        self.grid_size = 0
+        self.cell_size = 1
+        self.min_cell_size = 1
+        self.left = 0
+        self.top = 0
+
+    @property
+    def board_size(self):
+        """Width (and height) of the whole board in pixels."""
+        return self.grid_size * self.cell_size
+
+    @property
+    def key(self):
+        """Hashable camera state, for caches of what it shows."""
+        return (self.grid_size, self.cell_size, self.left, self.top)
+
+    def fit(self, grid_size):
+        """Show the whole board at the largest cell size that fits (at most CELL_SIZE)."""
+        self.grid_size = grid_size
+        self.cell_size = max(1, min(CELL_SIZE, min(self.width, self.height) // grid_size))
+        self.min_cell_size = self.cell_size
+        self.left = 0
+        self.top = 0
+
+    def pan(self, dx, dy):
+        """Move the board by a number of pixels (positive = right/down)."""
+        self.left -= dx
+        self.top -= dy
+        self._clamp()
+
+    def zoom(self, steps, anchor=None):
+        """
+        Zoom in (positive steps) or out, keeping one view pixel in place.
+
+        Args:
+            steps: number of ZOOM_STEP factors to apply
+            anchor: (x, y) pixel in the view to zoom around (default: center)
+        """
+        cell_size = self.cell_size
+        for _ in range(abs(steps)):
+            if steps > 0:
+                cell_size = max(cell_size + 1, round(cell_size * ZOOM_STEP))
+            else:
+                cell_size = min(cell_size - 1, round(cell_size / ZOOM_STEP))
+        cell_size = max(self.min_cell_size, min(MAX_CELL_SIZE, cell_size))
+        if cell_size == self.cell_size:
+            return
+
+        anchor_x, anchor_y = anchor if anchor is not None else (self.width // 2, self.height // 2)
+        scale = cell_size / self.cell_size
+        self.left = round((self.left + anchor_x) * scale) - anchor_x
+        self.top = round((self.top + anchor_y) * scale) - anchor_y
+        self.cell_size = cell_size
+        self._clamp()
+
+    def _clamp(self):
+        """Keep the view on the board."""
+        self.left = max(0, min(self.left, self.board_size - self.width))
+        self.top = max(0, min(self.top, self.board_size - self.height))
+
+    def visible_cells(self, margin=0):
+        """
+        Get the range of cells in view.
+
+        Args:
+            margin: extra cells to include on every side
+
+        Returns:
+            Tuple of (x0, y0, x1, y1); cells x0 <= x < x1, y0 <= y < y1
+        """
+        cell = self.cell_size
+        grid_size = self.grid_size
+        return (
+            max(0, self.left // cell - margin),
+            max(0, self.top // cell - margin),
+            min(grid_size, -(-(self.left + self.width) // cell) + margin),
+            min(grid_size, -(-(self.top + self.height) // cell) + margin),
+        )
+
+
+class SpatialIndex:
+    """
+    Entities bucketed by square chunks of cells, for rectangle queries.
+
+    Built once per turn from an entity list; queries return list indices
+    in ascending order, so callers keep the list's drawing order.
+    """
+
+    def __init__(self, entities, chunk_size=SPATIAL_CHUNK):
+        """
+        Index a list of entities by position.
+
+        Args:
+            entities: sequence of objects with a ``position`` (x, y)
+            chunk_size: cells per side of a bucket
+        """
+        self.chunk_size = chunk_size
+        self._buckets = {}
+        for i, entity in enumerate(entities):
+            x, y = entity.position
+            self._buckets.setdefault((x // chunk_size, y // chunk_size), []).append((i, x, y))
+
+    def query(self, x0, y0, x1, y1):
+        """Indices of the entities with x0 <= x < x1 and y0 <= y < y1, ascending."""
+        if x0 >= x1 or y0 >= y1:
+            return []
+
+        chunk = self.chunk_size
+        buckets = self._buckets
+        found = []
+        for chunk_y in range(y0 // chunk, (y1 - 1) // chunk + 1):
+            for chunk_x in range(x0 // chunk, (x1 - 1) // chunk + 1):
+                bucket = buckets.get((chunk_x, chunk_y))
+                if bucket:
+                    found.extend(i for i, x, y in bucket if x0 <= x < x1 and y0 <= y < y1)
+        found.sort()
+        return found
@@ -0,0 +1,63 @@
+"""
+Per-game configuration for the AI vs AI Survival Arena
+Bundles the arena size, limits and rules so games with different settings
+can run side by side in one process
+"""
+
+from dataclasses import dataclass, replace
+
+from constants import (
+    GRID_SIZE,
+    MAX_HEALTH,
+    MAX_ENEMIES,
+    MAX_OBSTACLES,
+    MAX_HEALTH_PACKS,
+    MAX_COINS,
+    HEALTH_PACK_RESTORE,
+    COIN_VALUE,
+    RESOURCE_SPAWN_CHANCE,
+    WIN_SCORE,
+    MAX_TURNS,
+    ENEMY_DAMAGE,
+    PLAYER_COLLISION_DAMAGE,
+    MINIMAX_DEPTH,
+)
+
+
+@dataclass(frozen=True)
+class GameConfig:
+    """Arena parameters for one SurvivalArenaGame (defaults match constants.py)."""
+
+    # Arena
+    grid_size: int = GRID_SIZE
+    max_enemies: int = MAX_ENEMIES
+    max_obstacles: int = MAX_OBSTACLES
+    max_health_packs: int = MAX_HEALTH_PACKS
+    max_coins: int = MAX_COINS
+
+    # Rules
+    max_health: int = MAX_HEALTH
+    health_pack_restore: int = HEALTH_PACK_RESTORE
+    coin_value: int = COIN_VALUE
+    resource_spawn_chance: float = RESOURCE_SPAWN_CHANCE
+    win_score: int = WIN_SCORE
+    max_turns: int = MAX_TURNS
+    enemy_damage: int = ENEMY_DAMAGE
+    player_collision_damage: int = PLAYER_COLLISION_DAMAGE
+
+    # AI
+    minimax_depth: int = MINIMAX_DEPTH
+
+    def __post_init__(self):
+        """Validate the parameters."""
+        if self.grid_size < 6:
+            raise ValueError("grid_size must be at least 6 (players spawn 2 cells from the corners)")
+        if self.max_obstacles >= self.grid_size * self.grid_size // 2:
+            raise ValueError("max_obstacles must leave at least half of the grid free")
+
+    def with_changes(self, **changes):
+        """Return a copy of this config with some parameters replaced."""
+        return replace(self, **changes)
+
+
+DEFAULT_CONFIG = GameConfig()
@@ -5,7 +5,10 @@ WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 900
 GRID_SIZE = 20
 CELL_SIZE = 30  # pixels per cell
-FPS = 0.5  # Slower speed for better AI watching
+RENDER_FPS = 60  # Window redraw and input rate
+TURN_RATE = 0.5  # Simulated turns per second (slow for better AI watching)
+TURN_RATES = (0.5, 1, 2, 4, 8, 16, 32, None)  # UP/DOWN speed steps (None = unlimited)
+MOVE_ANIMATION_TIME = 0.25  # Seconds a sprite takes to slide into its new cell
 
 # Layout Settings
 GRID_WIDTH = 600  # Width of the game grid area
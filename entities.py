@@ -8,7 +8,12 @@ from constants import MAX_HEALTH, HEALTH_PACK_RESTORE, COIN_VALUE, ACTIONS
 class Player:
     """AI-controlled player entity."""
 
-    def __init__(self, position, team, color):
+    __slots__ = (
+        "position", "team", "color", "max_health", "health", "score",
+        "decision_state", "alive", "target_position",
+    )
+
+    def __init__(self, position, team, color, max_health=MAX_HEALTH):
         """
         Initialize a player.
 
@@ -16,11 +21,13 @@ class Player:
             position: (x, y) starting position
             team: "Blue" or "Red"
             color: RGB color tuple
+            max_health: starting and maximum health
         """
         self.position = position
         self.team = team
         self.color = color
-        self.health = MAX_HEALTH
+        self.max_health = max_health
+        self.health = max_health
         self.score = 0
         self.decision_state = ACTIONS["DEFENSIVE_PLAY"]
         self.alive = True
@@ -34,7 +41,7 @@ class Player:
 
     def heal(self, amount):
         """Heal the player."""
-        self.health = min(MAX_HEALTH, self.health + amount)
+        self.health = min(self.max_health, self.health + amount)
 
     def add_score(self, points):
         """Add points to the player's score."""
@@ -51,6 +58,8 @@ class Player:
 class Ally:
     """Ally bot that collects resources for its owner."""
 
+    __slots__ = ("position", "owner", "color", "target_resource")
+
     def __init__(self, position, owner, color):
         """
         Initialize an ally bot.
@@ -76,6 +85,8 @@ class Ally:
 class Enemy:
     """Enemy agent that attacks players."""
 
+    __slots__ = ("position", "color", "target_player", "target_position")
+
     def __init__(self, position, color):
         """
         Initialize an enemy.
@@ -100,6 +111,8 @@ class Enemy:
 class Resource:
     """Resource entity (health pack or coin)."""
 
+    __slots__ = ("position", "type", "color", "collected")
+
     def __init__(self, position, resource_type, color):
         """
         Initialize a resource.
@@ -114,12 +127,14 @@ class Resource:
         self.color = color
         self.collected = False
 
-    def collect(self, player):
+    def collect(self, player, health_restore=HEALTH_PACK_RESTORE, coin_value=COIN_VALUE):
         """
         Collect the resource.
 
         Args:
             player: Player object collecting the resource
+            health_restore: health restored by a health pack
+            coin_value: points awarded by a coin
 
         Returns:
             True if collected, False otherwise
@@ -128,9 +143,9 @@ class Resource:
             return False
 
         if self.type == "health":
-            player.heal(HEALTH_PACK_RESTORE)
+            player.heal(health_restore)
         elif self.type == "coin":
-            player.add_score(COIN_VALUE)
+            player.add_score(coin_value)
 
         self.collected = True
         return True
@@ -142,6 +157,8 @@ class Resource:
 class Obstacle:
     """Static obstacle that blocks movement."""
 
+    __slots__ = ("position", "color")
+
     def __init__(self, position, color):
         """
         Initialize an obstacle.
@@ -155,3 +172,55 @@ class Obstacle:
 
     def __repr__(self):
         return f"Obstacle(Pos:{self.position})"
+
+
+class EntityPool:
+    """Free list of entities that are re-initialized instead of reallocated."""
+
+    __slots__ = ("entity_class", "bound_args", "free")
+
+    def __init__(self, entity_class, *bound_args):
+        """
+        Initialize an empty pool.
+
+        Args:
+            entity_class: class of the pooled entities
+            bound_args: leading constructor arguments passed on every acquire
+        """
+        self.entity_class = entity_class
+        self.bound_args = bound_args
+        self.free = []
+
+    def acquire(self, *args):
+        """
+        Get an entity, reusing a released one when available.
+
+        Args:
+            args: constructor arguments for the entity class
+
+        Returns:
+            Freshly initialized entity
+        """
+        if self.free:
+            entity = self.free.pop()
+            entity.__init__(*self.bound_args, *args)
+            return entity
+        return self.entity_class(*self.bound_args, *args)
+
+    def release(self, entity):
+        """Return an entity to the pool."""
+        self.free.append(entity)
+
+    def release_all(self, entities):
+        """Return many entities to the pool."""
+        self.free.extend(entities)
+
+
+# Entity classes by pool name
+ENTITY_CLASSES = {
+    "player": Player,
+    "ally": Ally,
+    "enemy": Enemy,
+    "resource": Resource,
+    "obstacle": Obstacle,
+}
@@ -0,0 +1,337 @@
+"""
+Struct-of-arrays entity storage for the AI vs AI Survival Arena
+Keeps positions, health, owners, kinds and alive flags in NumPy arrays so
+distance and collision queries can run over every entity at once
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by this optional backend
+    np = None
+
+from constants import MAX_HEALTH
+from entities import Player, Ally, Enemy, Resource, Obstacle
+
+
+# Entity kinds stored in the "kind" array
+KIND_PLAYER = 0
+KIND_ALLY = 1
+KIND_ENEMY = 2
+KIND_HEALTH = 3
+KIND_COIN = 4
+KIND_OBSTACLE = 5
+
+RESOURCE_KINDS = {"health": KIND_HEALTH, "coin": KIND_COIN}
+RESOURCE_TYPES = {KIND_HEALTH: "health", KIND_COIN: "coin"}
+
+# Kind groups the game queries by name
+KIND_GROUPS = {
+    "player": (KIND_PLAYER,),
+    "ally": (KIND_ALLY,),
+    "enemy": (KIND_ENEMY,),
+    "health": (KIND_HEALTH,),
+    "coin": (KIND_COIN,),
+    "resource": (KIND_HEALTH, KIND_COIN),
+    "obstacle": (KIND_OBSTACLE,),
+}
+
+# Upper bound on temporary distance-matrix size for batched nearest queries
+_CHUNK_ELEMENTS = 1 << 20
+
+
+def _field(name, cast):
+    """Build a property that reads and writes one store array."""
+
+    def getter(self):
+        return cast(getattr(self._store, name)[self._index])
+
+    def setter(self, value):
+        getattr(self._store, name)[self._index] = value
+
+    return property(getter, setter)
+
+
+def _position_field():
+    """Build a property mapping an (x, y) tuple onto the x and y arrays."""
+
+    def getter(self):
+        store = self._store
+        return (int(store.x[self._index]), int(store.y[self._index]))
+
+    def setter(self, value):
+        self._store.x[self._index] = value[0]
+        self._store.y[self._index] = value[1]
+
+    return property(getter, setter)
+
+
+class PlayerView(Player):
+    """Player whose position, health and alive flag live in an EntityStore."""
+
+    __slots__ = ("_store", "_index")
+
+    position = _position_field()
+    health = _field("health", int)
+    alive = _field("alive", bool)
+
+    def __init__(self, store, position, team, color, max_health=MAX_HEALTH):
+        self._store = store
+        self._index = store.allocate(KIND_PLAYER, self)
+        super().__init__(position, team, color, max_health)
+
+
+class AllyView(Ally):
+    """Ally whose position and owner live in an EntityStore."""
+
+    __slots__ = ("_store", "_index")
+
+    position = _position_field()
+
+    def __init__(self, store, position, owner, color):
+        self._store = store
+        self._index = store.allocate(KIND_ALLY, self)
+        super().__init__(position, owner, color)
+
+    @property
+    def owner(self):
+        return self._store.views[self._store.owner[self._index]]
+
+    @owner.setter
+    def owner(self, player):
+        self._store.owner[self._index] = player._index
+
+
+class EnemyView(Enemy):
+    """Enemy whose position lives in an EntityStore."""
+
+    __slots__ = ("_store", "_index")
+
+    position = _position_field()
+
+    def __init__(self, store, position, color):
+        self._store = store
+        self._index = store.allocate(KIND_ENEMY, self)
+        super().__init__(position, color)
+
+
+class ResourceView(Resource):
+    """Resource whose position, type and collected flag live in an EntityStore."""
+
+    __slots__ = ("_store", "_index")
+
+    position = _position_field()
+
+    def __init__(self, store, position, resource_type, color):
+        self._store = store
+        self._index = store.allocate(RESOURCE_KINDS[resource_type], self)
+        super().__init__(position, resource_type, color)
+
+    @property
+    def type(self):
+        return RESOURCE_TYPES[int(self._store.kind[self._index])]
+
+    @type.setter
+    def type(self, resource_type):
+        self._store.kind[self._index] = RESOURCE_KINDS[resource_type]
+
+    @property
+    def collected(self):
+        return not self._store.alive[self._index]
+
+    @collected.setter
+    def collected(self, value):
+        self._store.alive[self._index] = not value
+
+
+class ObstacleView(Obstacle):
+    """Obstacle whose position lives in an EntityStore."""
+
+    __slots__ = ("_store", "_index")
+
+    position = _position_field()
+
+    def __init__(self, store, position, color):
+        self._store = store
+        self._index = store.allocate(KIND_OBSTACLE, self)
+        super().__init__(position, color)
+
+
+# View classes by pool name (constructed with the store as first argument)
+VIEW_CLASSES = {
+    "player": PlayerView,
+    "ally": AllyView,
+    "enemy": EnemyView,
+    "resource": ResourceView,
+    "obstacle": ObstacleView,
+}
+
+
+class EntityStore:
+    """Flat NumPy arrays holding the state of every entity in one arena."""
+
+    def __init__(self, capacity=64):
+        """
+        Initialize an empty store.
+
+        Args:
+            capacity: initial number of entity slots (grows automatically)
+        """
+        if np is None:
+            raise ImportError("The array entity backend requires NumPy")
+
+        self.count = 0
+        self.views = []
+        self._allocate_arrays(capacity)
+
+    def _allocate_arrays(self, capacity):
+        """Create (or grow) the backing arrays, keeping existing entries."""
+        old_count = self.count
+        fields = {
+            "x": np.int32,
+            "y": np.int32,
+            "health": np.int32,
+            "owner": np.int32,
+            "kind": np.int8,
+            "alive": np.bool_,
+        }
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old_count:
+                array[:old_count] = getattr(self, name)[:old_count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def allocate(self, kind, view):
+        """
+        Reserve a slot for a new entity.
+
+        Args:
+            kind: one of the KIND_* constants
+            view: entity object that reads and writes this slot
+
+        Returns:
+            Index of the new slot
+        """
+        if self.count == self.capacity:
+            self._allocate_arrays(self.capacity * 2)
+
+        index = self.count
+        self.kind[index] = kind
+        self.owner[index] = -1
+        self.health[index] = 0
+        self.alive[index] = True
+        self.views.append(view)
+        self.count += 1
+        return index
+
+    def clear(self):
+        """Drop every entity (arrays are kept for reuse)."""
+        self.count = 0
+        self.views = []
+
+    # Vectorized queries
+
+    def select(self, group, alive_only=True):
+        """
+        Get the slot indices of all entities in a kind group.
+
+        Args:
+            group: key of KIND_GROUPS ("enemy", "resource", "coin", ...)
+            alive_only: skip dead players and collected resources
+
+        Returns:
+            Array of slot indices in creation order
+        """
+        kind = self.kind[:self.count]
+        mask = np.isin(kind, KIND_GROUPS[group])
+        if alive_only:
+            mask &= self.alive[:self.count]
+        return np.flatnonzero(mask)
+
+    def distances(self, position, indices):
+        """Manhattan distances from a position to each indexed entity."""
+        return np.abs(self.x[indices] - position[0]) + np.abs(self.y[indices] - position[1])
+
+    def nearest(self, position, group):
+        """
+        Find the entity of a group closest to a position.
+
+        Ties are broken by slot order, matching a linear scan over the
+        entity lists.
+
+        Returns:
+            Tuple of (entity, distance), or (None, None) if the group is empty
+        """
+        indices = self.select(group)
+        if len(indices) == 0:
+            return None, None
+        dists = self.distances(position, indices)
+        best = int(np.argmin(dists))
+        return self.views[indices[best]], int(dists[best])
+
+    def nearest_for_each(self, entities, group):
+        """
+        Find the nearest member of a group for many entities at once.
+
+        Returns:
+            List with the nearest entity (or None) for each input entity
+        """
+        targets = self.select(group)
+        if len(targets) == 0:
+            return [None] * len(entities)
+
+        sources = np.fromiter((e._index for e in entities), dtype=np.int64, count=len(entities))
+        target_x = self.x[targets][None, :]
+        target_y = self.y[targets][None, :]
+        nearest = np.empty(len(sources), dtype=np.int64)
+
+        # Work in chunks so the (sources x targets) distance matrix stays small
+        chunk = max(1, _CHUNK_ELEMENTS // len(targets))
+        for start in range(0, len(sources), chunk):
+            rows = sources[start:start + chunk]
+            dists = np.abs(self.x[rows][:, None] - target_x) + np.abs(self.y[rows][:, None] - target_y)
+            nearest[start:start + chunk] = targets[np.argmin(dists, axis=1)]
+
+        return [self.views[i] for i in nearest]
+
+    def at_position(self, position, group):
+        """Get all live entities of a group standing on a position."""
+        indices = self.select(group)
+        hits = indices[(self.x[indices] == position[0]) & (self.y[indices] == position[1])]
+        return [self.views[i] for i in hits]
+
+    def first_collectors(self, collector_group, target_group):
+        """
+        Pair each target with the first collector standing on the same cell.
+
+        "First" means lowest slot index, i.e. the order in which a nested
+        loop over collectors then targets would reach it.
+
+        Returns:
+            List of (collector, target) entity pairs, ordered by collector
+        """
+        collectors = self.select(collector_group)
+        targets = self.select(target_group)
+        if len(collectors) == 0 or len(targets) == 0:
+            return []
+
+        stride = int(max(self.x[:self.count].max(), self.y[:self.count].max())) + 1
+        collector_cells = self.cells(collectors, stride)
+        target_cells = self.cells(targets, stride)
+
+        # np.unique reports the first occurrence of every occupied cell
+        unique_cells, first = np.unique(collector_cells, return_index=True)
+        slot = np.searchsorted(unique_cells, target_cells)
+        slot = np.minimum(slot, len(unique_cells) - 1)
+        matched = unique_cells[slot] == target_cells
+
+        pairs = [
+            (int(collectors[first[s]]), int(t))
+            for s, t in zip(slot[matched], targets[matched])
+        ]
+        pairs.sort()
+        return [(self.views[c], self.views[t]) for c, t in pairs]
+
+    def cells(self, indices, grid_size):
+        """Encode entity positions as flat cell ids (x * grid_size + y)."""
+        return self.x[indices].astype(np.int64) * grid_size + self.y[indices]
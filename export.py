@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Headless match export for the AI vs AI Survival Arena
+Renders a live game or a recorded replay offscreen (SDL dummy video driver)
+and writes a PNG sequence or pipes raw RGB frames to an encoder process,
+encoding on worker threads while the next frames are simulated and drawn
+"""
+
+import argparse
+import os
+import queue
+import shutil
+import struct
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from config import GameConfig  # noqa: E402
+from constants import WINDOW_WIDTH, WINDOW_HEIGHT, MOVE_ANIMATION_TIME  # noqa: E402
+from game import SurvivalArenaGame  # noqa: E402
+from rendering import GameRenderer  # noqa: E402
+from replay import ReplayReader  # noqa: E402
+
+# Video timing
+DEFAULT_FPS = 30
+DEFAULT_TURN_RATE = 2.0  # turns per second of video
+DEFAULT_HOLD = 2.0  # seconds the final frame stays on screen
+
+# zlib level for PNG frames; 3 is about as small as 6 and much faster on UI frames
+PNG_COMPRESSION = 3
+
+# Frames captured but not yet encoded/written, per worker, before the
+# render loop waits for the encoders
+FRAMES_IN_FLIGHT = 4
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(kind, data):
+    """Build one length-prefixed, CRC-terminated PNG chunk."""
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(width, height, rgb, compression=PNG_COMPRESSION):
+    """
+    Encode packed 8-bit RGB pixels as a PNG file.
+
+    zlib releases the GIL while compressing, so several threads encode
+    frames in parallel.
+
+    Args:
+        width: image width in pixels
+        height: image height in pixels
+        rgb: bytes of height rows of width * 3 bytes
+        compression: zlib level (0-9)
+
+    Returns:
+        PNG file contents as bytes
+    """
+    stride = width * 3
+    pixels = memoryview(rgb)
+    # Every scanline starts with its filter type (0 = none)
+    scanlines = b"".join(b"\x00" + pixels[y * stride:(y + 1) * stride] for y in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        PNG_SIGNATURE
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"IDAT", zlib.compress(scanlines, compression))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+class PngSequenceWriter:
+    """
+    Writes frames as numbered PNG files on a pool of worker threads.
+
+    Passing the same bytes object as the previous frame (an unchanged
+    frame) reuses its encoded PNG instead of compressing it again.
+    """
+
+    def __init__(self, directory, width, height, workers=None, compression=PNG_COMPRESSION):
+        """
+        Initialize the writer.
+
+        Args:
+            directory: output directory (created if missing)
+            width: frame width in pixels
+            height: frame height in pixels
+            workers: encoder threads (default: one per CPU)
+            compression: zlib level for the PNG data
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.width = width
+        self.height = height
+        self.compression = compression
+        self.frames = 0
+
+        workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="png-encoder")
+        self._pending = deque()
+        self._max_pending = workers * FRAMES_IN_FLIGHT
+        self._last_rgb = None
+        self._last_encoded = None
+
+    def path(self, index):
+        """File name of a frame."""
+        return os.path.join(self.directory, f"frame_{index:06d}.png")
+
+    def write(self, rgb):
+        """
+        Queue a frame for encoding.
+
+        Args:
+            rgb: packed RGB bytes of the frame
+        """
+        path = self.path(self.frames)
+        if rgb is self._last_rgb:
+            future = self._executor.submit(self._write_copy, path, self._last_encoded)
+        else:
+            future = self._executor.submit(self._encode, path, rgb)
+            self._last_rgb = rgb
+            self._last_encoded = future
+        self.frames += 1
+
+        self._pending.append(future)
+        while len(self._pending) > self._max_pending:
+            self._pending.popleft().result()
+
+    def _encode(self, path, rgb):
+        """Worker task: encode a frame and write it."""
+        data = encode_png(self.width, self.height, rgb, self.compression)
+        with open(path, "wb") as f:
+            f.write(data)
+        return data
+
+    @staticmethod
+    def _write_copy(path, encoded):
+        """Worker task: write an earlier frame's PNG again."""
+        data = encoded.result()
+        with open(path, "wb") as f:
+            f.write(data)
+        return data
+
+    def close(self):
+        """Wait for every queued frame to be written."""
+        while self._pending:
+            self._pending.popleft().result()
+        self._executor.shutdown()
+
+
+class PipeWriter:
+    """
+    Streams raw RGB frames to the stdin of an encoder process.
+
+    A writer thread feeds the pipe while frames are rendered, so the
+    encoder (a separate process) overlaps with the simulation.
+    """
+
+    def __init__(self, command):
+        """
+        Start the encoder.
+
+        Args:
+            command: argument list of a process reading raw frames from stdin
+        """
+        self.frames = 0
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self._queue = queue.Queue(maxsize=FRAMES_IN_FLIGHT * 2)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="frame-pipe", daemon=True)
+        self._thread.start()
+
+    def write(self, rgb):
+        """Queue a frame (packed RGB bytes) for the encoder."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(rgb)
+        self.frames += 1
+
+    def _run(self):
+        """Writer thread: copy frames into the pipe until close()."""
+        stdin = self._process.stdin
+        while True:
+            rgb = self._queue.get()
+            if rgb is None:
+                break
+            if self._error is None:
+                try:
+                    stdin.write(rgb)
+                except OSError as e:  # encoder exited early; keep draining the queue
+                    self._error = e
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+    def close(self):
+        """Flush the remaining frames and wait for the encoder to finish."""
+        self._queue.put(None)
+        self._thread.join()
+        returncode = self._process.wait()
+        if self._error is not None:
+            raise self._error
+        if returncode != 0:
+            raise RuntimeError(f"encoder exited with status {returncode}")
+
+
+def ffmpeg_command(output, width, height, fps, ffmpeg="ffmpeg"):
+    """Build an ffmpeg command encoding raw RGB frames from stdin to an H.264 file."""
+    return [
+        ffmpeg, "-loglevel", "error", "-y",
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps),
+        "-i", "-",
+        "-c:v", "libx264", "-pix_fmt", "yuv420p", output,
+    ]
+
+
+def live_states(game):
+    """Yield a game at every turn until it ends (the same object, advanced in place)."""
+    yield game
+    while game.is_active():
+        game.execute_turn()
+        yield game
+
+
+def replay_states(reader):
+    """Yield the state at every turn of a replay."""
+    for turn in range(reader.first_turn, reader.last_turn + 1):
+        yield reader.view_at(turn)
+
+
+def export_frames(renderer, states, writer, fps=DEFAULT_FPS, turn_rate=DEFAULT_TURN_RATE,
+                  hold=DEFAULT_HOLD):
+    """
+    Render every turn of a match into a frame writer.
+
+    Each turn is shown for fps / turn_rate frames, with sprites sliding in
+    over MOVE_ANIMATION_TIME as in the game window. Frames the renderer
+    reports as unchanged are passed on as the previous frame's bytes.
+
+    Args:
+        renderer: GameRenderer drawing to an offscreen surface
+        states: iterable of game states, one per turn
+        writer: PngSequenceWriter or PipeWriter
+        fps: video frames per second
+        turn_rate: turns per second of video
+        hold: seconds to keep showing the final state
+
+    Returns:
+        Number of frames written
+    """
+    screen = renderer.screen
+    frames_per_turn = max(1, round(fps / turn_rate))
+    animation_frames = min(MOVE_ANIMATION_TIME, 1.0 / turn_rate) * fps
+    frames = 0
+    rgb = None
+
+    for state in states:
+        for frame in range(frames_per_turn):
+            alpha = min(1.0, frame / animation_frames) if animation_frames >= 1 else 1.0
+            if renderer.render_game(state, alpha) or rgb is None:
+                rgb = pygame.image.tobytes(screen, "RGB")
+            writer.write(rgb)
+            frames += 1
+
+    for _ in range(round(hold * fps)):
+        writer.write(rgb)
+        frames += 1
+    return frames
+
+
+def offscreen_renderer():
+    """Create a GameRenderer drawing to an in-memory window-sized surface."""
+    pygame.display.init()
+    pygame.font.init()
+    # A display mode is needed for convert(); under the dummy driver it costs nothing
+    pygame.display.set_mode((1, 1))
+    surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    return GameRenderer(surface)
+
+
+def main():
+    """Headless export command."""
+    parser = argparse.ArgumentParser(description="Render a Survival Arena match to PNG frames or a video file.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--replay", help="replay file to render (default: play a new game)")
+    source.add_argument("--seed", type=int, default=0, help="seed of the game to play")
+    parser.add_argument("--grid-size", type=int, default=GameConfig.grid_size)
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--png", metavar="DIR", help="write a PNG sequence to this directory")
+    output.add_argument("--video", metavar="FILE", help="encode a video file with ffmpeg")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="ffmpeg executable for --video")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS)
+    parser.add_argument("--turn-rate", type=float, default=DEFAULT_TURN_RATE, help="turns per second of video")
+    parser.add_argument("--hold", type=float, default=DEFAULT_HOLD, help="seconds to show the final state")
+    parser.add_argument("--workers", type=int, default=None, help="PNG encoder threads (default: CPU count)")
+    args = parser.parse_args()
+
+    if args.video and shutil.which(args.ffmpeg) is None:
+        parser.error(f"{args.ffmpeg} not found; install ffmpeg or use --png")
+
+    renderer = offscreen_renderer()
+    if args.png:
+        writer = PngSequenceWriter(args.png, WINDOW_WIDTH, WINDOW_HEIGHT, workers=args.workers)
+    else:
+        writer = PipeWriter(ffmpeg_command(args.video, WINDOW_WIDTH, WINDOW_HEIGHT, args.fps, args.ffmpeg))
+
+    start = time.perf_counter()
+    if args.replay:
+        with ReplayReader(args.replay) as reader:
+            frames = export_frames(renderer, replay_states(reader), writer, args.fps, args.turn_rate, args.hold)
+    else:
+        game = SurvivalArenaGame(config=GameConfig(grid_size=args.grid_size), seed=args.seed)
+        frames = export_frames(renderer, live_states(game), writer, args.fps, args.turn_rate, args.hold)
+    writer.close()
+    elapsed = time.perf_counter() - start
+
+    duration = frames / args.fps
+    print(
+        f"{frames} frames ({duration:.1f} s of video) in {elapsed:.1f} s, "
+        f"{duration / elapsed:.1f}x real time -> {args.png or args.video}"
+    )
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
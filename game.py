@@ -3,33 +3,82 @@ Main game logic for AI vs AI Survival Arena
 """
 
 import random
-from entities import Player, Ally, Enemy, Resource, Obstacle
+import snapshot
+from entities import EntityPool, ENTITY_CLASSES
 from ai.astar import AStarPathfinder
 from ai.minimax import MinimaxAI
 from ai.fuzzy_logic import FuzzyLogic
-from constants import (
-    GRID_SIZE,
-    MAX_ENEMIES,
-    MAX_OBSTACLES,
-    MAX_HEALTH_PACKS,
-    MAX_COINS,
-    RESOURCE_SPAWN_CHANCE,
-    COLORS,
-    ACTIONS,
-    WIN_SCORE,
-    MAX_TURNS,
-    ENEMY_DAMAGE,
-    PLAYER_COLLISION_DAMAGE,
-    MINIMAX_DEPTH,
-)
+from ai.profiles import DEFAULT_PROFILE
+from config import DEFAULT_CONFIG
+from constants import COLORS, ACTIONS
 
 
 class SurvivalArenaGame:
     """Main game class managing all entities and game logic."""
 
-    def __init__(self):
-        """Initialize the game."""
-        self.grid_size = GRID_SIZE
+    def __init__(self, backend="objects", *, config=None, seed=None, profiles=None, map_id=None):
+        """
+        Initialize the game.
+
+        Args:
+            backend: "objects" keeps every entity as a plain Python object;
+                "arrays" stores entity state in a NumPy EntityStore so
+                distance and collision checks are vectorized
+            config: GameConfig with the arena parameters (defaults to constants.py)
+            seed: seed for the game's random number generator (drawn from the
+                global random module if omitted, so random.seed() still
+                makes games reproducible)
+            profiles: (player 1, player 2) AIProfile pair choosing each
+                player's fuzzy rules and pathfinder (default: DEFAULT_PROFILE)
+            map_id: ID of a map in a MapRegistry (see map_registry.py): the
+                game plays on that map's walls instead of random ones and
+                takes path steps from its shared distance table instead of
+                running A*
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        game_map = None
+        if map_id is not None:
+            # Imported lazily so games on random maps never touch shared memory
+            from map_registry import attach
+
+            game_map = attach(map_id)
+        self._init_state(config, backend, random.Random(seed), profiles, game_map)
+        self.seed = seed
+
+        # Initialize game
+        self.setup_game()
+
+    def _init_state(self, config, backend, rng, profiles=None, game_map=None):
+        """Set up an empty game without any entities."""
+        if backend == "arrays":
+            # Imported lazily so the default backend never needs NumPy
+            from entity_store import EntityStore, VIEW_CLASSES
+
+            self.store = EntityStore()
+            self.pools = {
+                name: EntityPool(cls, self.store) for name, cls in VIEW_CLASSES.items()
+            }
+        elif backend == "objects":
+            self.store = None
+            self.pools = {name: EntityPool(cls) for name, cls in ENTITY_CLASSES.items()}
+        else:
+            raise ValueError(f"Unknown entity backend: {backend}")
+
+        self.config = config if config is not None else DEFAULT_CONFIG
+        self.profiles = tuple(profiles) if profiles is not None else (DEFAULT_PROFILE, DEFAULT_PROFILE)
+        self.backend = backend
+        self.rng = rng
+        self.seed = None
+        self.grid_size = self.config.grid_size
+        if game_map is not None and game_map.grid_size != self.grid_size:
+            raise ValueError(
+                f"map {game_map.map_id} is {game_map.grid_size}x{game_map.grid_size}, "
+                f"the config's grid is {self.grid_size}x{self.grid_size}"
+            )
+        # Optional SharedMap with the fixed walls and distance table of this game
+        self.map = game_map
         self.turn_count = 0
         self.game_active = True
         self.winner = None
@@ -42,34 +91,58 @@ class SurvivalArenaGame:
         self.enemies = []
         self.resources = []
         self.obstacles = []
+        self.obstacle_positions = frozenset()
 
-        # Initialize game
-        self.setup_game()
+        # True while the obstacle list is shared with a fork (copy-on-write)
+        self._obstacles_shared = False
+
+        # Optional ReplayRecorder fed after every turn
+        self.recorder = None
+
+        # Optional TurnProfiler timing every phase (see profiler.py)
+        self.profiler = None
+
+        # Optional TurnScheduler keeping AI work within a turn budget (see scheduler.py)
+        self.scheduler = None
 
     def setup_game(self):
         """Set up the game with initial entities."""
-        # Clear all entities
+        # Clear all entities (they are reused by the spawners below)
+        self._recycle_entities()
+        if self.store is not None:
+            self.store.clear()
         self.allies = []
         self.enemies = []
         self.resources = []
         self.obstacles = []
 
-        # Create obstacles first
-        obstacle_positions = self._generate_random_positions(MAX_OBSTACLES, set())
+        config = self.config
+        grid_size = self.grid_size
+
+        # Create obstacles first (a shared map's walls, or random ones)
+        if self.map is not None:
+            obstacle_positions = self.map.obstacles
+        else:
+            obstacle_positions = self._generate_random_positions(config.max_obstacles, set())
         for pos in obstacle_positions:
-            self.obstacles.append(Obstacle(pos, COLORS["obstacle"]))
+            self.obstacles.append(self.pools["obstacle"].acquire(pos, COLORS["obstacle"]))
 
-        # Get obstacle positions for pathfinding
+        # Get obstacle positions for pathfinding (cached for the whole game)
         obstacle_set = {obs.position for obs in self.obstacles}
+        self.obstacle_positions = self.map.obstacle_set if self.map is not None else frozenset(obstacle_set)
 
         # Create players in opposite corners
         player1_pos = self._find_free_position((2, 2), obstacle_set, set())
         player2_pos = self._find_free_position(
-            (GRID_SIZE - 3, GRID_SIZE - 3), obstacle_set, {player1_pos}
+            (grid_size - 3, grid_size - 3), obstacle_set, {player1_pos}
         )
 
-        self.player1 = Player(player1_pos, "Blue", COLORS["player1"])
-        self.player2 = Player(player2_pos, "Red", COLORS["player2"])
+        self.player1 = self.pools["player"].acquire(
+            player1_pos, "Blue", COLORS["player1"], config.max_health
+        )
+        self.player2 = self.pools["player"].acquire(
+            player2_pos, "Red", COLORS["player2"], config.max_health
+        )
 
         # Create allies for each player
         occupied = obstacle_set | {player1_pos, player2_pos}
@@ -80,41 +153,61 @@ class SurvivalArenaGame:
         ally2_pos = self._find_free_position((2, 1), obstacle_set, occupied)
         occupied.add(ally2_pos)
 
-        self.allies.append(Ally(ally1_pos, self.player1, COLORS["ally1"]))
-        self.allies.append(Ally(ally2_pos, self.player1, COLORS["ally1"]))
+        self.allies.append(self.pools["ally"].acquire(ally1_pos, self.player1, COLORS["ally1"]))
+        self.allies.append(self.pools["ally"].acquire(ally2_pos, self.player1, COLORS["ally1"]))
 
         # Player 2 allies (near player 2)
         ally3_pos = self._find_free_position(
-            (GRID_SIZE - 2, GRID_SIZE - 3), obstacle_set, occupied
+            (grid_size - 2, grid_size - 3), obstacle_set, occupied
         )
         occupied.add(ally3_pos)
         ally4_pos = self._find_free_position(
-            (GRID_SIZE - 3, GRID_SIZE - 2), obstacle_set, occupied
+            (grid_size - 3, grid_size - 2), obstacle_set, occupied
         )
         occupied.add(ally4_pos)
 
-        self.allies.append(Ally(ally3_pos, self.player2, COLORS["ally2"]))
-        self.allies.append(Ally(ally4_pos, self.player2, COLORS["ally2"]))
+        self.allies.append(self.pools["ally"].acquire(ally3_pos, self.player2, COLORS["ally2"]))
+        self.allies.append(self.pools["ally"].acquire(ally4_pos, self.player2, COLORS["ally2"]))
 
         # Create enemies
-        for i in range(MAX_ENEMIES):
+        for i in range(config.max_enemies):
             enemy_pos = self._find_free_position(
-                (GRID_SIZE // 2, GRID_SIZE // 2), obstacle_set, occupied
+                (grid_size // 2, grid_size // 2), obstacle_set, occupied
             )
             occupied.add(enemy_pos)
-            self.enemies.append(Enemy(enemy_pos, COLORS["enemy"]))
+            self.enemies.append(self.pools["enemy"].acquire(enemy_pos, COLORS["enemy"]))
 
         # Spawn initial resources
         self._spawn_resources()
 
+    def _recycle_entities(self, keep_obstacles=False):
+        """Return the entities of the previous game to their pools."""
+        pools = self.pools
+        for player in (self.player1, self.player2):
+            if player is not None:
+                pools["player"].release(player)
+        pools["ally"].release_all(self.allies)
+        pools["enemy"].release_all(self.enemies)
+        pools["resource"].release_all(self.resources)
+        if keep_obstacles:
+            return
+
+        # A forked game may still be using the same obstacle objects
+        if self._obstacles_shared:
+            self._obstacles_shared = False
+        else:
+            pools["obstacle"].release_all(self.obstacles)
+
     def _generate_random_positions(self, count, forbidden):
         """Generate random unique positions avoiding forbidden positions."""
+        grid_size = self.grid_size
         positions = set()
         attempts = 0
         max_attempts = count * 10
 
         while len(positions) < count and attempts < max_attempts:
-            pos = (random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1))
+            # randrange(n) draws the same values as randint(0, n - 1), but cheaper
+            pos = (self.rng.randrange(grid_size), self.rng.randrange(grid_size))
             if pos not in forbidden and pos not in positions:
                 positions.add(pos)
             attempts += 1
@@ -123,6 +216,8 @@ class SurvivalArenaGame:
 
     def _find_free_position(self, preferred, obstacles, occupied):
         """Find a free position near the preferred location."""
+        grid_size = self.grid_size
+
         # Try preferred position first
         if preferred not in obstacles and preferred not in occupied:
             return preferred
@@ -133,16 +228,16 @@ class SurvivalArenaGame:
                 for dy in range(-radius, radius + 1):
                     pos = (preferred[0] + dx, preferred[1] + dy)
                     if (
-                        0 <= pos[0] < GRID_SIZE
-                        and 0 <= pos[1] < GRID_SIZE
+                        0 <= pos[0] < grid_size
+                        and 0 <= pos[1] < grid_size
                         and pos not in obstacles
                         and pos not in occupied
                     ):
                         return pos
 
         # Fallback: find any free position
-        for x in range(GRID_SIZE):
-            for y in range(GRID_SIZE):
+        for x in range(grid_size):
+            for y in range(grid_size):
                 pos = (x, y)
                 if pos not in obstacles and pos not in occupied:
                     return pos
@@ -151,113 +246,170 @@ class SurvivalArenaGame:
 
     def _spawn_resources(self):
         """Spawn initial resources."""
-        obstacle_positions = {obs.position for obs in self.obstacles}
-        occupied = obstacle_positions | {self.player1.position, self.player2.position}
+        obstacle_positions = self.obstacle_positions
+        occupied = {self.player1.position, self.player2.position}
         occupied |= {ally.position for ally in self.allies}
         occupied |= {enemy.position for enemy in self.enemies}
 
         # Spawn health packs
         health_count = len([r for r in self.resources if r.type == "health" and not r.collected])
-        for _ in range(MAX_HEALTH_PACKS - health_count):
+        for _ in range(self.config.max_health_packs - health_count):
             pos = self._find_free_position(
-                (random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1)),
+                (self.rng.randrange(self.grid_size), self.rng.randrange(self.grid_size)),
                 obstacle_positions,
                 occupied,
             )
             occupied.add(pos)
-            self.resources.append(Resource(pos, "health", COLORS["health"]))
+            self.resources.append(self.pools["resource"].acquire(pos, "health", COLORS["health"]))
 
         # Spawn coins
         coin_count = len([r for r in self.resources if r.type == "coin" and not r.collected])
-        for _ in range(MAX_COINS - coin_count):
+        for _ in range(self.config.max_coins - coin_count):
             pos = self._find_free_position(
-                (random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1)),
+                (self.rng.randrange(self.grid_size), self.rng.randrange(self.grid_size)),
                 obstacle_positions,
                 occupied,
             )
             occupied.add(pos)
-            self.resources.append(Resource(pos, "coin", COLORS["coin"]))
+            self.resources.append(self.pools["resource"].acquire(pos, "coin", COLORS["coin"]))
 
     def _try_spawn_new_resources(self):
         """Randomly spawn new resources during gameplay."""
-        if random.random() < RESOURCE_SPAWN_CHANCE:
-            obstacle_positions = {obs.position for obs in self.obstacles}
-            occupied = obstacle_positions | {self.player1.position, self.player2.position}
+        if self.rng.random() < self.config.resource_spawn_chance:
+            obstacle_positions = self.obstacle_positions
+            occupied = {self.player1.position, self.player2.position}
             occupied |= {ally.position for ally in self.allies}
             occupied |= {enemy.position for enemy in self.enemies}
             occupied |= {r.position for r in self.resources if not r.collected}
 
             # Try to spawn a health pack
             health_count = len([r for r in self.resources if r.type == "health" and not r.collected])
-            if health_count < MAX_HEALTH_PACKS:
+            if health_count < self.config.max_health_packs:
                 pos = self._find_free_position(
-                    (random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1)),
+                    (self.rng.randrange(self.grid_size), self.rng.randrange(self.grid_size)),
                     obstacle_positions,
                     occupied,
                 )
-                self.resources.append(Resource(pos, "health", COLORS["health"]))
+                self.resources.append(self.pools["resource"].acquire(pos, "health", COLORS["health"]))
 
-        if random.random() < RESOURCE_SPAWN_CHANCE:
-            obstacle_positions = {obs.position for obs in self.obstacles}
-            occupied = obstacle_positions | {self.player1.position, self.player2.position}
+        if self.rng.random() < self.config.resource_spawn_chance:
+            obstacle_positions = self.obstacle_positions
+            occupied = {self.player1.position, self.player2.position}
             occupied |= {ally.position for ally in self.allies}
             occupied |= {enemy.position for enemy in self.enemies}
             occupied |= {r.position for r in self.resources if not r.collected}
 
             # Try to spawn a coin
             coin_count = len([r for r in self.resources if r.type == "coin" and not r.collected])
-            if coin_count < MAX_COINS:
+            if coin_count < self.config.max_coins:
                 pos = self._find_free_position(
-                    (random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1)),
+                    (self.rng.randrange(self.grid_size), self.rng.randrange(self.grid_size)),
                     obstacle_positions,
                     occupied,
                 )
-                self.resources.append(Resource(pos, "coin", COLORS["coin"]))
+                self.resources.append(self.pools["resource"].acquire(pos, "coin", COLORS["coin"]))
+
+    def execute_turn(self, moves=None):
+        """
+        Execute one turn of the game.
 
-    def execute_turn(self):
-        """Execute one turn of the game."""
+        Args:
+            moves: optional (player 1, player 2) pair of (dx, dy) steps for
+                externally controlled players; None (or a None entry) lets
+                the built-in AI move that player
+        """
         if not self.game_active:
             return
 
+        prof = self.profiler
+        if prof is not None:
+            prof.start_turn(self.turn_count)
+
+        scheduler = self.scheduler
+        if scheduler is not None:
+            scheduler.start_turn(self)
+
         # Get obstacle positions
-        obstacle_positions = {obs.position for obs in self.obstacles}
+        obstacle_positions = self.obstacle_positions
+
+        move1, move2 = moves if moves is not None else (None, None)
 
         # 1. Player 1 AI Decision and Movement
-        self._update_player(self.player1, obstacle_positions)
+        self._update_player(self.player1, obstacle_positions, move1)
+        if prof is not None:
+            prof.end_phase("player1")
 
         # 2. Player 2 AI Decision and Movement
-        self._update_player(self.player2, obstacle_positions)
+        self._update_player(self.player2, obstacle_positions, move2)
+        if prof is not None:
+            prof.end_phase("player2")
 
         # 3. Update all Allies
         self._update_allies(obstacle_positions)
+        if prof is not None:
+            prof.end_phase("allies")
 
         # 4. Update all Enemies
         self._update_enemies(obstacle_positions)
+        if prof is not None:
+            prof.end_phase("enemies")
 
         # 5. Check collisions
         self._check_collisions()
+        if prof is not None:
+            prof.end_phase("collisions")
 
         # 6. Spawn new resources
         self._try_spawn_new_resources()
+        if prof is not None:
+            prof.end_phase("spawn")
 
         # 7. Increment turn counter
         self.turn_count += 1
+        if prof is not None:
+            prof.end_phase("turn_counter")
 
         # 8. Check game over conditions
         self.check_game_over()
+        if prof is not None:
+            prof.end_phase("game_over")
+
+        if scheduler is not None:
+            scheduler.end_turn()
+
+        if self.recorder is not None:
+            self.recorder.record_turn(self)
+
+        if prof is not None:
+            prof.end_turn()
 
-    def _update_player(self, player, obstacles):
-        """Update player AI decision and movement."""
+    def _update_player(self, player, obstacles, move=None):
+        """Update player AI decision and movement, or apply an external (dx, dy) move."""
         if not player.alive:
             return
 
+        if move is not None:
+            # Steps off the grid or into an obstacle leave the player in place
+            x, y = player.position[0] + move[0], player.position[1] + move[1]
+            if 0 <= x < self.grid_size and 0 <= y < self.grid_size and (x, y) not in obstacles:
+                player.move_to((x, y))
+            return
+
         # Get game state for fuzzy logic
         nearest_enemy_dist = self._get_nearest_enemy_distance(player.position)
         nearest_resource_dist = self._get_nearest_resource_distance(player.position)
 
-        # Make decision using fuzzy logic
+        # Make decision using the player's fuzzy rules
+        profile = self.profiles[0] if player is self.player1 else self.profiles[1]
         action = FuzzyLogic.decide_action(
-            player.health, player.score, nearest_enemy_dist, nearest_resource_dist
+            player.health,
+            player.score,
+            nearest_enemy_dist,
+            nearest_resource_dist,
+            self.config.max_health,
+            self.config.win_score,
+            profile.rules,
+            self.grid_size,
         )
         player.decision_state = action
 
@@ -284,90 +436,141 @@ class SurvivalArenaGame:
             # Balanced: move toward resources while avoiding enemies
             target = self._get_nearest_resource_position(player.position, None)
 
-        # Move toward target using A*
+        # Move toward target using the profile's pathfinder
         if target:
             player.target_position = target
-            next_pos = AStarPathfinder.get_next_move(
-                player.position, target, obstacles, GRID_SIZE
-            )
-            player.move_to(next_pos)
+            player.move_to(self._next_move("player", player, target, obstacles, profile.pathfinder))
 
     def _update_allies(self, obstacles):
         """Update all ally bots using A* pathfinding."""
-        for ally in self.allies:
-            # Find nearest unclaimed resource
-            nearest_resource = None
-            min_distance = float("inf")
+        # Resources don't change while allies move, so the array backend
+        # can pick every ally's target in one vectorized pass
+        if self.store is not None:
+            targets = self.store.nearest_for_each(self.allies, "resource")
+
+        prof = self.profiler
+        for i, ally in enumerate(self.allies):
+            if prof is not None:
+                start = prof.clock()
+
+            if self.store is not None:
+                nearest_resource = targets[i]
+            else:
+                # Find nearest unclaimed resource
+                nearest_resource = None
+                min_distance = float("inf")
 
-            for resource in self.resources:
-                if not resource.collected:
-                    dist = AStarPathfinder.manhattan_distance(ally.position, resource.position)
-                    if dist < min_distance:
-                        min_distance = dist
-                        nearest_resource = resource
+                for resource in self.resources:
+                    if not resource.collected:
+                        dist = AStarPathfinder.manhattan_distance(ally.position, resource.position)
+                        if dist < min_distance:
+                            min_distance = dist
+                            nearest_resource = resource
 
             if nearest_resource:
                 ally.target_resource = nearest_resource
                 # Move toward resource using A*
-                next_pos = AStarPathfinder.get_next_move(
-                    ally.position, nearest_resource.position, obstacles, GRID_SIZE
-                )
+                next_pos = self._next_move("ally", ally, nearest_resource.position, obstacles)
                 ally.move_to(next_pos)
 
+            if prof is not None:
+                prof.record_agent("ally", i, start)
+
     def _update_enemies(self, obstacles):
         """Update all enemies using Minimax algorithm."""
-        for enemy in self.enemies:
+        prof = self.profiler
+        for i, enemy in enumerate(self.enemies):
+            if prof is not None:
+                start = prof.clock()
+
             # Use Minimax to choose target and move
             if self.player1.alive and self.player2.alive:
-                target, next_move = MinimaxAI.choose_target_and_move(
-                    enemy.position,
-                    self.player1.position,
-                    self.player2.position,
-                    self.player1.health,
-                    self.player2.health,
-                    obstacles,
-                    GRID_SIZE,
-                    MINIMAX_DEPTH,
-                )
+                if self.scheduler is None:
+                    target, next_move = MinimaxAI.choose_target_and_move(
+                        enemy.position,
+                        self.player1.position,
+                        self.player2.position,
+                        self.player1.health,
+                        self.player2.health,
+                        obstacles,
+                        self.grid_size,
+                        self.config.minimax_depth,
+                    )
+                else:
+                    target, next_move = self.scheduler.enemy_move(
+                        enemy,
+                        self.player1,
+                        self.player2,
+                        obstacles,
+                        self.grid_size,
+                        self.config.minimax_depth,
+                    )
                 enemy.target_position = target
                 enemy.move_to(next_move)
             elif self.player1.alive:
                 # Only player 1 alive, chase them
                 enemy.target_position = self.player1.position
-                next_move = AStarPathfinder.get_next_move(
-                    enemy.position, self.player1.position, obstacles, GRID_SIZE
-                )
+                next_move = self._next_move("enemy", enemy, self.player1.position, obstacles)
                 enemy.move_to(next_move)
             elif self.player2.alive:
                 # Only player 2 alive, chase them
                 enemy.target_position = self.player2.position
-                next_move = AStarPathfinder.get_next_move(
-                    enemy.position, self.player2.position, obstacles, GRID_SIZE
-                )
+                next_move = self._next_move("enemy", enemy, self.player2.position, obstacles)
                 enemy.move_to(next_move)
 
+            if prof is not None:
+                prof.record_agent("enemy", i, start)
+
+    def _next_move(self, group, entity, goal, obstacles, pathfinder="astar"):
+        """
+        Get an agent's next step toward a goal.
+
+        Uses A* (or the shared map's distance table) unless a turn scheduler
+        is attached, which may substitute a cached path or a greedy step when
+        the turn is short of time.
+
+        Args:
+            group: "player", "ally" or "enemy" (the scheduler's time share)
+            entity: the moving entity
+            goal: (x, y) goal position
+            obstacles: set of blocked positions
+            pathfinder: "astar", or "greedy" to always take
+                AStarPathfinder.greedy_step (a player profile's pathfinder)
+        """
+        if self.scheduler is None:
+            if pathfinder == "greedy":
+                return AStarPathfinder.greedy_step(entity.position, goal, obstacles, self.grid_size)
+            if self.map is not None:
+                return self.map.next_step(entity.position, goal)
+            return AStarPathfinder.get_next_move(entity.position, goal, obstacles, self.grid_size)
+        return self.scheduler.path_step(group, entity, goal, obstacles, self.grid_size, pathfinder)
+
     def _check_collisions(self):
         """Check and handle all collisions."""
+        if self.store is not None:
+            self._check_collisions_vectorized()
+            return
+
         # Player-Enemy collisions
         for enemy in self.enemies:
             if self.player1.alive and enemy.position == self.player1.position:
-                self.player1.take_damage(ENEMY_DAMAGE)
+                self.player1.take_damage(self.config.enemy_damage)
             if self.player2.alive and enemy.position == self.player2.position:
-                self.player2.take_damage(ENEMY_DAMAGE)
+                self.player2.take_damage(self.config.enemy_damage)
 
         # Player-Resource collisions
         for resource in self.resources:
             if not resource.collected:
                 if self.player1.alive and resource.position == self.player1.position:
-                    resource.collect(self.player1)
+                    self._collect(resource, self.player1)
                 elif self.player2.alive and resource.position == self.player2.position:
-                    resource.collect(self.player2)
+                    self._collect(resource, self.player2)
 
         # Ally-Resource collisions
         for ally in self.allies:
             for resource in self.resources:
                 if not resource.collected and ally.position == resource.position:
-                    resource.collect(ally.owner)
+                    self._collect(resource, ally.owner)
 
         # Player-Player collision
         if (
@@ -375,28 +578,74 @@ class SurvivalArenaGame:
             and self.player2.alive
             and self.player1.position == self.player2.position
         ):
-            self.player1.take_damage(PLAYER_COLLISION_DAMAGE)
-            self.player2.take_damage(PLAYER_COLLISION_DAMAGE)
+            self.player1.take_damage(self.config.player_collision_damage)
+            self.player2.take_damage(self.config.player_collision_damage)
+
+    def _collect(self, resource, player):
+        """Collect a resource for a player using this game's reward values."""
+        return resource.collect(player, self.config.health_pack_restore, self.config.coin_value)
+
+    def _check_collisions_vectorized(self):
+        """Handle collisions with array queries (same rules as _check_collisions)."""
+        store = self.store
+        players = (self.player1, self.player2)
+
+        # Player-Enemy collisions
+        for player in players:
+            for _ in store.at_position(player.position, "enemy"):
+                if player.alive:
+                    player.take_damage(self.config.enemy_damage)
+
+        # Player-Resource collisions (player 1 wins shared cells)
+        for player in players:
+            if player.alive:
+                for resource in store.at_position(player.position, "resource"):
+                    self._collect(resource, player)
+
+        # Ally-Resource collisions
+        for ally, resource in store.first_collectors("ally", "resource"):
+            self._collect(resource, ally.owner)
+
+        # Player-Player collision
+        if (
+            self.player1.alive
+            and self.player2.alive
+            and self.player1.position == self.player2.position
+        ):
+            self.player1.take_damage(self.config.player_collision_damage)
+            self.player2.take_damage(self.config.player_collision_damage)
 
     def _get_nearest_enemy_distance(self, position):
-        """Get distance to nearest enemy."""
+        """Get distance to nearest enemy (the grid size if there is none)."""
+        if self.store is not None:
+            _, dist = self.store.nearest(position, "enemy")
+            return dist if dist is not None else self.grid_size
+
         min_dist = float("inf")
         for enemy in self.enemies:
             dist = AStarPathfinder.manhattan_distance(position, enemy.position)
             min_dist = min(min_dist, dist)
-        return min_dist if min_dist != float("inf") else 20
+        return min_dist if min_dist != float("inf") else self.grid_size
 
     def _get_nearest_resource_distance(self, position):
-        """Get distance to nearest resource."""
+        """Get distance to nearest resource (the grid size if there is none)."""
+        if self.store is not None:
+            _, dist = self.store.nearest(position, "resource")
+            return dist if dist is not None else self.grid_size
+
         min_dist = float("inf")
         for resource in self.resources:
             if not resource.collected:
                 dist = AStarPathfinder.manhattan_distance(position, resource.position)
                 min_dist = min(min_dist, dist)
-        return min_dist if min_dist != float("inf") else 20
+        return min_dist if min_dist != float("inf") else self.grid_size
 
     def _get_nearest_resource_position(self, position, resource_type=None):
         """Get position of nearest resource of given type."""
+        if self.store is not None:
+            resource, _ = self.store.nearest(position, resource_type or "resource")
+            return resource.position if resource else position
+
         nearest = None
         min_dist = float("inf")
 
@@ -436,8 +685,8 @@ class SurvivalArenaGame:
                 for direction in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
                     test_dx, test_dy = direction
                     test_pos = (
-                        max(0, min(GRID_SIZE - 1, position[0] + test_dx * 4)),
-                        max(0, min(GRID_SIZE - 1, position[1] + test_dy * 4)),
+                        max(0, min(self.grid_size - 1, position[0] + test_dx * 4)),
+                        max(0, min(self.grid_size - 1, position[1] + test_dy * 4)),
                     )
 
                     # Calculate minimum distance to all enemies from this position
@@ -463,8 +712,8 @@ class SurvivalArenaGame:
                 dy = 1 if dy > 0 else -1
 
             flee_pos = (
-                max(0, min(GRID_SIZE - 1, position[0] + dx * 4)),
-                max(0, min(GRID_SIZE - 1, position[1] + dy * 4)),
+                max(0, min(self.grid_size - 1, position[0] + dx * 4)),
+                max(0, min(self.grid_size - 1, position[1] + dy * 4)),
             )
 
             return flee_pos
@@ -474,13 +723,13 @@ class SurvivalArenaGame:
     def check_game_over(self):
         """Check if game over conditions are met."""
         # Check if a player reached win score
-        if self.player1.score >= WIN_SCORE:
+        if self.player1.score >= self.config.win_score:
             self.game_active = False
             self.winner = self.player1
             self.game_over_reason = f"{self.player1.team} Team wins by score!"
             return
 
-        if self.player2.score >= WIN_SCORE:
+        if self.player2.score >= self.config.win_score:
             self.game_active = False
             self.winner = self.player2
             self.game_over_reason = f"{self.player2.team} Team wins by score!"
@@ -507,31 +756,106 @@ class SurvivalArenaGame:
             return
 
         # Check if max turns reached
-        if self.turn_count >= MAX_TURNS:
+        max_turns = self.config.max_turns
+        if self.turn_count >= max_turns:
             self.game_active = False
             if self.player1.score > self.player2.score:
                 self.winner = self.player1
                 self.game_over_reason = (
-                    f"{self.player1.team} Team wins by score after {MAX_TURNS} turns!"
+                    f"{self.player1.team} Team wins by score after {max_turns} turns!"
                 )
             elif self.player2.score > self.player1.score:
                 self.winner = self.player2
                 self.game_over_reason = (
-                    f"{self.player2.team} Team wins by score after {MAX_TURNS} turns!"
+                    f"{self.player2.team} Team wins by score after {max_turns} turns!"
                 )
             else:
                 self.winner = None
-                self.game_over_reason = f"Draw after {MAX_TURNS} turns!"
+                self.game_over_reason = f"Draw after {max_turns} turns!"
             return
 
     def is_active(self):
         """Check if game is still active."""
         return self.game_active
 
+    def attach_recorder(self, recorder):
+        """
+        Record this game from its current turn on.
+
+        Args:
+            recorder: ReplayRecorder (see replay.py); it writes the initial
+                keyframe now and finishes the file at game over or reset
+        """
+        self.recorder = recorder
+        recorder.start(self)
+
     def reset(self):
         """Reset the game to initial state."""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
         self.turn_count = 0
         self.game_active = True
         self.winner = None
         self.game_over_reason = ""
         self.setup_game()
+
+    def snapshot(self):
+        """
+        Capture the full game state, including the RNG state.
+
+        Returns:
+            Compact bytes snapshot (see snapshot.py) for restore()
+        """
+        return snapshot.pack(self)
+
+    def restore(self, data):
+        """
+        Replace the game state with a snapshot taken by snapshot().
+
+        Obstacles are kept when they already match the snapshot, so
+        restoring checkpoints of the same match only rebuilds moving entities.
+        """
+        static, dynamic, reason, rng_state = snapshot.unpack(data)
+
+        # The array backend keeps every entity in one store, so rebuild all
+        rebuild_obstacles = self.store is not None or not snapshot.same_obstacles(self, static)
+
+        self._recycle_entities(keep_obstacles=not rebuild_obstacles)
+        if rebuild_obstacles:
+            if self.store is not None:
+                self.store.clear()
+            snapshot.apply_static(self, static)
+            # Walls of another map: path steps go back to A*
+            if self.map is not None and self.obstacle_positions != self.map.obstacle_set:
+                self.map = None
+
+        snapshot.apply_dynamic(self, dynamic, reason)
+        if rng_state is not None:
+            self.rng.setstate(rng_state)
+
+    def fork(self):
+        """
+        Create an independent copy of the game.
+
+        Obstacles never change during a match, so the fork shares them with
+        this game until either one is reset; only the moving entities, scores
+        and RNG state are copied.
+
+        Returns:
+            New SurvivalArenaGame continuing from the current state
+        """
+        clone = SurvivalArenaGame.__new__(SurvivalArenaGame)
+        clone._init_state(self.config, self.backend, random.Random(), self.profiles, self.map)
+        clone.seed = self.seed
+
+        if self.store is None:
+            clone.obstacles = self.obstacles
+            clone.obstacle_positions = self.obstacle_positions
+            clone._obstacles_shared = self._obstacles_shared = True
+
+        # Copy the RNG state directly instead of round-tripping it through bytes
+        clone.restore(snapshot.pack(self, include_rng=False))
+        clone.rng.setstate(self.rng.getstate())
+        return clone
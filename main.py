@@ -10,31 +10,147 @@ A Pygame-based simulation showcasing three advanced AI algorithms:
 Two AI players compete autonomously in a survival arena.
 """
 
+import argparse
 import pygame
 import sys
+import time
+from config import GameConfig
 from game import SurvivalArenaGame
+from pipeline import TurnPipeline
 from rendering import GameRenderer
-from constants import WINDOW_WIDTH, WINDOW_HEIGHT, FPS
+from constants import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    RENDER_FPS,
+    TURN_RATE,
+    TURN_RATES,
+    MOVE_ANIMATION_TIME,
+)
+
+# Most turns simulated in one frame at a fixed turn rate; if the simulation
+# falls further behind, the backlog is dropped instead of freezing the window
+MAX_TURNS_PER_FRAME = 8
+
+# Share of each frame spent simulating when the turn rate is unlimited
+FAST_FORWARD_SHARE = 0.75
+
+# Finished turns the background worker may keep ahead of the display
+PIPELINE_BUFFER = 2
+
+
+def format_turn_rate(turn_rate):
+    """Describe a turn rate for console output."""
+    return "unlimited" if turn_rate is None else f"{turn_rate} turns/sec"
+
+
+def print_turn_info(game):
+    """Print both players' status."""
+    print(f"Turn {game.turn_count}:")
+    print(
+        f"  Blue: HP={int(game.player1.health)}, "
+        f"Score={game.player1.score}, "
+        f"Action={game.player1.decision_state}"
+    )
+    print(
+        f"  Red:  HP={int(game.player2.health)}, "
+        f"Score={game.player2.score}, "
+        f"Action={game.player2.decision_state}"
+    )
+    print()
+
+
+def print_game_over(game):
+    """Print the final result."""
+    print("\n" + "=" * 60)
+    print("GAME OVER!")
+    print("=" * 60)
+    print(f"\n{game.game_over_reason}\n")
+    print("Final Stats:")
+    print(
+        f"  Blue Team: {game.player1.score} points, "
+        f"{int(game.player1.health)} HP"
+    )
+    print(
+        f"  Red Team:  {game.player2.score} points, "
+        f"{int(game.player2.health)} HP"
+    )
+    print(f"  Total Turns: {game.turn_count}")
+    print("\nPress R to restart or Q to quit")
+    print("=" * 60)
+    print()
+
+
+def take_turn(game, pipeline, timeout=0.0):
+    """
+    Advance the displayed game by one turn and print turn info periodically.
+
+    Args:
+        game: game currently on screen
+        pipeline: TurnPipeline computing turns in the background, or None
+            to execute the turn here
+        timeout: seconds to wait for the pipeline's next turn
+
+    Returns:
+        Game state to display, or None if the pipeline isn't ready yet
+    """
+    if pipeline is None:
+        game.execute_turn()
+        state = game
+    else:
+        state = pipeline.next_state(timeout)
+        if state is None:
+            return None
+
+    if state.turn_count % 10 == 0:
+        print_turn_info(state)
+    return state
 
 
 def main():
     """Main game loop."""
-    # Initialize Pygame
-    pygame.init()
+    parser = argparse.ArgumentParser(description="AI vs AI Survival Arena")
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="compute turns on the render thread instead of a background worker",
+    )
+    parser.add_argument(
+        "--grid-size",
+        type=int,
+        default=GameConfig.grid_size,
+        help="arena width and height in cells (zoom and pan to explore large arenas)",
+    )
+    args = parser.parse_args()
+
+    # Initialize only the pygame subsystems the window uses (no audio or joystick)
+    pygame.display.init()
+    pygame.font.init()
 
     # Set up display
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("AI vs AI Survival Arena")
 
     # Create game and renderer
-    game = SurvivalArenaGame()
+    game = SurvivalArenaGame(config=GameConfig(grid_size=args.grid_size))
     renderer = GameRenderer(screen)
 
+    # Turns are computed one step ahead on a worker thread so slow AI never
+    # stalls input or rendering
+    pipeline = None
+    if not args.sync:
+        pipeline = TurnPipeline(game, buffer_size=PIPELINE_BUFFER)
+        pipeline.start()
+
     # Game loop variables
     clock = pygame.time.Clock()
     running = True
     paused = False
-    current_fps = FPS
+    rate_index = TURN_RATES.index(TURN_RATE)
+    turn_rate = TURN_RATE
+    turn_time = 0.0  # Simulation time owed since the last turn (seconds)
+    shown_turn = game.turn_count
+    since_turn = 0.0  # Seconds since shown_turn appeared (drives the move animation)
+    game_over_reported = False
 
     print("=" * 60)
     print("AI vs AI Survival Arena - Game Started")
@@ -43,8 +159,9 @@ def main():
     print("  SPACE     - Pause/Resume")
     print("  R         - Restart game")
     print("  Q/ESC     - Quit")
-    print("  UP/DOWN   - Increase/Decrease game speed")
+    print("  UP/DOWN   - Increase/Decrease turn rate (up to unlimited)")
     print("  D         - Toggle debug mode")
+    print("  Wheel     - Zoom the board (drag to pan, F to fit)")
     print("\nAI Algorithms in Action:")
     print("  • A* Pathfinding - Ally bots navigate to resources")
     print("  • Minimax - Enemies choose optimal targets")
@@ -53,13 +170,25 @@ def main():
     print("=" * 60)
     print()
 
-    # Main game loop
+    # Main game loop: input and rendering run every frame, turns run at
+    # turn_rate independently of the frame rate
     while running:
+        frame_time = clock.tick(RENDER_FPS) / 1000.0
+        since_turn += frame_time
+
         # Event handling
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
+            # The window contents were lost (e.g. uncovered); repaint everything
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                renderer.invalidate()
+
+            # Board pan and zoom
+            if renderer.handle_event(event):
+                continue
+
             if event.type == pygame.KEYDOWN:
                 # Pause/Resume
                 if event.key == pygame.K_SPACE:
@@ -71,7 +200,11 @@ def main():
                 elif event.key == pygame.K_r:
                     print("\n>>> Game RESTARTED <<<\n")
                     game.reset()
+                    if pipeline is not None:
+                        pipeline.restart(game)
                     paused = False
+                    turn_time = 0.0
+                    game_over_reported = False
 
                 # Quit
                 elif event.key == pygame.K_q or event.key == pygame.K_ESCAPE:
@@ -79,12 +212,15 @@ def main():
 
                 # Speed controls
                 elif event.key == pygame.K_UP:
-                    current_fps = min(60, current_fps + 5)
-                    print(f"Speed increased: {current_fps} FPS")
+                    rate_index = min(len(TURN_RATES) - 1, rate_index + 1)
+                    turn_rate = TURN_RATES[rate_index]
+                    print(f"Speed increased: {format_turn_rate(turn_rate)}")
 
                 elif event.key == pygame.K_DOWN:
-                    current_fps = max(5, current_fps - 5)
-                    print(f"Speed decreased: {current_fps} FPS")
+                    rate_index = max(0, rate_index - 1)
+                    turn_rate = TURN_RATES[rate_index]
+                    turn_time = 0.0
+                    print(f"Speed decreased: {format_turn_rate(turn_rate)}")
 
                 # Debug mode
                 elif event.key == pygame.K_d:
@@ -92,54 +228,57 @@ def main():
                     status = "ON" if renderer.debug_mode else "OFF"
                     print(f"Debug mode: {status}")
 
-        # Update game state
+        # Update game state (while paused the pipeline stalls on its full buffer)
         if not paused and game.is_active():
-            game.execute_turn()
-
-            # Print turn info periodically
-            if game.turn_count % 10 == 0:
-                print(f"Turn {game.turn_count}:")
-                print(
-                    f"  Blue: HP={int(game.player1.health)}, "
-                    f"Score={game.player1.score}, "
-                    f"Action={game.player1.decision_state}"
-                )
-                print(
-                    f"  Red:  HP={int(game.player2.health)}, "
-                    f"Score={game.player2.score}, "
-                    f"Action={game.player2.decision_state}"
-                )
-                print()
+            if turn_rate is None:
+                # Fast-forward: simulate for most of the frame, then redraw
+                deadline = time.perf_counter() + FAST_FORWARD_SHARE / RENDER_FPS
+                while game.is_active():
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    state = take_turn(game, pipeline, remaining)
+                    if state is None:
+                        break
+                    game = state
+            else:
+                turn_time += frame_time
+                interval = 1.0 / turn_rate
+                turns = 0
+                while turn_time >= interval and game.is_active() and turns < MAX_TURNS_PER_FRAME:
+                    state = take_turn(game, pipeline)
+                    if state is None:
+                        break  # Worker still busy; the turn stays owed
+                    game = state
+                    turn_time -= interval
+                    turns += 1
+                turn_time = min(turn_time, interval)
+        else:
+            turn_time = 0.0
 
         # Check for game over
-        if not game.is_active() and not paused:
-            if game.turn_count > 0:  # Only print once
-                print("\n" + "=" * 60)
-                print("GAME OVER!")
-                print("=" * 60)
-                print(f"\n{game.game_over_reason}\n")
-                print("Final Stats:")
-                print(
-                    f"  Blue Team: {game.player1.score} points, "
-                    f"{int(game.player1.health)} HP"
-                )
-                print(
-                    f"  Red Team:  {game.player2.score} points, "
-                    f"{int(game.player2.health)} HP"
-                )
-                print(f"  Total Turns: {game.turn_count}")
-                print("\nPress R to restart or Q to quit")
-                print("=" * 60)
-                print()
-
-        # Render
-        renderer.render_game(game)
-
-        # Update display
-        pygame.display.flip()
-        clock.tick(current_fps)
+        if not game.is_active() and not game_over_reported:
+            game_over_reported = True
+            print_game_over(game)
+
+        # Render, sliding entities from their previous cells; the slide is
+        # shortened to fit between turns at high turn rates
+        if game.turn_count != shown_turn:
+            shown_turn = game.turn_count
+            since_turn = 0.0
+        if turn_rate is None:
+            alpha = 1.0
+        else:
+            alpha = min(1.0, since_turn / min(MOVE_ANIMATION_TIME, 1.0 / turn_rate))
+        dirty_rects = renderer.render_game(game, alpha)
+
+        # Push only the regions that changed to the display
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
 
     # Cleanup
+    if pipeline is not None:
+        pipeline.stop()
     pygame.quit()
     print("\nThanks for watching the AI battle!")
     print("Game closed.")
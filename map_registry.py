@@ -0,0 +1,346 @@
+"""
+Shared map registry for the AI vs AI Survival Arena
+Precomputes the static data of fixed maps (occupancy grid, connected
+component labels and all-pairs path distances) once, stores it in
+multiprocessing.shared_memory blocks and lets any process started from the
+owner attach to a map by its ID without copying it
+"""
+
+import atexit
+import hashlib
+import struct
+from array import array
+from multiprocessing import shared_memory
+
+# Block layout: header, occupancy bytes (1 = wall), int32 component labels
+# (-1 on walls) and a uint16 distance table indexed [goal cell][cell], with
+# cells numbered x * grid_size + y
+MAGIC = b"SAMP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")  # magic, version, grid size, obstacle count
+
+# Distance table entry for walls and cells cut off from the goal
+UNREACHABLE = 0xFFFF
+
+# Largest grid a map can be registered for. The distance table holds
+# grid_size ** 4 entries, so a 64x64 map takes 32 MiB and about 9 s to build,
+# and every path stays far below UNREACHABLE
+MAX_GRID_SIZE = 64
+
+# Shared memory block names are this prefix plus the map ID
+BLOCK_PREFIX = "arena_map_"
+
+# 4-directional movement, same order as AStarPathfinder.get_neighbors
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+def map_id(grid_size, obstacles):
+    """
+    Content ID of a map: the same grid size and walls always give the same ID.
+
+    Args:
+        grid_size: size of the grid
+        obstacles: iterable of (x, y) wall positions
+
+    Returns:
+        16 hex digit string
+    """
+    walls = sorted(set(obstacles))
+    data = array("i", [grid_size])
+    for position in walls:
+        data.extend(position)
+    return hashlib.sha1(data.tobytes()).hexdigest()[:16]
+
+
+def _layout(grid_size):
+    """Byte offsets of the occupancy grid, labels and distances, and the block size."""
+    cells = grid_size * grid_size
+    occupancy = HEADER.size
+    labels = occupancy + (cells + 3) // 4 * 4
+    distances = labels + cells * 4
+    return occupancy, labels, distances, distances + cells * cells * 2
+
+
+def _neighbor_lists(grid_size, walls):
+    """Open neighbor cells of every open cell, in A* neighbor order."""
+    neighbors = [()] * (grid_size * grid_size)
+    for x in range(grid_size):
+        for y in range(grid_size):
+            if (x, y) in walls:
+                continue
+            neighbors[x * grid_size + y] = tuple(
+                (x + dx) * grid_size + y + dy
+                for dx, dy in DIRECTIONS
+                if 0 <= x + dx < grid_size and 0 <= y + dy < grid_size and (x + dx, y + dy) not in walls
+            )
+    return neighbors
+
+
+def _fill(block, grid_size, walls):
+    """Compute a map's static data into a new block."""
+    cells = grid_size * grid_size
+    occupancy_at, labels_at, distances_at, _ = _layout(grid_size)
+    buf = block.buf
+    HEADER.pack_into(buf, 0, MAGIC, VERSION, grid_size, len(walls))
+
+    occupancy = bytearray(cells)
+    for x, y in walls:
+        occupancy[x * grid_size + y] = 1
+    buf[occupancy_at:occupancy_at + cells] = occupancy
+
+    # One breadth-first search per open cell; the first search of each
+    # component also labels it
+    neighbors = _neighbor_lists(grid_size, walls)
+    labels = array("i", [-1]) * cells
+    row = array("H", [UNREACHABLE]) * cells
+    component = 0
+    for goal in range(cells):
+        if occupancy[goal]:
+            continue
+        distance = row * 1
+        distance[goal] = 0
+        frontier = [goal]
+        step = 0
+        while frontier:
+            step += 1
+            reached = []
+            for cell in frontier:
+                for neighbor in neighbors[cell]:
+                    if distance[neighbor] == UNREACHABLE:
+                        distance[neighbor] = step
+                        reached.append(neighbor)
+            frontier = reached
+        if labels[goal] < 0:
+            for cell in range(cells):
+                if distance[cell] != UNREACHABLE:
+                    labels[cell] = component
+            component += 1
+        start = distances_at + goal * cells * 2
+        buf[start:start + cells * 2] = distance.tobytes()
+
+    unreachable = (array("H", [UNREACHABLE]) * cells).tobytes()
+    for goal in range(cells):
+        if occupancy[goal]:
+            start = distances_at + goal * cells * 2
+            buf[start:start + cells * 2] = unreachable
+    buf[labels_at:labels_at + cells * 4] = labels.tobytes()
+
+
+class SharedMap:
+    """
+    Read-only view of one map's block.
+
+    The occupancy, labels and distances attributes are memoryviews straight
+    into the shared memory, so every process reads the same physical pages.
+    """
+
+    def __init__(self, block, map_id):
+        """
+        Wrap an open shared memory block.
+
+        Args:
+            block: SharedMemory holding a map written by MapRegistry
+            map_id: the map's ID
+        """
+        magic, version, grid_size, obstacle_count = HEADER.unpack_from(block.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"shared memory block {block.name} does not hold a version {VERSION} map")
+
+        occupancy_at, labels_at, distances_at, end = _layout(grid_size)
+        cells = grid_size * grid_size
+        self.block = block
+        self.map_id = map_id
+        self.grid_size = grid_size
+        self.cells = cells
+        self.occupancy = block.buf[occupancy_at:occupancy_at + cells]
+        self.labels = block.buf[labels_at:labels_at + cells * 4].cast("i")
+        self.distances = block.buf[distances_at:end].cast("H")
+
+        self.obstacles = tuple(
+            (cell // grid_size, cell % grid_size) for cell in range(cells) if self.occupancy[cell]
+        )
+        self.obstacle_set = frozenset(self.obstacles)
+        if len(self.obstacles) != obstacle_count:
+            raise ValueError(f"shared memory block {block.name} is corrupt")
+
+    def component(self, position):
+        """Connected component label of a cell (-1 for walls)."""
+        return self.labels[position[0] * self.grid_size + position[1]]
+
+    def distance(self, start, goal):
+        """Shortest path length from start to goal, or None if there is no path."""
+        size = self.grid_size
+        distance = self.distances[(goal[0] * size + goal[1]) * self.cells + start[0] * size + start[1]]
+        return None if distance == UNREACHABLE else distance
+
+    def next_step(self, start, goal):
+        """
+        Next cell of a shortest path from start to goal (AStarPathfinder.get_next_move).
+
+        Takes the first neighbor, in A*'s neighbor order, that is one step
+        closer to the goal; among equally short paths this may pick another
+        one than A*. Stays at start when the goal is a wall or unreachable.
+        """
+        size = self.grid_size
+        x, y = start
+        row = (goal[0] * size + goal[1]) * self.cells
+        here = self.distances[row + x * size + y]
+        if here == 0 or here == UNREACHABLE:
+            return start
+        distances = self.distances
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < size and 0 <= ny < size and distances[row + nx * size + ny] == here - 1:
+                return (nx, ny)
+        return start
+
+    def close(self):
+        """Release the views and detach from the block."""
+        self.occupancy.release()
+        self.labels.release()
+        self.distances.release()
+        self.block.close()
+
+
+def _open_block(map_id):
+    """Open an existing map block."""
+    name = BLOCK_PREFIX + map_id
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching always registers the block with the
+        # resource tracker; pool workers share their owner's tracker, so the
+        # block is still only unlinked by its owner
+        return shared_memory.SharedMemory(name)
+
+
+# Maps attached by this process, by ID
+_attached = {}
+
+
+def attach(map_id):
+    """
+    Attach to a registered map (once per process; later calls are a dict lookup).
+
+    Args:
+        map_id: ID returned by MapRegistry.add
+
+    Returns:
+        SharedMap
+
+    Raises:
+        KeyError: if no registry holds the map
+    """
+    shared = _attached.get(map_id)
+    if shared is None:
+        try:
+            block = _open_block(map_id)
+        except FileNotFoundError:
+            raise KeyError(f"map {map_id} is not registered") from None
+        shared = _attached[map_id] = SharedMap(block, map_id)
+    return shared
+
+
+@atexit.register
+def _detach_all():
+    """Detach every map before the interpreter tears down the blocks."""
+    for shared in _attached.values():
+        shared.close()
+    _attached.clear()
+
+
+class MapRegistry:
+    """
+    Owner of shared map blocks.
+
+    Create the registry (and add maps) in the parent process before starting
+    workers; workers call attach(map_id) or pass map_id to SurvivalArenaGame.
+    The registry unlinks its blocks on close(), so keep it open until the
+    workers are done. Adding a map another live registry already holds
+    reuses that block.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.maps = {}
+        self._owned = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, grid_size, obstacles):
+        """
+        Register a map, computing its static data unless it is already shared.
+
+        Args:
+            grid_size: size of the grid
+            obstacles: iterable of (x, y) wall positions
+
+        Returns:
+            The map's ID
+
+        Raises:
+            ValueError: if the grid is larger than MAX_GRID_SIZE or a wall
+                lies off the grid
+        """
+        if not 1 <= grid_size <= MAX_GRID_SIZE:
+            raise ValueError(
+                f"shared maps support grids of 1 to {MAX_GRID_SIZE} cells, not {grid_size} "
+                f"(the distance table grows with grid_size ** 4)"
+            )
+        walls = set(obstacles)
+        if any(not (0 <= x < grid_size and 0 <= y < grid_size) for x, y in walls):
+            raise ValueError("obstacles must lie on the grid")
+        key = map_id(grid_size, walls)
+        if key in self.maps:
+            return key
+
+        size = _layout(grid_size)[3]
+        try:
+            block = shared_memory.SharedMemory(BLOCK_PREFIX + key, create=True, size=size)
+        except FileExistsError:
+            block = _open_block(key)
+        else:
+            try:
+                _fill(block, grid_size, walls)
+            except BaseException:
+                block.close()
+                block.unlink()
+                raise
+            self._owned.append(block.name)
+        self.maps[key] = SharedMap(block, key)
+        return key
+
+    def add_game_map(self, config, seed):
+        """
+        Register the map SurvivalArenaGame(config=config, seed=seed) generates.
+
+        Returns:
+            The map's ID
+        """
+        from game import SurvivalArenaGame
+
+        game = SurvivalArenaGame(config=config, seed=seed)
+        return self.add(game.grid_size, game.obstacle_positions)
+
+    def __getitem__(self, key):
+        return self.maps[key]
+
+    def __len__(self):
+        return len(self.maps)
+
+    def close(self):
+        """Detach from every map and unlink the blocks this registry created."""
+        for key, shared in self.maps.items():
+            cached = _attached.pop(key, None)
+            if cached is not None:
+                cached.close()
+            name = shared.block.name
+            shared.close()
+            if name in self._owned:
+                shared.block.unlink()
+        self.maps.clear()
+        self._owned.clear()
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Fuzzy rule optimizer for the AI vs AI Survival Arena
+Tunes the membership breakpoints and rule weights of a FuzzyRuleSet with a
+genetic algorithm. Candidates are scored by seeded headless games against a
+fixed opponent on a pool of worker processes, every score is kept in a
+result cache, and the best rule set is written as a profiles file that
+tournament.py and ai.profiles.load_profiles() read
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+
+from ai.fuzzy_logic import DEFAULT_RULES, DISTANCE_SCALE
+from ai.profiles import BUILTIN_PROFILES, AIProfile, PLAYER_PATHFINDERS, save_profiles
+from config import GameConfig
+from tournament import game_seed, play_game
+
+# Tuned parameters: (FuzzyRuleSet field, position in its tuple, lowest, highest,
+# step). Distances are on the DISTANCE_SCALE grid FuzzyLogic scales every
+# grid size to, so the same bounds fit any --grid-size. The saturated
+# shoulders (health 0 and 100, distance DISTANCE_SCALE, ...) stay fixed.
+# Genes are rounded to their step, so near-identical candidates share a
+# cache entry
+PARAMETERS = (
+    ("health_low", 2, 0, 100, 0.5), ("health_low", 3, 0, 100, 0.5),
+    ("health_medium", 0, 0, 100, 0.5), ("health_medium", 1, 0, 100, 0.5), ("health_medium", 2, 0, 100, 0.5),
+    ("health_high", 0, 0, 100, 0.5), ("health_high", 1, 0, 100, 0.5),
+    ("score_low", 2, 0, 100, 0.5), ("score_low", 3, 0, 100, 0.5),
+    ("score_medium", 0, 0, 100, 0.5), ("score_medium", 1, 0, 100, 0.5), ("score_medium", 2, 0, 100, 0.5),
+    ("score_high", 0, 0, 100, 0.5), ("score_high", 1, 0, 100, 0.5),
+    ("distance_near", 2, 0, DISTANCE_SCALE, 0.1), ("distance_near", 3, 0, DISTANCE_SCALE, 0.1),
+    ("distance_medium", 0, 0, DISTANCE_SCALE, 0.1), ("distance_medium", 1, 0, DISTANCE_SCALE, 0.1),
+    ("distance_medium", 2, 0, DISTANCE_SCALE, 0.1),
+    ("distance_far", 0, 0, DISTANCE_SCALE, 0.1), ("distance_far", 1, 0, DISTANCE_SCALE, 0.1),
+) + tuple(("weights", i, 0, 3, 0.05) for i in range(8))
+
+# Genetic algorithm defaults
+DEFAULT_POPULATION = 24
+DEFAULT_GENERATIONS = 20
+DEFAULT_GAMES = 20  # per candidate; consecutive games share a map with the sides swapped
+ELITE = 2  # best candidates copied unchanged into the next generation
+TOURNAMENT_SIZE = 3
+CROSSOVER_RATE = 0.9
+BLEND_ALPHA = 0.3  # BLX-alpha crossover: children range this far past their parents
+MUTATION_RATE = 0.15
+MUTATION_SCALE = 0.1  # mutation standard deviation as a share of the gene's range
+
+# Fitness bonus for a lead of the full win score, breaking ties between
+# candidates with the same points
+SCORE_TIEBREAK = 0.1
+
+CACHE_VERSION = 2  # 2: fuzzy distances scaled to the grid size
+
+
+def encode(rules):
+    """Get the tuned parameters of a rule set as a gene vector."""
+    return [getattr(rules, field)[position] for field, position, _, _, _ in PARAMETERS]
+
+
+def decode(vector):
+    """
+    Build a rule set from a gene vector.
+
+    Genes are clipped to their range and rounded to the gene step, and each
+    membership function's breakpoints are sorted, so every vector decodes
+    to a valid FuzzyRuleSet.
+    """
+    values = {field: list(getattr(DEFAULT_RULES, field)) for field, _, _, _, _ in PARAMETERS}
+    for (field, position, low, high, step), gene in zip(PARAMETERS, vector):
+        values[field][position] = quantize(gene, low, high, step)
+    return DEFAULT_RULES.with_changes(**{
+        field: tuple(value if field == "weights" else sorted(value))
+        for field, value in values.items()
+    })
+
+
+def quantize(gene, low, high, step):
+    """Clip a gene to its range and round it to a multiple of its step."""
+    return round(round(min(high, max(low, gene)) / step) * step, 6)
+
+
+def normalize(vector):
+    """The canonical form of a gene vector (what decode() would produce), as a tuple."""
+    return tuple(encode(decode(vector)))
+
+
+# Worker process state, set once by _init_worker instead of sent with every task
+_worker_opponent = None
+_worker_config = None
+_worker_pathfinder = None
+
+
+def _init_worker(opponent, config, pathfinder):
+    """Pool initializer: keep the opponent and arena config for the tasks."""
+    global _worker_opponent, _worker_config, _worker_pathfinder
+    _worker_opponent = opponent
+    _worker_config = config
+    _worker_pathfinder = pathfinder
+
+
+def _play_candidate(task):
+    """
+    Worker task: play one game of a candidate against the opponent.
+
+    Args:
+        task: (gene vector, seed, game index)
+
+    Returns:
+        The candidate's result (1, 0.5 or 0) plus the score tie-break
+    """
+    vector, seed, game = task
+    candidate = AIProfile(decode(vector), _worker_pathfinder)
+    result, score, opponent_score, _ = play_game(
+        candidate, _worker_opponent, _worker_config,
+        game_seed(seed, 0, "candidate", "opponent", game), game % 2 == 0,
+    )
+    return result + SCORE_TIEBREAK * (score - opponent_score) / _worker_config.win_score
+
+
+class GeneticOptimizer:
+    """
+    Genetic algorithm over FuzzyRuleSet parameters.
+
+    A candidate's fitness is its share of points (draws count half) over
+    ``games`` seeded games against the opponent, plus SCORE_TIEBREAK times
+    its mean score lead as a share of the win score. Every candidate plays the
+    same seeds, so fitness differences come from the rules rather than the
+    maps, and equal candidates always score the same: scores are cached by
+    gene vector and, with a cache file, kept across runs. Rerunning with the
+    same settings replays the search from the cache without playing a game.
+    """
+
+    def __init__(self, opponent=None, config=None, games=DEFAULT_GAMES, population=DEFAULT_POPULATION,
+                 seed=0, pathfinder="astar", cache=None, jobs=None):
+        """
+        Initialize the optimizer.
+
+        Args:
+            opponent: AIProfile every candidate plays against (default: the default profile)
+            config: GameConfig of the arena
+            games: games per evaluation (even, so each map is played from both sides)
+            population: candidates per generation
+            seed: seed of the search and of the evaluation games
+            pathfinder: pathfinder of the candidate profiles
+            cache: JSON-lines file to keep fitness scores in across runs
+            jobs: worker processes (default: one per CPU; 1 plays in this process)
+        """
+        self.opponent = opponent if opponent is not None else BUILTIN_PROFILES["default"]
+        self.config = config if config is not None else GameConfig()
+        self.games = games
+        self.population = population
+        self.seed = seed
+        self.pathfinder = pathfinder
+        self.jobs = jobs or os.cpu_count() or 1
+        self.rng = random.Random(seed)
+        self.cache_path = cache
+        self.cache = {}
+        self.evaluations = 0  # candidates actually played (cache misses)
+        self.cache_hits = 0
+        self._pool = None
+
+        if cache is not None:
+            self._open_cache()
+
+    def _header(self):
+        """First cache line: everything a fitness score depends on."""
+        return {
+            "version": CACHE_VERSION,
+            "seed": self.seed,
+            "games": self.games,
+            "pathfinder": self.pathfinder,
+            "config": asdict(self.config),
+            "opponent": self.opponent.to_dict(),
+        }
+
+    def _open_cache(self):
+        """Load the scores of earlier runs, or start a new cache file."""
+        header = self._header()
+        try:
+            with open(self.cache_path) as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            lines = []
+
+        if not lines:
+            with open(self.cache_path, "w") as f:
+                f.write(json.dumps(header) + "\n")
+            return
+
+        if json.loads(lines[0]) != json.loads(json.dumps(header)):
+            raise ValueError(f"{self.cache_path} was written for other evaluation settings")
+        kept = 1
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:  # last line cut off by an interrupted run
+                break
+            self.cache[tuple(entry["genes"])] = entry["fitness"]
+            kept += 1
+
+        # Drop a partial last line so new entries start on a line of their own
+        with open(self.cache_path, "w") as f:
+            f.write("\n".join(lines[:kept]) + "\n")
+
+    def __enter__(self):
+        if self.jobs > 1:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.jobs, initializer=_init_worker,
+                initargs=(self.opponent, self.config, self.pathfinder),
+            )
+        else:
+            _init_worker(self.opponent, self.config, self.pathfinder)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def evaluate(self, vectors, seed=None):
+        """
+        Score gene vectors, playing only those not in the cache.
+
+        Args:
+            vectors: gene vectors
+            seed: evaluation seed (default: the optimizer's; other seeds
+                are not cached, e.g. for a held-out check)
+
+        Returns:
+            List of fitness values (about 0.5 for a match for the opponent)
+        """
+        cached = seed is None
+        seed = self.seed if seed is None else seed
+        keys = [normalize(vector) for vector in vectors]
+        missing = list(dict.fromkeys(key for key in keys if not cached or key not in self.cache))
+        self.cache_hits += sum(1 for key in keys if cached and key in self.cache)
+
+        if missing:
+            tasks = [(key, seed, game) for key in missing for game in range(self.games)]
+            if self._pool is None:
+                results = list(map(_play_candidate, tasks))
+            else:
+                chunk = max(1, len(tasks) // (self.jobs * 4))
+                results = list(self._pool.map(_play_candidate, tasks, chunksize=chunk))
+
+            scores = {}
+            for i, key in enumerate(missing):
+                scores[key] = sum(results[i * self.games:(i + 1) * self.games]) / self.games
+            self.evaluations += len(missing)
+            if not cached:
+                return [scores[key] for key in keys]
+
+            self.cache.update(scores)
+            if self.cache_path is not None:
+                with open(self.cache_path, "a") as f:
+                    f.write("".join(
+                        json.dumps({"genes": list(key), "fitness": score}) + "\n"
+                        for key, score in scores.items()
+                    ))
+        return [self.cache[key] for key in keys]
+
+    def _random_vector(self, center=None, scale=1.0):
+        """A vector drawn around center (or uniformly over every range when None)."""
+        vector = []
+        for i, (_, _, low, high, _) in enumerate(PARAMETERS):
+            if center is None:
+                vector.append(self.rng.uniform(low, high))
+            else:
+                vector.append(center[i] + self.rng.gauss(0, scale * MUTATION_SCALE * (high - low)))
+        return list(normalize(vector))
+
+    def _select(self, ranked):
+        """Tournament selection from (fitness, vector) pairs sorted best first."""
+        picks = [self.rng.randrange(len(ranked)) for _ in range(TOURNAMENT_SIZE)]
+        return ranked[min(picks)][1]
+
+    def _child(self, ranked):
+        """Breed one child by BLX-alpha crossover and Gaussian mutation."""
+        mother = self._select(ranked)
+        father = self._select(ranked)
+        child = []
+        for i, (_, _, low, high, _) in enumerate(PARAMETERS):
+            gene = mother[i]
+            if self.rng.random() < CROSSOVER_RATE:
+                lo, hi = sorted((mother[i], father[i]))
+                spread = (hi - lo) * BLEND_ALPHA
+                gene = self.rng.uniform(lo - spread, hi + spread)
+            if self.rng.random() < MUTATION_RATE:
+                gene += self.rng.gauss(0, MUTATION_SCALE * (high - low))
+            child.append(gene)
+        return list(normalize(child))
+
+    def run(self, generations=DEFAULT_GENERATIONS, start=None, progress=None):
+        """
+        Run the search.
+
+        The first generation holds the starting rule set, half mutated
+        copies of it and half uniformly random candidates; elitism keeps the
+        best score from ever dropping.
+
+        Args:
+            generations: generations to breed
+            start: FuzzyRuleSet to start from (default: DEFAULT_RULES)
+            progress: optional callback(generation, best fitness, mean fitness)
+
+        Returns:
+            Tuple of (best FuzzyRuleSet, its fitness)
+        """
+        center = list(normalize(encode(start if start is not None else DEFAULT_RULES)))
+        population = [center] + [
+            self._random_vector(center if i % 2 == 0 else None) for i in range(self.population - 1)
+        ]
+
+        ranked = []
+        for generation in range(generations):
+            fitness = self.evaluate(population)
+            ranked = sorted(zip(fitness, population), key=lambda pair: -pair[0])
+            if progress is not None:
+                progress(generation, ranked[0][0], sum(fitness) / len(fitness))
+            if generation == generations - 1:
+                break
+            population = [vector for _, vector in ranked[:ELITE]]
+            while len(population) < self.population:
+                population.append(self._child(ranked))
+
+        best_fitness, best = ranked[0]
+        return decode(best), best_fitness
+
+
+def main():
+    """Optimizer command."""
+    parser = argparse.ArgumentParser(description="Tune the fuzzy rule breakpoints and weights.")
+    parser.add_argument("--generations", type=int, default=DEFAULT_GENERATIONS)
+    parser.add_argument("--population", type=int, default=DEFAULT_POPULATION)
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="games per candidate")
+    parser.add_argument("--opponent", default="default", choices=sorted(BUILTIN_PROFILES))
+    parser.add_argument("--pathfinder", default="astar", choices=PLAYER_PATHFINDERS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--cache", help="fitness cache file to reuse and extend")
+    parser.add_argument("--grid-size", type=int, default=GameConfig.grid_size)
+    parser.add_argument("--enemies", type=int, default=GameConfig.max_enemies)
+    parser.add_argument("--output", default="tuned_profile.json", help="profiles file to write")
+    parser.add_argument("--name", default="tuned", help="profile name in the output file")
+    args = parser.parse_args()
+
+    config = GameConfig(grid_size=args.grid_size, max_enemies=args.enemies)
+    try:
+        optimizer = GeneticOptimizer(
+            BUILTIN_PROFILES[args.opponent], config, args.games, args.population, args.seed,
+            args.pathfinder, args.cache, args.jobs,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+
+    def progress(generation, best, mean):
+        print(
+            f"  generation {generation + 1:3d}: best {best:.3f}  mean {mean:.3f}  "
+            f"({optimizer.evaluations} evaluated, {optimizer.cache_hits} cached, "
+            f"{time.perf_counter() - start:.0f} s)",
+            flush=True,
+        )
+
+    with optimizer:
+        rules, fitness = optimizer.run(args.generations, progress=progress)
+        # Fresh seeds show how much of the gain is fitting the training maps
+        held_out = optimizer.evaluate([encode(rules), encode(DEFAULT_RULES)], seed=args.seed + 1)
+
+    save_profiles(args.output, {args.name: AIProfile(rules, args.pathfinder)})
+    print(
+        f"\nBest fitness vs {args.opponent}: {fitness:.3f} on the training seeds, "
+        f"{held_out[0]:.3f} on fresh seeds (default rules: {held_out[1]:.3f})"
+    )
+    print(f"Wrote profile '{args.name}' to {args.output}; compare it with:")
+    print(f"  python3 tournament.py --profiles {args.output} {args.name} {args.opponent}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
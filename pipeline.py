@@ -0,0 +1,122 @@
+"""
+Background turn computation for the AI vs AI Survival Arena
+Runs execute_turn on a worker thread, one turn ahead of the display, and
+hands finished game states to the render loop through a bounded buffer
+"""
+
+import queue
+import threading
+import time
+
+
+class TurnPipeline:
+    """
+    Precomputes turns of a game on a worker thread.
+
+    The worker plays a fork of the game and publishes an independent fork
+    after every turn, so the renderer never shares a game object with the
+    simulation. The buffer holds at most ``buffer_size`` finished turns; a
+    consumer that stops taking states (pause) stalls the worker once the
+    buffer is full. restart() bumps a generation counter so turns computed
+    for the previous game are discarded rather than shown.
+    """
+
+    def __init__(self, game, buffer_size=2):
+        """
+        Initialize the pipeline (the worker starts with start()).
+
+        Args:
+            game: SurvivalArenaGame to continue from; it is forked, not modified
+            buffer_size: finished turns kept ahead of the display
+        """
+        self._buffer = queue.Queue(maxsize=buffer_size)
+        self._changed = threading.Condition()
+        self._generation = 0
+        self._simulation = game.fork()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="turn-pipeline", daemon=True)
+
+    def start(self):
+        """Start the worker thread."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker and wait for its current turn to finish."""
+        with self._changed:
+            self._stopped = True
+            self._changed.notify_all()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def restart(self, game):
+        """
+        Continue from another game state, discarding all pending turns.
+
+        Args:
+            game: SurvivalArenaGame to continue from (forked)
+        """
+        with self._changed:
+            self._generation += 1
+            self._simulation = game.fork()
+            self._drain()
+            self._changed.notify_all()
+
+    def next_state(self, timeout=0.0):
+        """
+        Take the next finished turn.
+
+        Args:
+            timeout: seconds to wait for the worker (0 = don't block)
+
+        Returns:
+            SurvivalArenaGame one turn after the previous state, or None if
+            the worker hasn't finished it in time
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    generation, state = self._buffer.get(timeout=remaining)
+                else:
+                    generation, state = self._buffer.get_nowait()
+            except queue.Empty:
+                return None
+            if generation == self._generation:
+                return state
+
+    def pending(self):
+        """Number of finished turns waiting in the buffer."""
+        return self._buffer.qsize()
+
+    def _drain(self):
+        """Drop everything in the buffer."""
+        while True:
+            try:
+                self._buffer.get_nowait()
+            except queue.Empty:
+                return
+
+    def _run(self):
+        """Worker loop: play turns and publish them until stopped."""
+        while True:
+            with self._changed:
+                while not self._stopped and not self._simulation.is_active():
+                    self._changed.wait()
+                if self._stopped:
+                    return
+                generation = self._generation
+                simulation = self._simulation
+
+            simulation.execute_turn()
+            state = simulation.fork()
+
+            # Wait for room in the buffer, giving up if the game was
+            # restarted (or the pipeline stopped) in the meantime
+            while True:
+                try:
+                    self._buffer.put((generation, state), timeout=0.05)
+                    break
+                except queue.Full:
+                    if self._stopped or generation != self._generation:
+                        break
@@ -0,0 +1,212 @@
+"""
+Opt-in turn profiler for the AI vs AI Survival Arena
+Times every phase of SurvivalArenaGame.execute_turn and every ally and
+enemy update into a fixed-size ring buffer, summarizes the durations as
+percentiles and exports Chrome trace-event JSON (chrome://tracing, Perfetto)
+"""
+
+import json
+import time
+from array import array
+
+
+# Phase names in execute_turn order
+PHASES = (
+    "player1",
+    "player2",
+    "allies",
+    "enemies",
+    "collisions",
+    "spawn",
+    "turn_counter",
+    "game_over",
+)
+
+# Span categories
+TURN = "turn"
+PHASE = "phase"
+AGENT = "agent"
+
+# Marker for spans that don't belong to a single agent
+NO_AGENT = -1
+
+
+class TurnProfiler:
+    """
+    Ring buffer of timed spans recorded while a game runs.
+
+    Attach it with ``game.profiler = TurnProfiler()``; games without a
+    profiler only pay for an ``is not None`` check per phase.
+    """
+
+    def __init__(self, capacity=65536):
+        """
+        Initialize an empty profiler.
+
+        Args:
+            capacity: number of spans kept; older spans are overwritten
+        """
+        self.capacity = capacity
+        self.count = 0
+
+        # One slot per span, reused round-robin
+        self._names = [None] * capacity
+        self._categories = [None] * capacity
+        self._turns = array("q", bytes(8 * capacity))
+        self._agents = array("q", bytes(8 * capacity))
+        self._starts = array("q", bytes(8 * capacity))
+        self._durations = array("q", bytes(8 * capacity))
+
+        self._turn = 0
+        self._turn_start = 0
+        self._phase_start = 0
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def _record(self, name, category, start, end, agent=NO_AGENT):
+        """Store one span, overwriting the oldest when the buffer is full."""
+        slot = self.count % self.capacity
+        self._names[slot] = name
+        self._categories[slot] = category
+        self._turns[slot] = self._turn
+        self._agents[slot] = agent
+        self._starts[slot] = start
+        self._durations[slot] = end - start
+        self.count += 1
+
+    def start_turn(self, turn):
+        """Begin timing a turn (called at the top of execute_turn)."""
+        self._turn = turn
+        self._turn_start = self._phase_start = time.perf_counter_ns()
+
+    def end_phase(self, name):
+        """Close the phase that started at the previous mark."""
+        now = time.perf_counter_ns()
+        self._record(name, PHASE, self._phase_start, now)
+        self._phase_start = now
+
+    def end_turn(self):
+        """Close the whole-turn span."""
+        self._record(TURN, TURN, self._turn_start, time.perf_counter_ns())
+
+    def record_agent(self, kind, index, start):
+        """
+        Record one agent's update.
+
+        Args:
+            kind: "ally" or "enemy"
+            index: position of the agent in its game list
+            start: clock() value taken before the update
+        """
+        self._record(kind, AGENT, start, time.perf_counter_ns(), index)
+
+    def clear(self):
+        """Drop every recorded span."""
+        self.count = 0
+
+    def spans(self):
+        """
+        Get the buffered spans, oldest first.
+
+        Returns:
+            List of (name, category, turn, agent, start ns, duration ns)
+        """
+        size = min(self.count, self.capacity)
+        first = self.count - size
+        result = []
+        for i in range(first, self.count):
+            slot = i % self.capacity
+            result.append((
+                self._names[slot],
+                self._categories[slot],
+                self._turns[slot],
+                self._agents[slot],
+                self._starts[slot],
+                self._durations[slot],
+            ))
+        return result
+
+    def summary(self):
+        """
+        Summarize span durations by name.
+
+        Returns:
+            Dict of name -> {"category", "count", "mean", "p50", "p95", "p99",
+            "max", "total"} with times in microseconds
+        """
+        durations = {}
+        categories = {}
+        for name, category, _, _, _, duration in self.spans():
+            durations.setdefault(name, []).append(duration)
+            categories[name] = category
+
+        result = {}
+        for name, values in durations.items():
+            values.sort()
+            total = sum(values)
+            result[name] = {
+                "category": categories[name],
+                "count": len(values),
+                "mean": total / len(values) / 1000.0,
+                "p50": _percentile(values, 50) / 1000.0,
+                "p95": _percentile(values, 95) / 1000.0,
+                "p99": _percentile(values, 99) / 1000.0,
+                "max": values[-1] / 1000.0,
+                "total": total / 1000.0,
+            }
+        return result
+
+    def format_summary(self):
+        """Render summary() as a text table, phases in turn order."""
+        stats = self.summary()
+        order = [TURN, *PHASES, "ally", "enemy"]
+        names = [n for n in order if n in stats] + sorted(set(stats) - set(order))
+
+        turn_total = stats[TURN]["total"] if TURN in stats else 0.0
+        lines = [
+            f"{'span':<14}{'count':>8}{'p50 us':>10}{'p95 us':>10}"
+            f"{'p99 us':>10}{'max us':>10}{'% turn':>8}"
+        ]
+        for name in names:
+            s = stats[name]
+            share = 100.0 * s["total"] / turn_total if turn_total and s["category"] != TURN else 100.0
+            lines.append(
+                f"{name:<14}{s['count']:>8}{s['p50']:>10.1f}{s['p95']:>10.1f}"
+                f"{s['p99']:>10.1f}{s['max']:>10.1f}{share:>8.1f}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """
+        Build a Chrome trace-event document of the buffered spans.
+
+        Returns:
+            Dict ready for json.dump (complete "X" events, microseconds)
+        """
+        events = []
+        for name, category, turn, agent, start, duration in self.spans():
+            args = {"turn": turn}
+            if agent != NO_AGENT:
+                args["agent"] = agent
+            events.append({
+                "name": name if agent == NO_AGENT else f"{name} {agent}",
+                "cat": category,
+                "ph": "X",
+                "ts": start / 1000.0,
+                "dur": duration / 1000.0,
+                "pid": 1,
+                "tid": 1,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        """Write chrome_trace() to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[rank - 1]
@@ -5,10 +5,16 @@ Modern UI design with custom PNG assets
 
 import pygame
 import math
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up building the low-zoom wall layer
+    np = None
+
 from constants import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
-    GRID_SIZE,
     CELL_SIZE,
     GRID_WIDTH,
     GRID_HEIGHT,
@@ -16,9 +22,78 @@ from constants import (
     GRID_OFFSET_Y,
     SIDEBAR_X,
     COLORS,
-    MAX_HEALTH,
 )
 from assets import get_assets
+from camera import Camera, SpatialIndex
+from ai.metrics import METRICS
+
+
+# Rendered text surfaces kept by TextCache
+TEXT_CACHE_SIZE = 256
+
+# Board area on screen; the clip has one extra pixel for the closing grid line
+BOARD_RECT = pygame.Rect(GRID_OFFSET_X, GRID_OFFSET_Y, GRID_WIDTH, GRID_HEIGHT)
+BOARD_CLIP = pygame.Rect(GRID_OFFSET_X, GRID_OFFSET_Y, GRID_WIDTH + 1, GRID_HEIGHT + 1)
+
+# Below this many pixels per cell the board is drawn as one color per cell
+LOD_CELL_SIZE = 4
+
+
+class TextCache:
+    """
+    Bounded LRU cache of rendered text surfaces.
+
+    Entries are keyed by (font, text, antialias, color). The returned
+    surfaces are shared, so callers must blit them and not draw on them.
+    """
+
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity: most surfaces kept; the least recently used is dropped
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, antialias, color):
+        """Get the surface for a string, rendering it only on a miss."""
+        key = (font, text, antialias, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color)
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def invalidate(self, font=None):
+        """
+        Drop cached surfaces.
+
+        Args:
+            font: only drop surfaces rendered with this font (None = all)
+        """
+        if font is None:
+            self._surfaces.clear()
+            return
+        for key in [key for key in self._surfaces if key[0] is font]:
+            del self._surfaces[key]
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._surfaces)
 
 
 class GameRenderer:
@@ -32,17 +107,257 @@ class GameRenderer:
         # Load all game assets (images)
         self.assets = get_assets()
 
-        # Initialize fonts
+        # Initialize fonts; rendered strings are cached, since nearly all
+        # text is the same from frame to frame
         pygame.font.init()
-        self.title_font = pygame.font.Font(None, 64)
-        self.card_title_font = pygame.font.Font(None, 28)
-        self.card_value_font = pygame.font.Font(None, 56)
-        self.text_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
-        self.legend_font = pygame.font.Font(None, 26)
-
-    def render_game(self, game):
-        """Render the entire game state."""
+        self.text_cache = TextCache()
+        self.load_fonts()
+
+        # Board layout (depends on the grid size of the game being drawn
+        # and on the camera, which pans and zooms the board view)
+        self.camera = Camera(GRID_WIDTH, GRID_HEIGHT)
+        self.grid_size = None
+        self.cell_size = CELL_SIZE
+        self.board_size = 0
+        self.lod = False
+        self._layout_key = None
+        self._scaled_sprites = {}
+        self._dragging = False
+
+        # Pixel centers of each grid column/row (rebuilt with the layout)
+        self._pixel_x = []
+        self._pixel_y = []
+
+        # Spatial indexes of the entities, rebuilt once per turn
+        self._index_state = None
+        self._indexes = {}
+        self._visible_state = None
+        self._visible = None
+        self._obstacle_index_positions = None
+        self._obstacle_index_cache = None
+
+        # Low-zoom board: one pixel per cell, scaled up to the cell size
+        self._lod_walls = None
+        self._lod_walls_obstacles = None
+        self._lod_state = None
+        self._lod_image = None
+
+        # Positions of moving entities, keyed by (kind, index), at the
+        # previous and current turn; sprites are tweened between the two
+        self._motion_turn = None
+        self._from_positions = {}
+        self._to_positions = {}
+
+        # Cached static layers (see _background)
+        self._chrome = None
+        self._background_surface = None
+        self._background_obstacles = None
+        self._overlay = None
+
+        # What is on screen now, for dirty-rect updates (see render_game)
+        self._full_redraw = True
+        self._shown_background = None
+        self._shown_widgets = []
+        self._shown_sprites = []
+        self._shown_game_over = None
+
+    def load_fonts(self, path=None):
+        """
+        (Re)create the UI fonts, dropping text rendered with the old ones.
+
+        Args:
+            path: font file to use (None = pygame's default font)
+        """
+        self.title_font = pygame.font.Font(path, 64)
+        self.card_title_font = pygame.font.Font(path, 28)
+        self.card_value_font = pygame.font.Font(path, 56)
+        self.text_font = pygame.font.Font(path, 32)
+        self.small_font = pygame.font.Font(path, 24)
+        self.legend_font = pygame.font.Font(path, 26)
+
+        self.text_cache.invalidate()
+        self._chrome = None
+
+    def _text(self, font, text, color):
+        """Get an antialiased text surface from the cache."""
+        return self.text_cache.render(font, text, True, color)
+
+    def render_game(self, game, alpha=1.0):
+        """
+        Render the game state, redrawing only what changed since the last frame.
+
+        Args:
+            game: game (or replay state) to draw
+            alpha: progress of the animation from the previous turn's
+                positions (0.0) to the current ones (1.0)
+
+        Returns:
+            List of screen rects that were redrawn, for pygame.display.update
+        """
+        self._update_layout(game.config.grid_size)
+        self._track_motion(game)
+
+        # Static layers: window chrome, grid, legend and walls (cached)
+        background = self._background(game)
+
+        # Widgets are (draw method, arguments) pairs; the first four
+        # arguments are the widget's rect and all of them are its change key
+        widgets = []
+        self._stat_card_widgets(game, widgets)
+        self._sidebar_widgets(game, widgets)
+        if self.lod:
+            widgets.append((self._draw_board_image, (*BOARD_RECT, *self._lod_board(game))))
+
+        # The game-over screen is drawn once, with everything in its final place
+        game_over = None if game.is_active() else (game.turn_count, game.game_over_reason)
+        if game_over is not None:
+            alpha = 1.0
+
+        sprites = []
+        self._place_entities(game, alpha, sprites)
+        full = (
+            self._full_redraw
+            or background is not self._shown_background
+            or len(widgets) != len(self._shown_widgets)
+            or game_over != self._shown_game_over
+        )
+
+        if full:
+            self.screen.blit(background, (0, 0))
+            for draw, args in widgets:
+                draw(*args)
+            self.screen.set_clip(BOARD_CLIP)
+            for image, x, y in sprites:
+                self.screen.blit(image, (x, y))
+            self.screen.set_clip(None)
+            if game_over is not None:
+                self._draw_game_over(game)
+            dirty = [self.screen.get_rect()]
+        elif game_over is not None:
+            dirty = []
+        else:
+            dirty = self._redraw_changes(background, widgets, sprites)
+
+        self._full_redraw = False
+        self._shown_background = background
+        self._shown_widgets = widgets
+        self._shown_sprites = sprites
+        self._shown_game_over = game_over
+        return dirty
+
+    def _redraw_changes(self, background, widgets, sprites):
+        """Redraw changed widgets and the grid areas where sprites changed."""
+        screen = self.screen
+        dirty = []
+
+        for widget, shown in zip(widgets, self._shown_widgets):
+            if widget != shown:
+                draw, args = widget
+                rect = pygame.Rect(args[:4])
+                screen.blit(background, rect, rect)
+                draw(*args)
+                dirty.append(rect)
+
+        # Every sprite that appeared, vanished or moved dirties its area
+        changed = set(sprites).symmetric_difference(self._shown_sprites)
+        if changed:
+            sprite_rects = [image.get_rect(topleft=(x, y)) for image, x, y in sprites]
+            for image, x, y in changed:
+                area = image.get_rect(topleft=(x, y)).clip(BOARD_CLIP)
+                if not area:
+                    continue
+                screen.set_clip(area)
+                screen.blit(background, area, area)
+                for i in area.collidelistall(sprite_rects):
+                    screen.blit(sprites[i][0], sprite_rects[i])
+                dirty.append(area)
+            screen.set_clip(None)
+
+        return dirty
+
+    def invalidate(self):
+        """Redraw the whole window on the next frame (e.g. after an expose event)."""
+        self._full_redraw = True
+
+    def handle_event(self, event):
+        """
+        Pan (left-button drag) and zoom (mouse wheel) the board; F fits it again.
+
+        Args:
+            event: pygame event from the main loop
+
+        Returns:
+            True if the event moved the camera (or started/ended a drag)
+        """
+        camera = self.camera
+        if event.type == pygame.MOUSEWHEEL:
+            x, y = pygame.mouse.get_pos()
+            if not BOARD_RECT.collidepoint(x, y):
+                return False
+            camera.zoom(event.y, (x - GRID_OFFSET_X, y - GRID_OFFSET_Y))
+            return True
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self._dragging = BOARD_RECT.collidepoint(event.pos)
+            return self._dragging
+
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self._dragging:
+            self._dragging = False
+            return True
+
+        if event.type == pygame.MOUSEMOTION and self._dragging:
+            camera.pan(*event.rel)
+            return True
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_f and camera.grid_size:
+            camera.fit(camera.grid_size)
+            return True
+
+        return False
+
+    def _background(self, game):
+        """
+        Get the static part of the frame for a game.
+
+        The window chrome, grid container, info card, restart button and
+        legend are drawn once; the grid lines and walls in view are added on
+        top and redrawn only when the camera moves or the game's obstacles
+        change (i.e. once per setup_game).
+        """
+        if self._chrome is None:
+            self._chrome = self._render_layer(self._draw_chrome)
+            self._background_surface = None
+
+        obstacles = game.obstacle_positions
+        cached = self._background_obstacles
+        if self._background_surface is None or (obstacles is not cached and obstacles != cached):
+            self._background_surface = self._chrome.copy()
+            self._render_layer(lambda: self._draw_board(game), self._background_surface)
+            self._background_obstacles = obstacles
+        return self._background_surface
+
+    def _draw_board(self, game):
+        """Draw the static part of the board in view (walls come from the LOD image at low zoom)."""
+        self.screen.set_clip(BOARD_CLIP)
+        self._draw_grid_lines()
+        if not self.lod:
+            self._draw_obstacles(game)
+        self.screen.set_clip(None)
+
+    def _render_layer(self, draw, surface=None):
+        """Run draw methods against an offscreen surface instead of the screen."""
+        if surface is None:
+            surface = pygame.Surface(self.screen.get_size()).convert()
+        screen = self.screen
+        self.screen = surface
+        try:
+            draw()
+        finally:
+            self.screen = screen
+        return surface
+
+    def _draw_chrome(self):
+        """Draw everything that stays the same for the whole game."""
         # Clear screen with background
         self.screen.fill(COLORS["background"])
 
@@ -52,19 +367,102 @@ class GameRenderer:
         # Draw title
         self._draw_title()
 
-        # Draw stat cards
-        self._draw_stat_cards(game)
-
-        # Draw grid
+        # Draw grid (the lines depend on the camera, see _draw_board)
         self._draw_grid_container()
-        self._draw_grid(game)
 
-        # Draw sidebar
-        self._draw_sidebar(game)
+        # Sidebar info, restart button and legend
+        y_offset = 380
+        self._draw_info_card(SIDEBAR_X, y_offset, 620)
+        y_offset += 100
+        self._draw_restart_button(SIDEBAR_X + 200, y_offset)
+        y_offset += 100
+        self._draw_legend(SIDEBAR_X, y_offset)
+
+    def _update_layout(self, grid_size):
+        """Lay the grid out for the camera, fitting a new grid size into the board area."""
+        camera = self.camera
+        if grid_size != self.grid_size:
+            self.grid_size = grid_size
+            camera.fit(grid_size)
+            self._motion_turn = None
 
-        # Draw game over screen if applicable
-        if not game.is_active():
-            self._draw_game_over(game)
+        if camera.key == self._layout_key:
+            return
+
+        self._layout_key = camera.key
+        if camera.cell_size != self.cell_size:
+            self.cell_size = camera.cell_size
+            self._scaled_sprites = {}
+        self.board_size = camera.board_size
+        self.lod = self.cell_size < LOD_CELL_SIZE
+
+        cell = self.cell_size
+        left = GRID_OFFSET_X - camera.left + cell // 2
+        top = GRID_OFFSET_Y - camera.top + cell // 2
+        self._pixel_x = [left + x * cell for x in range(grid_size)]
+        self._pixel_y = [top + y * cell for y in range(grid_size)]
+        self._background_surface = None
+
+    def _track_motion(self, game):
+        """Remember where moving entities were on the previous turn."""
+        turn = game.turn_count
+        if turn == self._motion_turn:
+            return
+
+        positions = {("player", 0): game.player1.position, ("player", 1): game.player2.position}
+        for i, ally in enumerate(game.allies):
+            positions[("ally", i)] = ally.position
+        for i, enemy in enumerate(game.enemies):
+            positions[("enemy", i)] = enemy.position
+
+        # Only animate single-turn steps; restarts and seeks jump straight there
+        if self._motion_turn is not None and turn == self._motion_turn + 1:
+            self._from_positions = self._to_positions
+        else:
+            self._from_positions = positions
+        self._to_positions = positions
+        self._motion_turn = turn
+
+    def _tween(self, key, position, alpha):
+        """Pixel center of a moving entity, interpolated from its previous cell."""
+        pixel_x = self._pixel_x
+        pixel_y = self._pixel_y
+        previous = self._from_positions.get(key, position)
+        if alpha >= 1.0 or previous == position:
+            return pixel_x[position[0]], pixel_y[position[1]]
+
+        from_x = pixel_x[previous[0]]
+        from_y = pixel_y[previous[1]]
+        return (
+            round(from_x + (pixel_x[position[0]] - from_x) * alpha),
+            round(from_y + (pixel_y[position[1]] - from_y) * alpha),
+        )
+
+    def _blit_centered(self, image, x, y):
+        """Blit an image centered on a pixel."""
+        self.screen.blit(image, (x - image.get_width() // 2, y - image.get_height() // 2))
+
+    @staticmethod
+    def _place(sprites, image, x, y):
+        """Queue an image centered on a pixel as an (image, left, top) sprite."""
+        sprites.append((image, x - image.get_width() // 2, y - image.get_height() // 2))
+
+    def _sprite(self, name):
+        """Get an entity image scaled to the current cell size."""
+        image = self.assets.get_entity(name)
+        if image is None or self.cell_size == CELL_SIZE:
+            return image
+
+        scaled = self._scaled_sprites.get(name)
+        if scaled is None:
+            width, height = image.get_size()
+            size = (
+                max(1, width * self.cell_size // CELL_SIZE),
+                max(1, height * self.cell_size // CELL_SIZE),
+            )
+            scaled = pygame.transform.smoothscale(image, size)
+            self._scaled_sprites[name] = scaled
+        return scaled
 
     def _draw_border(self):
         """Draw the rounded border around the screen."""
@@ -82,12 +480,12 @@ class GameRenderer:
 
         # Title text
         title_text = "Survival Arena"
-        text_surface = self.title_font.render(title_text, True, COLORS["title_blue"])
+        text_surface = self._text(self.title_font, title_text, COLORS["title_blue"])
         text_rect = text_surface.get_rect(center=(WINDOW_WIDTH // 2 + 50, 50))
         self.screen.blit(text_surface, text_rect)
 
-    def _draw_stat_cards(self, game):
-        """Draw the stat cards at the top."""
+    def _stat_card_widgets(self, game, widgets):
+        """Queue the stat cards at the top as widgets."""
         card_y = 90
         card_height = 70
         card_width = 320
@@ -98,31 +496,31 @@ class GameRenderer:
         start_x = (WINDOW_WIDTH - total_width) // 2
 
         # Card 1: Turn
-        self._draw_card(
+        widgets.append((self._draw_card, (
             start_x, card_y, card_width, card_height,
             COLORS["card_purple"], "Turn", str(game.turn_count), "clock"
-        )
+        )))
 
         # Card 2: Player 1 Health
-        self._draw_card(
+        widgets.append((self._draw_card, (
             start_x + card_width + gap, card_y, card_width, card_height,
             COLORS["card_purple"], f"{game.player1.team} Health",
             str(int(game.player1.health)), "heart"
-        )
+        )))
 
         # Card 3: Player 2 Health
-        self._draw_card(
+        widgets.append((self._draw_card, (
             start_x + (card_width + gap) * 2, card_y, card_width, card_height,
             COLORS["card_purple"], f"{game.player2.team} Health",
             str(int(game.player2.health)), "heart2"
-        )
+        )))
 
         # Card 4: Enemies
         enemy_count = len(game.enemies)
-        self._draw_card(
+        widgets.append((self._draw_card, (
             start_x + (card_width + gap) * 3, card_y, card_width, card_height,
             COLORS["card_red"], "Enemies", str(enemy_count), "skull"
-        )
+        )))
 
     def _draw_card(self, x, y, width, height, color, title, value, icon_type):
         """Draw a stat card with rounded corners."""
@@ -138,12 +536,12 @@ class GameRenderer:
             self.screen.blit(icon_image, (icon_x, icon_y))
 
         # Title (top, after icon)
-        title_surface = self.card_title_font.render(title, True, COLORS["text_white"])
+        title_surface = self._text(self.card_title_font, title, COLORS["text_white"])
         title_rect = title_surface.get_rect(midleft=(x + 60, y + 18))
         self.screen.blit(title_surface, title_rect)
 
         # Value (bottom, centered)
-        value_surface = self.card_value_font.render(value, True, COLORS["text_white"])
+        value_surface = self._text(self.card_value_font, value, COLORS["text_white"])
         value_rect = value_surface.get_rect(center=(x + width // 2 + 10, y + height - 20))
         self.screen.blit(value_surface, value_rect)
 
@@ -155,79 +553,207 @@ class GameRenderer:
         )
         pygame.draw.rect(self.screen, COLORS["grid_bg"], container_rect, border_radius=15)
 
-    def _draw_grid(self, game):
-        """Draw the game grid and all entities."""
-        # Draw grid lines
-        for x in range(GRID_SIZE + 1):
-            pixel_x = GRID_OFFSET_X + x * CELL_SIZE
+    def _draw_grid_lines(self):
+        """Draw the grid lines in view (skipped when cells are too small to separate)."""
+        if self.lod:
+            return
+
+        cell = self.cell_size
+        left = GRID_OFFSET_X - self.camera.left
+        top = GRID_OFFSET_Y - self.camera.top
+        x0, y0, x1, y1 = self.camera.visible_cells()
+        for x in range(x0, x1 + 1):
+            pixel_x = left + x * cell
             pygame.draw.line(
                 self.screen, COLORS["grid_lines"],
-                (pixel_x, GRID_OFFSET_Y),
-                (pixel_x, GRID_OFFSET_Y + GRID_HEIGHT),
+                (pixel_x, top + y0 * cell),
+                (pixel_x, top + y1 * cell),
                 1
             )
 
-        for y in range(GRID_SIZE + 1):
-            pixel_y = GRID_OFFSET_Y + y * CELL_SIZE
+        for y in range(y0, y1 + 1):
+            pixel_y = top + y * cell
             pygame.draw.line(
                 self.screen, COLORS["grid_lines"],
-                (GRID_OFFSET_X, pixel_y),
-                (GRID_OFFSET_X + GRID_WIDTH, pixel_y),
+                (left + x0 * cell, pixel_y),
+                (left + x1 * cell, pixel_y),
                 1
             )
 
-        # Draw entities
-        self._draw_obstacles(game.obstacles)
-        self._draw_resources(game.resources)
-        self._draw_allies(game.allies)
-        self._draw_enemies(game.enemies)
-        self._draw_players(game.player1, game.player2)
+    def _entity_indexes(self, game):
+        """Get spatial indexes of the game's moving entities and resources, rebuilt once per turn."""
+        cached = self._index_state
+        if cached is None or cached[0] is not game or cached[1] != game.turn_count:
+            self._indexes = {
+                "resource": SpatialIndex(game.resources),
+                "ally": SpatialIndex(game.allies),
+                "enemy": SpatialIndex(game.enemies),
+            }
+            self._index_state = (game, game.turn_count)
+        return self._indexes
+
+    def _obstacle_index(self, game):
+        """Get a spatial index of the game's obstacles, rebuilt when they change."""
+        if self._obstacle_index_positions is not game.obstacle_positions:
+            self._obstacle_index_cache = SpatialIndex(game.obstacles)
+            self._obstacle_index_positions = game.obstacle_positions
+        return self._obstacle_index_cache
+
+    def _place_entities(self, game, alpha, sprites):
+        """
+        Queue the sprites in view in drawing order (walls are part of the
+        background, and at low zoom everything is in the LOD image).
+        """
+        if self.lod:
+            return
+
+        view, visible = self._visible_entities(game)
+        self._place_resources(game.resources, visible["resource"], sprites)
+        self._place_allies(game.allies, visible["ally"], alpha, sprites)
+        self._place_enemies(game.enemies, visible["enemy"], alpha, sprites)
+        self._place_players(game.player1, game.player2, view, alpha, sprites)
+
+    def _visible_entities(self, game):
+        """
+        Find the entities in view, once per turn or camera move.
+
+        Returns:
+            Tuple of (view cells (x0, y0, x1, y1), dict of entity kind ->
+            ascending indices into the game's list of that kind)
+        """
+        indexes = self._entity_indexes(game)
+        camera_key = self.camera.key
+        cached = self._visible_state
+        if cached is None or cached[0] is not indexes or cached[1] != camera_key:
+            # One cell of margin covers sprites sliding in from just outside the view
+            view = self.camera.visible_cells(margin=1)
+            visible = {kind: indexes[kind].query(*view) for kind in ("resource", "ally", "enemy")}
+            self._visible = (view, visible)
+            self._visible_state = (indexes, camera_key)
+        return self._visible
+
+    def _lod_board(self, game):
+        """
+        Get the low-zoom board image for the cells in view, rebuilt once per
+        turn or camera move.
+
+        Returns:
+            Tuple of (image, left, top) to blit clipped to the board area
+        """
+        indexes = self._entity_indexes(game)
+        camera_key = self.camera.key
+        if self._lod_state is not None and self._lod_state[0] is indexes and self._lod_state[1] == camera_key:
+            return self._lod_image
+
+        x0, y0, x1, y1 = view = self.camera.visible_cells()
+        cells = self._lod_wall_layer(game).subsurface((x0, y0, x1 - x0, y1 - y0)).copy()
+
+        resources = game.resources
+        for i in indexes["resource"].query(*view):
+            resource = resources[i]
+            if not resource.collected:
+                x, y = resource.position
+                cells.set_at((x - x0, y - y0), COLORS[resource.type])
+        allies = game.allies
+        for i in indexes["ally"].query(*view):
+            x, y = allies[i].position
+            cells.set_at((x - x0, y - y0), COLORS["ally1" if allies[i].owner.team == "Blue" else "ally2"])
+        enemies = game.enemies
+        for i in indexes["enemy"].query(*view):
+            x, y = enemies[i].position
+            cells.set_at((x - x0, y - y0), COLORS["enemy"])
+        for player, color in ((game.player1, "player1"), (game.player2, "player2")):
+            x, y = player.position
+            if player.alive and x0 <= x < x1 and y0 <= y < y1:
+                cells.set_at((x - x0, y - y0), COLORS[color])
+
+        cell = self.cell_size
+        image = pygame.transform.scale(cells, ((x1 - x0) * cell, (y1 - y0) * cell))
+        self._lod_image = (
+            image,
+            GRID_OFFSET_X + x0 * cell - self.camera.left,
+            GRID_OFFSET_Y + y0 * cell - self.camera.top,
+        )
+        self._lod_state = (indexes, camera_key)
+        return self._lod_image
+
+    def _lod_wall_layer(self, game):
+        """Get the whole grid at one pixel per cell with only the walls on it."""
+        obstacles = game.obstacle_positions
+        cached = self._lod_walls_obstacles
+        if self._lod_walls is not None and (obstacles is cached or obstacles == cached) \
+                and self._lod_walls.get_width() == self.grid_size:
+            return self._lod_walls
+
+        size = self.grid_size
+        if np is not None:
+            cells = np.empty((size, size, 3), dtype=np.uint8)
+            cells[:] = COLORS["grid_bg"]
+            if obstacles:
+                xs, ys = np.array(list(obstacles)).T
+                cells[xs, ys] = COLORS["obstacle"]
+            walls = pygame.surfarray.make_surface(cells)
+        else:
+            walls = pygame.Surface((size, size))
+            walls.fill(COLORS["grid_bg"])
+            for position in obstacles:
+                walls.set_at(position, COLORS["obstacle"])
+
+        self._lod_walls = walls
+        self._lod_walls_obstacles = obstacles
+        return walls
+
+    def _draw_board_image(self, x, y, width, height, image, left, top):
+        """Draw the low-zoom board image inside the board area."""
+        self.screen.set_clip((x, y, width, height))
+        self.screen.blit(image, (left, top))
+        self.screen.set_clip(None)
 
     def _grid_to_pixel(self, grid_pos):
         """Convert grid position to pixel position (center of cell)."""
         x, y = grid_pos
-        pixel_x = GRID_OFFSET_X + x * CELL_SIZE + CELL_SIZE // 2
-        pixel_y = GRID_OFFSET_Y + y * CELL_SIZE + CELL_SIZE // 2
-        return (pixel_x, pixel_y)
+        return (self._pixel_x[x], self._pixel_y[y])
 
-    def _draw_obstacles(self, obstacles):
-        """Draw all obstacles as walls using image."""
-        wall_image = self.assets.get_entity("wall")
+    def _draw_obstacles(self, game):
+        """Draw the obstacles in view as walls using image."""
+        wall_image = self._sprite("wall")
         if not wall_image:
             return
 
-        for obstacle in obstacles:
-            x, y = self._grid_to_pixel(obstacle.position)
-            # Center the image
-            img_rect = wall_image.get_rect(center=(x, y))
-            self.screen.blit(wall_image, img_rect)
-
-    def _draw_resources(self, resources):
-        """Draw all resources using images."""
-        health_image = self.assets.get_entity("health_pack")
-        coin_image = self.assets.get_entity("coin")
-
-        for resource in resources:
+        obstacles = game.obstacles
+        view = self.camera.visible_cells(margin=1)
+        pixel_x = self._pixel_x
+        pixel_y = self._pixel_y
+        for i in self._obstacle_index(game).query(*view):
+            x, y = obstacles[i].position
+            self._blit_centered(wall_image, pixel_x[x], pixel_y[y])
+
+    def _place_resources(self, resources, visible, sprites):
+        """Queue the visible resources (indices into resources) using images."""
+        health_image = self._sprite("health_pack")
+        coin_image = self._sprite("coin")
+
+        for i in visible:
+            resource = resources[i]
             if resource.collected:
                 continue
 
             x, y = self._grid_to_pixel(resource.position)
 
             if resource.type == "health" and health_image:
-                img_rect = health_image.get_rect(center=(x, y))
-                self.screen.blit(health_image, img_rect)
+                self._place(sprites, health_image, x, y)
 
             elif resource.type == "coin" and coin_image:
-                img_rect = coin_image.get_rect(center=(x, y))
-                self.screen.blit(coin_image, img_rect)
+                self._place(sprites, coin_image, x, y)
 
-    def _draw_allies(self, allies):
-        """Draw all ally bots using images."""
-        ally_blue_image = self.assets.get_entity("ally_blue")
-        ally_red_image = self.assets.get_entity("ally_red")
+    def _place_allies(self, allies, visible, alpha, sprites):
+        """Queue the visible ally bots (indices into allies) using images."""
+        ally_blue_image = self._sprite("ally_blue")
+        ally_red_image = self._sprite("ally_red")
 
-        for ally in allies:
-            x, y = self._grid_to_pixel(ally.position)
+        for i in visible:
+            ally = allies[i]
+            x, y = self._tween(("ally", i), ally.position, alpha)
 
             # Use appropriate image based on team
             if ally.owner.team == "Blue":
@@ -236,30 +762,32 @@ class GameRenderer:
                 ally_image = ally_red_image
 
             if ally_image:
-                img_rect = ally_image.get_rect(center=(x, y))
-                self.screen.blit(ally_image, img_rect)
+                self._place(sprites, ally_image, x, y)
 
-    def _draw_enemies(self, enemies):
-        """Draw all enemies using image."""
-        enemy_image = self.assets.get_entity("enemy")
+    def _place_enemies(self, enemies, visible, alpha, sprites):
+        """Queue the visible enemies (indices into enemies) using image."""
+        enemy_image = self._sprite("enemy")
         if not enemy_image:
             return
 
-        for enemy in enemies:
-            x, y = self._grid_to_pixel(enemy.position)
-            img_rect = enemy_image.get_rect(center=(x, y))
-            self.screen.blit(enemy_image, img_rect)
+        for i in visible:
+            enemy = enemies[i]
+            x, y = self._tween(("enemy", i), enemy.position, alpha)
+            self._place(sprites, enemy_image, x, y)
 
-    def _draw_players(self, player1, player2):
-        """Draw both players using images."""
-        player_blue_image = self.assets.get_entity("player_blue")
-        player_red_image = self.assets.get_entity("player_red")
+    def _place_players(self, player1, player2, view, alpha, sprites):
+        """Queue the players inside the view's (x0, y0, x1, y1) cells using images."""
+        player_blue_image = self._sprite("player_blue")
+        player_red_image = self._sprite("player_red")
 
-        for player in [player1, player2]:
+        x0, y0, x1, y1 = view
+        for i, player in enumerate((player1, player2)):
             if not player.alive:
                 continue
+            if not (x0 <= player.position[0] < x1 and y0 <= player.position[1] < y1):
+                continue
 
-            x, y = self._grid_to_pixel(player.position)
+            x, y = self._tween(("player", i), player.position, alpha)
 
             # Use appropriate image based on team
             if player.team == "Blue":
@@ -268,44 +796,42 @@ class GameRenderer:
                 player_image = player_red_image
 
             if player_image:
-                img_rect = player_image.get_rect(center=(x, y))
-                self.screen.blit(player_image, img_rect)
+                self._place(sprites, player_image, x, y)
 
-    def _draw_sidebar(self, game):
-        """Draw the right sidebar with info and controls."""
+    def _sidebar_widgets(self, game, widgets):
+        """Queue the changing parts of the right sidebar as widgets."""
         sidebar_x = SIDEBAR_X
 
         # AI Decision Cards for both players
         y_offset = 180
 
         # Player 1 AI Decision
-        self._draw_ai_decision_card(
+        widgets.append((self._draw_ai_decision_card, (
             sidebar_x, y_offset, 300, 80,
             game.player1.team, game.player1.decision_state
-        )
+        )))
 
         # Player 2 AI Decision
-        self._draw_ai_decision_card(
+        widgets.append((self._draw_ai_decision_card, (
             sidebar_x + 320, y_offset, 300, 80,
             game.player2.team, game.player2.decision_state
-        )
+        )))
 
         # Score cards
         y_offset += 100
-        self._draw_score_card(sidebar_x, y_offset, 300, 80, game.player1)
-        self._draw_score_card(sidebar_x + 320, y_offset, 300, 80, game.player2)
-
-        # Info text
-        y_offset += 100
-        self._draw_info_card(sidebar_x, y_offset, 620)
+        for i, player in enumerate((game.player1, game.player2)):
+            widgets.append((self._draw_score_card, (
+                sidebar_x + 320 * i, y_offset, 300, 80, player.team, player.score
+            )))
 
-        # Restart button
-        y_offset += 100
-        self._draw_restart_button(sidebar_x + 200, y_offset)
+        # Info text, restart button and legend are part of the background
 
-        # Legend
-        y_offset += 100
-        self._draw_legend(sidebar_x, y_offset)
+        # AI metrics (debug mode only, below the legend)
+        if self.debug_mode:
+            y_offset += 465
+            widgets.append((self._draw_text_lines, (
+                sidebar_x, y_offset, 630, 110, tuple(self._debug_metric_lines())
+            )))
 
     def _draw_ai_decision_card(self, x, y, width, height, team, decision):
         """Draw AI decision card."""
@@ -320,7 +846,7 @@ class GameRenderer:
 
         # Title
         title = f"{team} AI"
-        title_surface = self.small_font.render(title, True, COLORS["text_red"])
+        title_surface = self._text(self.small_font, title, COLORS["text_red"])
         title_rect = title_surface.get_rect(midleft=(x + 50, y + 20))
         self.screen.blit(title_surface, title_rect)
 
@@ -329,11 +855,11 @@ class GameRenderer:
         if len(decision_display) > 18:
             decision_display = decision_display[:15] + "..."
 
-        decision_surface = self.card_title_font.render(decision_display, True, COLORS["text_dark"])
+        decision_surface = self._text(self.card_title_font, decision_display, COLORS["text_dark"])
         decision_rect = decision_surface.get_rect(center=(x + width // 2, y + 50))
         self.screen.blit(decision_surface, decision_rect)
 
-    def _draw_score_card(self, x, y, width, height, player):
+    def _draw_score_card(self, x, y, width, height, team, score):
         """Draw score card for a player."""
         # Card background
         card_rect = pygame.Rect(x, y, width, height)
@@ -347,12 +873,12 @@ class GameRenderer:
             self.screen.blit(star_icon, (icon_x, icon_y))
 
         # Team name
-        team_surface = self.small_font.render(f"{player.team} Score", True, COLORS["text_white"])
+        team_surface = self._text(self.small_font, f"{team} Score", COLORS["text_white"])
         team_rect = team_surface.get_rect(midleft=(x + 60, y + 25))
         self.screen.blit(team_surface, team_rect)
 
         # Score value
-        score_surface = self.card_value_font.render(str(player.score), True, COLORS["text_white"])
+        score_surface = self._text(self.card_value_font, str(score), COLORS["text_white"])
         score_rect = score_surface.get_rect(center=(x + width // 2 + 20, y + height // 2 + 5))
         self.screen.blit(score_surface, score_rect)
 
@@ -364,7 +890,7 @@ class GameRenderer:
 
         # Info text
         info_text = "AI vs AI Battle - Watch the algorithms compete!"
-        info_surface = self.card_title_font.render(info_text, True, COLORS["text_blue"])
+        info_surface = self._text(self.card_title_font, info_text, COLORS["text_blue"])
         info_rect = info_surface.get_rect(center=(x + width // 2, y + height // 2))
         self.screen.blit(info_surface, info_rect)
 
@@ -384,12 +910,12 @@ class GameRenderer:
 
         # Text
         text = "Restart"
-        text_surface = self.text_font.render(text, True, COLORS["text_white"])
+        text_surface = self._text(self.text_font, text, COLORS["text_white"])
         text_rect = text_surface.get_rect(center=(x + width // 2 + 20, y + height // 2))
         self.screen.blit(text_surface, text_rect)
 
         # Note: Press R
-        note_surface = self.small_font.render("Press R", True, COLORS["text_dark"])
+        note_surface = self._text(self.small_font, "Press R", COLORS["text_dark"])
         note_rect = note_surface.get_rect(center=(x + width // 2, y + height + 20))
         self.screen.blit(note_surface, note_rect)
 
@@ -410,12 +936,12 @@ class GameRenderer:
 
             # Left item icon
             self._draw_legend_icon(x, row_y + 10, type1)
-            label_surface1 = self.legend_font.render(label1, True, COLORS["text_dark"])
+            label_surface1 = self._text(self.legend_font, label1, COLORS["text_dark"])
             self.screen.blit(label_surface1, (x + 35, row_y + 5))
 
             # Right item icon
             self._draw_legend_icon(x + col_width, row_y + 10, type2)
-            label_surface2 = self.legend_font.render(label2, True, COLORS["text_dark"])
+            label_surface2 = self._text(self.legend_font, label2, COLORS["text_dark"])
             self.screen.blit(label_surface2, (x + col_width + 35, row_y + 5))
 
     def _draw_legend_icon(self, x, y, entity_type):
@@ -446,10 +972,11 @@ class GameRenderer:
     def _draw_game_over(self, game):
         """Draw game over screen."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill((240, 242, 248))
-        self.screen.blit(overlay, (0, 0))
+        if self._overlay is None:
+            self._overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            self._overlay.set_alpha(220)
+            self._overlay.fill((240, 242, 248))
+        self.screen.blit(self._overlay, (0, 0))
 
         # Game Over container
         container_width = 800
@@ -463,12 +990,12 @@ class GameRenderer:
         pygame.draw.rect(self.screen, COLORS["border"], container_rect, 5, border_radius=20)
 
         # Game Over text
-        game_over_text = self.title_font.render("GAME OVER", True, COLORS["text_red"])
+        game_over_text = self._text(self.title_font, "GAME OVER", COLORS["text_red"])
         game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, container_y + 80))
         self.screen.blit(game_over_text, game_over_rect)
 
         # Winner announcement
-        winner_text = self.text_font.render(game.game_over_reason, True, COLORS["title_blue"])
+        winner_text = self._text(self.text_font, game.game_over_reason, COLORS["title_blue"])
         winner_rect = winner_text.get_rect(center=(WINDOW_WIDTH // 2, container_y + 150))
         self.screen.blit(winner_text, winner_rect)
 
@@ -482,17 +1009,72 @@ class GameRenderer:
 
         y_offset = container_y + 220
         for stat in stats:
-            stat_text = self.card_title_font.render(stat, True, COLORS["text_dark"])
+            stat_text = self._text(self.card_title_font, stat, COLORS["text_dark"])
             stat_rect = stat_text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
             self.screen.blit(stat_text, stat_rect)
             y_offset += 45
 
         # Instructions
         instruction = "Press R to restart or Q to quit"
-        instruction_text = self.text_font.render(instruction, True, COLORS["card_green"])
+        instruction_text = self._text(self.text_font, instruction, COLORS["card_green"])
         instruction_rect = instruction_text.get_rect(center=(WINDOW_WIDTH // 2, container_y + 430))
         self.screen.blit(instruction_text, instruction_rect)
 
+    def _debug_metric_lines(self):
+        """Summarize the AI search metrics as text lines."""
+        data = METRICS.snapshot()
+        counters = data["counters"]
+        histograms = data["histograms"]
+
+        astar_nodes = histograms.get("astar.nodes_expanded")
+        astar_path = histograms.get("astar.path_length")
+        minimax_nodes = histograms.get("minimax.nodes_per_search")
+        decisions = counters.get("fuzzy.decisions", 0)
+
+        lines = []
+        if astar_nodes and astar_nodes["count"]:
+            lines.append(
+                f"A*: {astar_nodes['count']} searches, nodes mean {astar_nodes['mean']:.1f} "
+                f"p95 {astar_nodes['p95']}, path mean {astar_path['mean']:.1f}, "
+                f"unreachable {counters.get('astar.no_path', 0)}"
+            )
+        if minimax_nodes and minimax_nodes["count"]:
+            lines.append(
+                f"Minimax: {minimax_nodes['count']} searches, nodes mean "
+                f"{minimax_nodes['mean']:.1f} p95 {minimax_nodes['p95']}, cutoffs "
+                f"alpha {counters.get('minimax.alpha_cutoffs', 0)} "
+                f"beta {counters.get('minimax.beta_cutoffs', 0)}"
+            )
+        if decisions:
+            shares = sorted(
+                (
+                    (value, name[len("fuzzy.action."):])
+                    for name, value in counters.items()
+                    if name.startswith("fuzzy.action.") and value
+                ),
+                reverse=True,
+            )
+            lines.append(f"Fuzzy: {decisions} decisions")
+            lines.append(
+                "  " + ", ".join(f"{name} {100 * value // decisions}%" for value, name in shares)
+            )
+        if not lines:
+            lines.append("AI metrics: no searches recorded yet")
+
+        cache = self.text_cache
+        lines.append(
+            f"Text cache: {len(cache)}/{cache.capacity} surfaces, {100 * cache.hit_rate:.0f}% hits"
+        )
+        return lines
+
+    def _draw_text_lines(self, x, y, width, height, lines):
+        """Draw lines of small text from the top-left of an area."""
+        for i, line in enumerate(lines):
+            surface = self._text(self.small_font, line, COLORS["text_dark"])
+            self.screen.blit(surface, (x, y + i * 22))
+
     def toggle_debug_mode(self):
-        """Toggle debug mode on/off."""
+        """Toggle debug mode on/off (AI metrics are collected while it is on)."""
         self.debug_mode = not self.debug_mode
+        METRICS.enabled = self.debug_mode
+        self.invalidate()
@@ -0,0 +1,436 @@
+"""
+Compact binary replays for the AI vs AI Survival Arena
+Records a keyframe when the game starts, a small delta after every turn and
+a keyframe every few turns, so any turn can be loaded without re-simulating
+
+File layout (little-endian):
+    header   magic "SARP", version, keyframe interval, first turn, seed (signed
+             varint, any size), config JSON
+    frames   one payload per turn, starting at the first turn; only the first
+             keyframe carries the obstacles
+    index    frame count, then (kind, file offset) per frame
+    trailer  index offset, magic "SARE"
+"""
+
+import json
+import struct
+import zlib
+from array import array
+from dataclasses import asdict
+
+import snapshot
+from config import GameConfig
+from entities import EntityPool, ENTITY_CLASSES
+
+
+MAGIC = b"SARP"
+END_MAGIC = b"SARE"
+VERSION = 2  # 2: seed stored as a signed varint
+
+KEYFRAME = 0
+DELTA = 1
+
+DEFAULT_KEYFRAME_INTERVAL = 16
+
+# magic, version, keyframe interval, first turn, config JSON length; the seed
+# follows as a zigzag varint, then the config JSON
+_HEADER = struct.Struct("<4sBHII")
+# frame kind, file offset
+_INDEX_ENTRY = struct.Struct("<BI")
+# index offset, end magic
+_TRAILER = struct.Struct("<Q4s")
+
+# First payload byte: how the rest is stored
+_RAW = 0
+_DEFLATED = 1
+
+
+def _compress(data):
+    """Deflate a payload when that makes it smaller (tiny deltas often don't)."""
+    deflater = zlib.compressobj(9, zlib.DEFLATED, -15)
+    packed = deflater.compress(data) + deflater.flush()
+    if len(packed) < len(data):
+        return bytes((_DEFLATED,)) + packed
+    return bytes((_RAW,)) + data
+
+
+def _decompress(payload):
+    """Inverse of _compress()."""
+    if payload[0] == _DEFLATED:
+        return zlib.decompress(payload[1:], -15)
+    return bytes(payload[1:])
+
+
+def _write_varint(out, value):
+    """Append an unsigned LEB128 integer."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, offset):
+    """Read an unsigned LEB128 integer; returns (value, new offset)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _zigzag(value):
+    """Map signed to unsigned so small negative numbers stay short."""
+    return value << 1 if value >= 0 else (~value << 1) | 1
+
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def encode_delta(previous, current, previous_reason, reason):
+    """
+    Encode the change between two dynamic_state() arrays.
+
+    Entity moves, damage, score changes and collections show up as changed
+    integers; spawned resources show up as integers appended at the end.
+
+    Returns:
+        bytes delta
+    """
+    out = bytearray()
+    _write_varint(out, len(current))
+
+    common = min(len(previous), len(current))
+    changes = [i for i in range(common) if previous[i] != current[i]]
+    _write_varint(out, len(changes))
+    last = 0
+    for i in changes:
+        _write_varint(out, i - last)
+        _write_varint(out, _zigzag(current[i] - previous[i]))
+        last = i
+
+    for value in current[common:]:
+        _write_varint(out, _zigzag(value))
+
+    if reason != previous_reason:
+        encoded = reason.encode("utf-8")
+        _write_varint(out, len(encoded) + 1)
+        out += encoded
+    else:
+        _write_varint(out, 0)
+
+    return bytes(out)
+
+
+def apply_delta(previous, previous_reason, delta):
+    """
+    Apply a delta from encode_delta() to a dynamic_state() array.
+
+    Returns:
+        Tuple of (new dynamic array, new game over reason)
+    """
+    length, offset = _read_varint(delta, 0)
+    current = array("i", previous[:length])
+
+    count, offset = _read_varint(delta, offset)
+    index = 0
+    for _ in range(count):
+        gap, offset = _read_varint(delta, offset)
+        change, offset = _read_varint(delta, offset)
+        index += gap
+        current[index] += _unzigzag(change)
+
+    while len(current) < length:
+        value, offset = _read_varint(delta, offset)
+        current.append(_unzigzag(value))
+
+    reason_length, offset = _read_varint(delta, offset)
+    if reason_length:
+        reason = bytes(delta[offset:offset + reason_length - 1]).decode("utf-8")
+    else:
+        reason = previous_reason
+
+    return current, reason
+
+
+class ReplayState:
+    """
+    Game state decoded from a replay, drawable by GameRenderer.
+
+    Exposes the same entity attributes as SurvivalArenaGame but has no game
+    logic; update() swaps in another turn, reusing the entity objects.
+    """
+
+    def __init__(self, config, static):
+        """
+        Initialize the state with the replay's obstacles.
+
+        Args:
+            config: GameConfig the match was played with
+            static: static section from the first keyframe
+        """
+        self.config = config
+        self.grid_size = config.grid_size
+        self.pools = {name: EntityPool(cls) for name, cls in ENTITY_CLASSES.items()}
+        snapshot.apply_static(self, static)
+
+        self.turn_count = 0
+        self.game_active = True
+        self.winner = None
+        self.game_over_reason = ""
+        self.player1 = None
+        self.player2 = None
+        self.allies = []
+        self.enemies = []
+        self.resources = []
+
+    def update(self, dynamic, reason):
+        """Show another turn (arguments as returned by ReplayReader.state_at)."""
+        pools = self.pools
+        if self.player1 is not None:
+            pools["player"].release_all((self.player1, self.player2))
+        pools["ally"].release_all(self.allies)
+        pools["enemy"].release_all(self.enemies)
+        pools["resource"].release_all(self.resources)
+        snapshot.apply_dynamic(self, dynamic, reason)
+
+    def is_active(self):
+        return self.game_active
+
+
+class ReplayRecorder:
+    """Writes one game to a replay file as it is played."""
+
+    def __init__(self, file, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Initialize the recorder.
+
+        Args:
+            file: path or binary file object to write to
+            keyframe_interval: turns between full keyframes (bounds seek cost)
+        """
+        if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+            self.file = open(file, "wb")
+            self._owns_file = True
+        else:
+            self.file = file
+            self._owns_file = False
+
+        self.keyframe_interval = keyframe_interval
+        self.index = []
+        self.closed = False
+        self._previous = None
+        self._previous_reason = ""
+
+    def start(self, game):
+        """Write the header and the initial keyframe (obstacles, spawns, seed)."""
+        config_json = json.dumps(asdict(game.config), separators=(",", ":")).encode("utf-8")
+        self.file.write(_HEADER.pack(
+            MAGIC,
+            VERSION,
+            self.keyframe_interval,
+            game.turn_count,
+            len(config_json),
+        ))
+        seed = bytearray()
+        _write_varint(seed, _zigzag(game.seed or 0))
+        self.file.write(seed)
+        self.file.write(config_json)
+        self._write_keyframe(game, snapshot.static_state(game))
+
+    def record_turn(self, game):
+        """Write the frame for the turn that was just executed."""
+        if self.closed:
+            return
+
+        if game.turn_count % self.keyframe_interval == 0 or not game.game_active:
+            # Keyframes on the interval and at the end make seeking cheap
+            self._write_keyframe(game)
+        else:
+            current = snapshot.dynamic_state(game)
+            delta = encode_delta(
+                self._previous, current, self._previous_reason, game.game_over_reason
+            )
+            self._write_frame(DELTA, delta)
+            self._previous = current
+            self._previous_reason = game.game_over_reason
+
+        if not game.game_active:
+            self.close()
+
+    def _write_keyframe(self, game, static=None):
+        """
+        Write a snapshot of the game (without RNG state).
+
+        Obstacles never change, so only the initial keyframe stores them;
+        later keyframes carry an empty static section.
+        """
+        if static is None:
+            static = array("i")
+        dynamic = snapshot.dynamic_state(game)
+        data = snapshot.pack_sections(static, dynamic, game.game_over_reason)
+        self._write_frame(KEYFRAME, data)
+        self._previous = dynamic
+        self._previous_reason = game.game_over_reason
+
+    def _write_frame(self, kind, data):
+        self.index.append((kind, self.file.tell()))
+        self.file.write(_compress(data))
+
+    def close(self):
+        """Write the frame index and trailer (called automatically at game over)."""
+        if self.closed:
+            return
+
+        index_offset = self.file.tell()
+        self.file.write(struct.pack("<I", len(self.index)))
+        for entry in self.index:
+            self.file.write(_INDEX_ENTRY.pack(*entry))
+        self.file.write(_TRAILER.pack(index_offset, END_MAGIC))
+        self.file.flush()
+
+        if self._owns_file:
+            self.file.close()
+        self.closed = True
+
+
+class ReplayReader:
+    """Random access to a recorded game; frames are read from disk on demand."""
+
+    def __init__(self, file):
+        """
+        Open a replay and load its header and frame index (not the frames).
+
+        Args:
+            file: path or seekable binary file object
+        """
+        if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+            self.file = open(file, "rb")
+            self._owns_file = True
+        else:
+            self.file = file
+            self._owns_file = False
+
+        header = self.file.read(_HEADER.size)
+        magic, version, self.keyframe_interval, self.first_turn, config_length = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError("Not a Survival Arena replay")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version: {version}")
+        seed = bytearray(self.file.read(1))
+        while seed[-1] & 0x80:
+            seed += self.file.read(1)
+        self.seed = _unzigzag(_read_varint(seed, 0)[0])
+        self.config = GameConfig(**json.loads(self.file.read(config_length)))
+
+        self.file.seek(-_TRAILER.size, 2)
+        index_offset, end_magic = _TRAILER.unpack(self.file.read(_TRAILER.size))
+        if end_magic != END_MAGIC:
+            raise ValueError("Replay is incomplete (no frame index)")
+
+        self.file.seek(index_offset)
+        (count,) = struct.unpack("<I", self.file.read(4))
+        raw_index = self.file.read(count * _INDEX_ENTRY.size)
+        self.kinds = []
+        self.offsets = []
+        for i in range(count):
+            kind, offset = _INDEX_ENTRY.unpack_from(raw_index, i * _INDEX_ENTRY.size)
+            self.kinds.append(kind)
+            self.offsets.append(offset)
+        # Each frame ends where the next one (or the index) starts
+        self.offsets.append(index_offset)
+
+        self.last_turn = self.first_turn + count - 1
+        self.static, _, _, _ = snapshot.unpack(self._read_frame(0))
+        self._cached = None  # (frame position, dynamic, reason) of the last decoded turn
+        self._view = None
+
+    def __len__(self):
+        """Number of recorded turns (including the initial state)."""
+        return len(self.kinds)
+
+    def _read_frame(self, position):
+        """Read and decompress the frame at an index position."""
+        start = self.offsets[position]
+        self.file.seek(start)
+        return _decompress(self.file.read(self.offsets[position + 1] - start))
+
+    def state_at(self, turn):
+        """
+        Decode the game state after a turn.
+
+        Steps forward from the cached turn when possible, otherwise from the
+        nearest keyframe at or before the turn.
+
+        Returns:
+            Tuple of (static array, dynamic array, game over reason)
+        """
+        turn = max(self.first_turn, min(turn, self.last_turn))
+        target = turn - self.first_turn
+
+        start = target
+        while self.kinds[start] != KEYFRAME:
+            start -= 1
+
+        # Continue from the last decoded turn when it lies on the way
+        dynamic = reason = None
+        if self._cached is not None:
+            cached, cached_dynamic, cached_reason = self._cached
+            if start <= cached <= target:
+                dynamic, reason = cached_dynamic, cached_reason
+                start = cached + 1
+
+        for position in range(start, target + 1):
+            data = self._read_frame(position)
+            if self.kinds[position] == KEYFRAME:
+                _, dynamic, reason, _ = snapshot.unpack(data)
+            else:
+                dynamic, reason = apply_delta(dynamic, reason, data)
+
+        self._cached = (target, dynamic, reason)
+        return self.static, dynamic, reason
+
+    def view_at(self, turn):
+        """
+        Get a lightweight drawable state for a turn.
+
+        The same ReplayState object is updated and returned on every call.
+        """
+        if self._view is None:
+            self._view = ReplayState(self.config, self.static)
+        _, dynamic, reason = self.state_at(turn)
+        self._view.update(dynamic, reason)
+        return self._view
+
+    def snapshot_at(self, turn):
+        """Get a snapshot.pack_sections() blob for SurvivalArenaGame.restore()."""
+        static, dynamic, reason = self.state_at(turn)
+        return snapshot.pack_sections(static, dynamic, reason)
+
+    def game_at(self, turn):
+        """
+        Rebuild a full SurvivalArenaGame at a turn without re-simulating.
+
+        The returned game's RNG is not the recorded one, so continuing to play
+        it diverges from the original match.
+        """
+        # Imported lazily so decoding replays doesn't load the game logic and AI
+        from game import SurvivalArenaGame
+
+        game = SurvivalArenaGame(config=self.config, seed=self.seed)
+        game.restore(self.snapshot_at(turn))
+        return game
+
+    def close(self):
+        if self._owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+AI vs AI Survival Arena - Replay Viewer
+
+Plays back a match recorded with replay.ReplayRecorder without re-running
+the simulation. Turns are decoded from disk only when they are shown, so
+seeking anywhere in a long replay stays fast.
+
+Usage: python3 replay_viewer.py match.sarp [--speed N]
+"""
+
+import argparse
+import sys
+
+import pygame
+
+from constants import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    GRID_WIDTH,
+    GRID_HEIGHT,
+    GRID_OFFSET_X,
+    GRID_OFFSET_Y,
+    TURN_RATE,
+    COLORS,
+)
+from rendering import GameRenderer
+from replay import ReplayReader
+
+
+# Playback speed multipliers (1x = the live game's turn rate)
+SPEEDS = (1, 2, 4, 8, 16, 32, 64)
+
+# Turns skipped by PAGE UP / PAGE DOWN
+PAGE_TURNS = 10
+
+# Redraw rate of the viewer window (independent of the playback speed)
+VIEWER_FPS = 60
+
+# Timeline bar below the grid
+TIMELINE_RECT = pygame.Rect(GRID_OFFSET_X, GRID_OFFSET_Y + GRID_HEIGHT + 30, GRID_WIDTH, 14)
+
+
+class ReplayPlayback:
+    """Current turn, speed and pause state of a replay being watched."""
+
+    def __init__(self, first_turn, last_turn, turn_rate=TURN_RATE, speed=1):
+        """
+        Initialize playback at the first turn.
+
+        Args:
+            first_turn: first recorded turn
+            last_turn: last recorded turn
+            turn_rate: turns per second at 1x speed
+            speed: initial speed multiplier (rounded down to one of SPEEDS)
+        """
+        self.first_turn = first_turn
+        self.last_turn = last_turn
+        self.turn_rate = turn_rate
+        self.turn = first_turn
+        self.paused = False
+        self.speed_index = max(
+            [i for i, s in enumerate(SPEEDS) if s <= speed], default=0
+        )
+        self._elapsed = 0.0
+
+    @property
+    def speed(self):
+        return SPEEDS[self.speed_index]
+
+    def advance(self, seconds):
+        """
+        Move playback forward by some wall-clock time.
+
+        Returns:
+            True if the current turn changed
+        """
+        if self.paused or self.turn >= self.last_turn:
+            return False
+
+        self._elapsed += seconds * self.turn_rate * self.speed
+        turns = int(self._elapsed)
+        if turns == 0:
+            return False
+        self._elapsed -= turns
+        return self.seek(self.turn + turns)
+
+    def seek(self, turn):
+        """
+        Jump to a turn (clamped to the recorded range).
+
+        Returns:
+            True if the current turn changed
+        """
+        turn = max(self.first_turn, min(self.last_turn, turn))
+        self._elapsed = 0.0
+        if turn == self.turn:
+            return False
+        self.turn = turn
+        return True
+
+    def step(self, turns):
+        """Move a number of turns forward (or backward if negative)."""
+        return self.seek(self.turn + turns)
+
+    def seek_fraction(self, fraction):
+        """Jump to a position on the timeline (0.0 = first turn, 1.0 = last)."""
+        span = self.last_turn - self.first_turn
+        return self.seek(self.first_turn + round(max(0.0, min(1.0, fraction)) * span))
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+        self._elapsed = 0.0
+
+    def faster(self):
+        self.speed_index = min(len(SPEEDS) - 1, self.speed_index + 1)
+
+    def slower(self):
+        self.speed_index = max(0, self.speed_index - 1)
+
+
+def draw_timeline(screen, font, playback):
+    """
+    Draw the scrub bar and playback status below the grid.
+
+    Returns:
+        Rect of the redrawn area
+    """
+    area = pygame.Rect(TIMELINE_RECT.x, TIMELINE_RECT.y, TIMELINE_RECT.width, TIMELINE_RECT.height + 40)
+    screen.fill(COLORS["background"], area)
+    pygame.draw.rect(screen, COLORS["grid_bg"], TIMELINE_RECT, border_radius=7)
+
+    span = max(1, playback.last_turn - playback.first_turn)
+    progress = (playback.turn - playback.first_turn) / span
+    filled = TIMELINE_RECT.copy()
+    filled.width = max(TIMELINE_RECT.height, round(TIMELINE_RECT.width * progress))
+    pygame.draw.rect(screen, COLORS["player1"], filled, border_radius=7)
+
+    state = "PAUSED" if playback.paused else "PLAYING"
+    status = (
+        f"Turn {playback.turn}/{playback.last_turn}   {playback.speed}x   {state}"
+    )
+    text = font.render(status, True, COLORS["text_dark"])
+    screen.blit(text, (TIMELINE_RECT.x, TIMELINE_RECT.bottom + 8))
+    return area
+
+
+def handle_key(key, playback):
+    """
+    Apply a playback key binding.
+
+    Returns:
+        False if the viewer should quit, True otherwise
+    """
+    if key in (pygame.K_q, pygame.K_ESCAPE):
+        return False
+
+    if key == pygame.K_SPACE:
+        playback.toggle_pause()
+    elif key == pygame.K_RIGHT:
+        playback.step(1)
+    elif key == pygame.K_LEFT:
+        playback.step(-1)
+    elif key == pygame.K_PAGEUP:
+        playback.step(PAGE_TURNS)
+    elif key == pygame.K_PAGEDOWN:
+        playback.step(-PAGE_TURNS)
+    elif key == pygame.K_HOME:
+        playback.seek(playback.first_turn)
+    elif key == pygame.K_END:
+        playback.seek(playback.last_turn)
+    elif key == pygame.K_UP:
+        playback.faster()
+    elif key == pygame.K_DOWN:
+        playback.slower()
+    return True
+
+
+def main():
+    """Replay viewer loop."""
+    parser = argparse.ArgumentParser(description="Watch a recorded Survival Arena match.")
+    parser.add_argument("replay", help="replay file written by ReplayRecorder")
+    parser.add_argument("--speed", type=int, default=1, help="initial speed multiplier (1-64)")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("AI vs AI Survival Arena - Replay")
+
+    renderer = GameRenderer(screen)
+    status_font = pygame.font.Font(None, 24)
+
+    with ReplayReader(args.replay) as reader:
+        playback = ReplayPlayback(reader.first_turn, reader.last_turn, speed=args.speed)
+
+        print("=" * 60)
+        print(f"Replay: {args.replay} (seed {reader.seed})")
+        print(f"Turns {reader.first_turn}-{reader.last_turn}")
+        print("=" * 60)
+        print("\nControls:")
+        print("  SPACE       - Pause/Resume")
+        print("  LEFT/RIGHT  - Step one turn")
+        print("  PGUP/PGDN   - Skip 10 turns")
+        print("  HOME/END    - Jump to start/end")
+        print("  UP/DOWN     - Faster/Slower (1x-64x)")
+        print("  Click/drag  - Scrub the timeline")
+        print("  D           - Toggle debug mode")
+        print("  Wheel/drag  - Zoom/pan the board (F to fit)")
+        print("  Q/ESC       - Quit")
+        print()
+
+        clock = pygame.time.Clock()
+        running = True
+        scrubbing = False
+        view = reader.view_at(playback.turn)
+
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    renderer.invalidate()
+
+                elif renderer.handle_event(event):
+                    pass
+
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_d:
+                        renderer.toggle_debug_mode()
+                    else:
+                        running = handle_key(event.key, playback)
+
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    scrubbing = TIMELINE_RECT.inflate(0, 16).collidepoint(event.pos)
+
+                elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                    scrubbing = False
+
+                if scrubbing and event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION):
+                    playback.seek_fraction((event.pos[0] - TIMELINE_RECT.x) / TIMELINE_RECT.width)
+
+            playback.advance(clock.get_time() / 1000.0)
+
+            # Decode lazily: only the turn on screen is ever materialized
+            if view.turn_count != playback.turn:
+                view = reader.view_at(playback.turn)
+
+            dirty_rects = renderer.render_game(view)
+            dirty_rects.append(draw_timeline(screen, status_font, playback))
+            pygame.display.update(dirty_rects)
+            clock.tick(VIEWER_FPS)
+
+    pygame.quit()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Deadline-driven turn scheduler for the AI vs AI Survival Arena
+Splits a per-turn time budget across players, allies and enemies and drops
+to cheaper AI strategies (shallower minimax, a cached path, a greedy step)
+when an agent's share of the remaining time can't cover the full search
+"""
+
+import time
+
+from ai.astar import AStarPathfinder
+from ai.minimax import MinimaxAI
+from ai.metrics import METRICS
+
+
+# Agent groups in execute_turn order
+GROUPS = ("player", "ally", "enemy")
+
+# Default share of the turn budget for each group; the rest is left for
+# collisions, spawning and the other non-AI phases
+DEFAULT_SHARES = {"player": 0.2, "ally": 0.3, "enemy": 0.4}
+
+# Movement strategies, best first
+PATH_STRATEGIES = ("astar", "cached_path", "greedy")
+
+# Weight of the newest measurement in the per-strategy cost estimates
+COST_SMOOTHING = 0.2
+
+_TURNS = METRICS.counter("scheduler.turns")
+_OVERRUNS = METRICS.counter("scheduler.overruns")
+_TURN_US = METRICS.histogram("scheduler.turn_us")
+
+
+class TurnScheduler:
+    """
+    Chooses how much AI work each agent gets so a turn fits its budget.
+
+    Attach it with ``game.scheduler = TurnScheduler(budget_ms)``. Every
+    agent gets an equal slice of the time left for its group; the best
+    strategy whose measured cost fits the slice is used. Unused time rolls
+    over to the following groups. Degradations are always counted in
+    METRICS (as "scheduler.<group>.<strategy>"), since the scheduler itself
+    is opt-in.
+    """
+
+    def __init__(self, budget_ms=10.0, shares=None, max_goal_drift=2):
+        """
+        Initialize the scheduler.
+
+        Args:
+            budget_ms: wall-clock budget for the AI work of one turn
+            shares: dict of group -> fraction of the budget (see DEFAULT_SHARES)
+            max_goal_drift: how far (Manhattan) a moving target may be from
+                the goal a cached path was computed for and still reuse it
+        """
+        self.budget = budget_ms / 1000.0
+        self.shares = dict(DEFAULT_SHARES if shares is None else shares)
+        self.max_goal_drift = max_goal_drift
+
+        self._costs = {}  # (group, strategy) -> smoothed seconds per call
+        self._paths = {}  # entity -> (goal, path) from its last A* search
+        self._enemy_strategies = {}  # minimax depth -> strategy names
+        self._degraded = {}  # (group, strategy) -> metrics counter
+
+        self._turn_start = 0.0
+        self._deadlines = {}
+        self._remaining = {}
+
+    # Turn bookkeeping
+
+    def start_turn(self, game):
+        """Set the group deadlines for a new turn (top of execute_turn)."""
+        now = self._turn_start = time.perf_counter()
+        players = int(game.player1.alive) + int(game.player2.alive)
+        self._remaining = {"player": players, "ally": len(game.allies), "enemy": len(game.enemies)}
+
+        share = 0.0
+        for group in GROUPS:
+            share += self.shares.get(group, 0.0)
+            self._deadlines[group] = now + self.budget * share
+
+    def end_turn(self):
+        """Record the turn duration and whether it overran the budget."""
+        elapsed = time.perf_counter() - self._turn_start
+        _TURNS.inc()
+        _TURN_US.observe(int(elapsed * 1e6))
+        if elapsed > self.budget:
+            _OVERRUNS.inc()
+
+    def _choose(self, group, strategies):
+        """Pick the best strategy whose estimated cost fits this agent's slice."""
+        allotment = (self._deadlines[group] - time.perf_counter()) / max(1, self._remaining[group])
+        if allotment > 0:
+            costs = self._costs
+            for strategy in strategies:
+                key = (group, strategy)
+                cost = costs.get(key, 0.0)
+                if cost <= allotment:
+                    return strategy
+                # Let skipped estimates decay so one slow call isn't held forever
+                costs[key] = cost * (1.0 - COST_SMOOTHING)
+        return strategies[-1]
+
+    def _finish(self, group, strategy, best, start):
+        """Update the cost estimate for a strategy and count degradations."""
+        elapsed = time.perf_counter() - start
+        key = (group, strategy)
+        previous = self._costs.get(key)
+        if previous is None:
+            self._costs[key] = elapsed
+        else:
+            self._costs[key] = previous + COST_SMOOTHING * (elapsed - previous)
+
+        self._remaining[group] -= 1
+
+        if strategy != best:
+            counter = self._degraded.get(key)
+            if counter is None:
+                counter = self._degraded[key] = METRICS.counter(f"scheduler.{group}.{strategy}")
+            counter.inc()
+
+    # Strategies
+
+    def _cached_step(self, entity, goal):
+        """Next step along the entity's last A* path, if it still leads near the goal."""
+        cached = self._paths.get(entity)
+        if cached is None:
+            return None
+
+        cached_goal, path = cached
+        if AStarPathfinder.manhattan_distance(cached_goal, goal) > self.max_goal_drift:
+            return None
+
+        try:
+            index = path.index(entity.position)
+        except ValueError:
+            return None
+        if index + 1 >= len(path):
+            return None
+        return path[index + 1]
+
+    def _step(self, strategy, entity, goal, obstacles, grid_size):
+        """
+        Run a movement strategy.
+
+        Returns:
+            Tuple of (strategy actually used, next position)
+        """
+        if strategy == "astar":
+            path = AStarPathfinder.find_path(entity.position, goal, obstacles, grid_size)
+            self._paths[entity] = (goal, path)
+            return strategy, path[1] if len(path) > 1 else entity.position
+
+        if strategy == "cached_path":
+            step = self._cached_step(entity, goal)
+            if step is not None:
+                return strategy, step
+
+        return "greedy", AStarPathfinder.greedy_step(entity.position, goal, obstacles, grid_size)
+
+    def path_step(self, group, entity, goal, obstacles, grid_size, pathfinder="astar"):
+        """
+        Get an agent's next move toward a goal within its time slice.
+
+        Args:
+            group: "player", "ally" or "enemy"
+            entity: moving entity (keys the path cache)
+            goal: (x, y) goal position
+            obstacles: set of blocked positions
+            grid_size: size of the grid
+            pathfinder: best strategy the agent may use ("astar", or
+                "greedy" for agents that always step greedily)
+
+        Returns:
+            (x, y) next position
+        """
+        strategies = PATH_STRATEGIES[PATH_STRATEGIES.index(pathfinder):]
+        start = time.perf_counter()
+        strategy = self._choose(group, strategies)
+        strategy, step = self._step(strategy, entity, goal, obstacles, grid_size)
+        self._finish(group, strategy, strategies[0], start)
+        return step
+
+    def enemy_move(self, enemy, player1, player2, obstacles, grid_size, depth):
+        """
+        Choose an enemy's target and move within its time slice.
+
+        Falls back from minimax at the full depth to shallower searches,
+        then to path following toward the better-scoring player (A*, the
+        path an earlier A* search cached, a greedy step).
+
+        Returns:
+            Tuple of (target position, next position), as
+            MinimaxAI.choose_target_and_move
+        """
+        strategies = self._enemy_strategies.get(depth)
+        if strategies is None:
+            strategies = tuple(f"minimax_{d}" for d in range(depth, 0, -1)) + PATH_STRATEGIES
+            self._enemy_strategies[depth] = strategies
+
+        start = time.perf_counter()
+        strategy = self._choose("enemy", strategies)
+
+        if strategy.startswith("minimax_"):
+            target, step = MinimaxAI.choose_target_and_move(
+                enemy.position,
+                player1.position,
+                player2.position,
+                player1.health,
+                player2.health,
+                obstacles,
+                grid_size,
+                int(strategy[len("minimax_"):]),
+            )
+        else:
+            score1 = MinimaxAI.evaluate_position(enemy.position, player1.position, player1.health)
+            score2 = MinimaxAI.evaluate_position(enemy.position, player2.position, player2.health)
+            target = player1.position if score1 >= score2 else player2.position
+            strategy, step = self._step(strategy, enemy, target, obstacles, grid_size)
+
+        self._finish("enemy", strategy, strategies[0], start)
+        return target, step
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark the batched simulation engine against SurvivalArenaGame.
+
+Plays games on both engines, reports games per second and checks that the
+outcome and game-length distributions agree (chi-square homogeneity tests).
+
+Usage:
+    python3 scripts/bench_batch.py [--games N] [--reference-games M] [--movement flow|greedy]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_sim import (  # noqa: E402
+    DEFAULT_CHUNK, MOVEMENT_MODES, REASONS, compare_outcomes, reference_results, simulate_batch,
+)
+from config import GameConfig  # noqa: E402
+
+
+def summarize(results):
+    """One line of win/draw shares, mean game length and mean scores."""
+    winner = results["winner"]
+    games = len(winner)
+    shares = [
+        f"{name} {(winner == code).sum() / games:5.1%}"
+        for code, name in ((0, "Blue"), (1, "Red"), (-1, "draw"))
+    ]
+    ends = ", ".join(
+        f"{reason} {(results['reason'] == code).sum() / games:.0%}" for code, reason in enumerate(REASONS)
+    )
+    score = results["score"].mean(axis=0)
+    return (
+        f"{'  '.join(shares)}  turns {results['turns'].mean():5.1f}  "
+        f"scores {score[0]:.0f}/{score[1]:.0f}  ({ends})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=8192, help="games on the batch engine")
+    parser.add_argument("--reference-games", type=int, default=300, help="games on SurvivalArenaGame")
+    parser.add_argument("--movement", choices=MOVEMENT_MODES, default="flow")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="games simulated together")
+    parser.add_argument("--enemies", type=int, default=GameConfig.max_enemies)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = GameConfig(max_enemies=args.enemies)
+
+    start = time.perf_counter()
+    reference = reference_results(args.reference_games, config, seed=args.seed)
+    reference_rate = args.reference_games / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    batch = simulate_batch(args.games, config, movement=args.movement, seed=args.seed, chunk=args.chunk)
+    batch_rate = args.games / (time.perf_counter() - start)
+
+    print(f"Reference: {reference_rate:8.0f} games/s   {summarize(reference)}")
+    print(f"Batch:     {batch_rate:8.0f} games/s   {summarize(batch)}")
+    print(f"Speedup:   {batch_rate / reference_rate:8.1f}x\n")
+    for name, (statistic, df, p) in compare_outcomes(reference, batch).items():
+        print(f"  {name:8s} chi2 = {statistic:6.2f}  df = {df}  p = {p:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark the reinforcement-learning environments.
+
+Steps VectorArenaEnv batches of several sizes with random actions and
+reports environment steps per second (one game advancing one turn is a
+step) and the share of the time spent building observations.
+
+Usage:
+    python3 scripts/bench_env.py [--seconds S] [--batch K ...] [--both] [--movement flow|greedy]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from arena_env import VectorArenaEnv  # noqa: E402
+from batch_sim import MOVEMENT_MODES  # noqa: E402
+from config import GameConfig  # noqa: E402
+
+
+def bench(num_envs, controlled, config, seconds, movement):
+    """
+    Step a batch with random actions for a while.
+
+    Returns:
+        Tuple of (steps per second, share of time in _observe)
+    """
+    env = VectorArenaEnv(num_envs, config, controlled, movement=movement)
+    env.reset(seed=0)
+    rng = np.random.default_rng(0)
+
+    observe = env._observe
+    observe_time = [0.0]
+
+    def timed_observe():
+        start = time.perf_counter()
+        result = observe()
+        observe_time[0] += time.perf_counter() - start
+        return result
+
+    env._observe = timed_observe
+    steps = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        env.step(rng.integers(0, env.action_count, (num_envs, len(controlled))))
+        steps += num_envs
+    elapsed = time.perf_counter() - start
+    return steps / elapsed, observe_time[0] / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0, help="time per batch size")
+    parser.add_argument("--batch", type=int, nargs="+", default=[1, 16, 64, 256, 1024, 4096])
+    parser.add_argument("--both", action="store_true", help="control both players")
+    parser.add_argument("--enemies", type=int, default=GameConfig.max_enemies)
+    parser.add_argument("--movement", choices=MOVEMENT_MODES, default="flow", help="built-in AI path steps")
+    args = parser.parse_args()
+
+    controlled = (0, 1) if args.both else (0,)
+    config = GameConfig(max_enemies=args.enemies)
+    print(f"Controlled players: {len(controlled)}, enemies: {args.enemies}, movement: {args.movement}\n")
+    for num_envs in args.batch:
+        rate, observe_share = bench(num_envs, controlled, config, args.seconds, args.movement)
+        print(f"  K={num_envs:4d}  {rate:9.0f} steps/s   observations {observe_share:5.1%} of the time")
+
+
+if __name__ == "__main__":
+    main()
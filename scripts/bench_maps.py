@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared map registry.
+
+Registers a set of maps, then starts 1, 2, 4, ... worker processes that
+either attach to the shared blocks or hold private copies of the same data
+(as workers building their own tables would), and reports the memory of
+all workers together (proportional set size, Linux only). Also times game
+setup on a random map, on a shared map, and building a map's tables.
+
+Usage:
+    python3 scripts/bench_maps.py [--maps M] [--workers 1 2 4 8] [--grid-size N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import GameConfig  # noqa: E402
+from game import SurvivalArenaGame  # noqa: E402
+from map_registry import MapRegistry, attach  # noqa: E402
+
+
+def pss_kib():
+    """Proportional set size of this process in KiB (None where /proc is missing)."""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def _worker(map_ids, shared, ready, done, results):
+    """Load every map's data, wait for the other workers, report memory growth."""
+    before = pss_kib()
+    if shared:
+        views = [attach(map_id).distances for map_id in map_ids]
+    else:
+        views = [memoryview(bytes(attach(map_id).block.buf)) for map_id in map_ids]
+    for view in views:
+        sum(view[::4096 // view.itemsize])  # read every page
+    ready.wait()
+    after = pss_kib()
+    results.put(None if before is None else after - before)
+    done.wait()
+
+
+def worker_memory(map_ids, workers, shared):
+    """Total memory growth (KiB) of workers loading the maps at the same time."""
+    context = multiprocessing.get_context("fork") if hasattr(os, "fork") else multiprocessing
+    ready = context.Barrier(workers + 1)
+    done = context.Barrier(workers + 1)
+    results = context.Queue()
+    processes = [
+        context.Process(target=_worker, args=(map_ids, shared, ready, done, results)) for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    ready.wait()
+    growth = [results.get() for _ in processes]
+    done.wait()
+    for process in processes:
+        process.join()
+    return None if None in growth else sum(growth)
+
+
+def setup_time(config, games, map_id=None):
+    """Mean SurvivalArenaGame construction time in milliseconds."""
+    start = time.perf_counter()
+    for seed in range(games):
+        SurvivalArenaGame(config=config, seed=seed, map_id=map_id)
+    return (time.perf_counter() - start) / games * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--maps", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--grid-size", type=int, default=GameConfig.grid_size)
+    parser.add_argument("--games", type=int, default=200, help="games per setup timing")
+    args = parser.parse_args()
+
+    obstacles = GameConfig.max_obstacles * args.grid_size ** 2 // GameConfig.grid_size ** 2
+    config = GameConfig(grid_size=args.grid_size, max_obstacles=obstacles)
+
+    with MapRegistry() as registry:
+        start = time.perf_counter()
+        map_ids = [registry.add_game_map(config, seed) for seed in range(args.maps)]
+        build = (time.perf_counter() - start) / args.maps * 1000
+        size = sum(registry[map_id].block.size for map_id in map_ids) / 2 ** 20
+        print(f"{args.maps} maps of {args.grid_size}x{args.grid_size}: {size:.1f} MiB of shared data\n")
+
+        print("  workers   shared maps   private copies   (total memory growth)")
+        for workers in args.workers:
+            shared = worker_memory(map_ids, workers, True)
+            private = worker_memory(map_ids, workers, False)
+            if shared is None:
+                print("  (memory figures need /proc/self/smaps_rollup)")
+                break
+            print(f"  {workers:7d}   {shared / 1024:8.1f} MiB   {private / 1024:11.1f} MiB")
+
+        start = time.perf_counter()
+        attach(map_ids[0])
+        first_attach = (time.perf_counter() - start) * 1000
+        print(f"\n  building one map's tables   {build:8.2f} ms")
+        print(f"  attaching to a shared map   {first_attach:8.2f} ms (once per process)")
+        print(f"  game setup, random map      {setup_time(config, args.games):8.2f} ms")
+        print(f"  game setup, shared map      {setup_time(config, args.games, map_ids[0]):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark GameRenderer frame time headlessly (SDL dummy video driver).
+
+Usage:
+    python3 scripts/bench_render.py [--frames N] [--grid-size N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+from config import GameConfig  # noqa: E402
+from constants import WINDOW_WIDTH, WINDOW_HEIGHT, RENDER_FPS  # noqa: E402
+from game import SurvivalArenaGame  # noqa: E402
+from rendering import GameRenderer  # noqa: E402
+
+
+def bench_frames(renderer, game, frames):
+    """
+    Render frames, advancing a turn every second of frames.
+
+    Returns:
+        Tuple of (per-frame render times in seconds, total redrawn pixels)
+    """
+    times = []
+    redrawn = 0
+    for frame in range(frames):
+        if frame % RENDER_FPS == RENDER_FPS - 1:
+            if not game.is_active():
+                game.reset()
+            game.execute_turn()
+        alpha = (frame % RENDER_FPS) / RENDER_FPS
+        start = time.perf_counter()
+        rects = renderer.render_game(game, alpha)
+        times.append(time.perf_counter() - start)
+        redrawn += sum(rect.width * rect.height for rect in rects)
+    return times, redrawn
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--grid-size", type=int, default=GameConfig.grid_size)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    renderer = GameRenderer(screen)
+    game = SurvivalArenaGame(config=GameConfig(grid_size=args.grid_size), seed=0)
+
+    # Warm up caches before timing
+    bench_frames(renderer, game, RENDER_FPS)
+    times, redrawn = bench_frames(renderer, game, args.frames)
+    times.sort()
+
+    def ms(fraction):
+        return times[min(len(times) - 1, int(len(times) * fraction))] * 1000
+
+    print(f"{args.frames} frames, {args.grid_size}x{args.grid_size} grid")
+    print(f"  mean {sum(times) / len(times) * 1000:6.2f} ms")
+    print(f"  p50  {ms(0.50):6.2f} ms")
+    print(f"  p95  {ms(0.95):6.2f} ms")
+    print(f"  p99  {ms(0.99):6.2f} ms")
+    print(f"  redrawn {100 * redrawn / (args.frames * WINDOW_WIDTH * WINDOW_HEIGHT):5.1f}% of the window per frame")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
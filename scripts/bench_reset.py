@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark game reset throughput and memory per game.
+
+Usage:
+    python3 scripts/bench_reset.py [--resets N] [--backend objects|arrays]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import SurvivalArenaGame  # noqa: E402
+
+
+def bench_resets(backend, resets, rounds=5):
+    """Return the best resets per second over several rounds for one long-lived game."""
+    random.seed(0)
+    game = SurvivalArenaGame(backend=backend)
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(resets // rounds):
+            game.reset()
+        best = max(best, (resets // rounds) / (time.perf_counter() - start))
+    return best
+
+
+def bench_short_games(backend, games, turns):
+    """Return short games per second, resetting one game object between matches."""
+    random.seed(0)
+    game = SurvivalArenaGame(backend=backend)
+    start = time.perf_counter()
+    for _ in range(games):
+        game.reset()
+        for _ in range(turns):
+            game.execute_turn()
+    return games / (time.perf_counter() - start)
+
+
+def memory_per_game(backend, games=200):
+    """Return traced bytes held by one live game, averaged over many."""
+    random.seed(0)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [SurvivalArenaGame(backend=backend) for _ in range(games)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / games
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resets", type=int, default=20000)
+    parser.add_argument("--backend", default="objects", choices=["objects", "arrays"])
+    args = parser.parse_args()
+
+    print(f"Backend: {args.backend}")
+    print(f"  Resets/sec:           {bench_resets(args.backend, args.resets):10.0f}")
+    print(f"  Short games/sec (5t): {bench_short_games(args.backend, args.resets // 20, 5):10.0f}")
+    print(f"  Bytes per live game:  {memory_per_game(args.backend):10.0f}")
+
+
+if __name__ == "__main__":
+    main()
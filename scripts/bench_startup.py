@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark headless start-up: fresh interpreters importing the simulation
+core, playing a game, and bringing up an offscreen renderer.
+
+Each case runs in a new process (like a spawned batch worker), so module
+caches never carry over. Reports the median wall time per case and the
+heavy modules each one loaded.
+
+Usage:
+    python3 scripts/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a headless worker should never load
+HEAVY_MODULES = ("pygame", "numpy", "assets", "rendering")
+
+CASES = (
+    ("interpreter", "pass"),
+    ("import core", "import game, replay, scheduler, pipeline, profiler, ai"),
+    (
+        "core + one game",
+        "import game\n"
+        "g = game.SurvivalArenaGame(seed=0)\n"
+        "while g.is_active():\n"
+        "    g.execute_turn()",
+    ),
+    ("import rendering", "import rendering"),
+    ("offscreen renderer", "import export\nexport.offscreen_renderer()"),
+)
+
+
+def loaded_heavy_modules(code):
+    """Run code in a fresh interpreter and list the heavy modules it imported."""
+    probe = code + "\nimport sys\nprint(' '.join(m for m in %r if m in sys.modules))" % (HEAVY_MODULES,)
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True,
+        env=dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1"),
+    )
+    return result.stdout.split("\n")[-2].split() if result.stdout.strip() else []
+
+
+def time_case(code, runs):
+    """Median wall time (seconds) of running code in a fresh interpreter."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"Median of {args.runs} fresh interpreters:\n")
+    for name, code in CASES:
+        median = time_case(code, args.runs)
+        heavy = loaded_heavy_modules(code)
+        print(f"  {name:20s} {median * 1000:7.1f} ms   loads: {', '.join(heavy) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Build the pre-scaled icons the game loads into the texture atlas.
+
+Reads ASSET_MANIFEST from assets.py (every icon and the size AssetLoader
+draws it at), scales the icons on a pool of worker processes and packs them
+into icons/atlas.png with its index icons/atlas.json, which AssetLoader
+loads without any runtime scaling. Each index entry records a hash of its
+source file and size: unchanged entries are copied from the existing atlas
+instead of being scaled again, and nothing is written when none changed.
+
+Usage:
+    python3 scripts/build_assets.py [--jobs N] [--width N] [--force] [--check]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # imported again by every worker
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+from assets import (  # noqa: E402
+    ASSET_MANIFEST,
+    ATLAS_IMAGE,
+    ATLAS_INDEX,
+    ATLAS_VERSION,
+    ATLAS_WIDTH,
+    ICONS_PATH,
+)
+
+# Bump when scale_image changes, so every entry is rebuilt
+SCALER_VERSION = 1
+
+
+def content_hash(source, size):
+    """Hash of an icon's source bytes and target size."""
+    digest = hashlib.sha256(f"{SCALER_VERSION}:{size[0]}x{size[1]}:".encode())
+    digest.update(source)
+    return digest.hexdigest()[:16]
+
+
+def scale_image(path, size):
+    """
+    Worker task: load an icon and scale it like the runtime fallback does.
+
+    Returns:
+        RGBA bytes of the scaled image
+    """
+    image = pygame.image.load(path)
+    return pygame.image.tobytes(pygame.transform.smoothscale(image, size), "RGBA")
+
+
+def pack_atlas(images, width=ATLAS_WIDTH):
+    """
+    Pack images into one surface, in rows (shelves) of decreasing height.
+
+    Args:
+        images: list of (ASSET_MANIFEST entry, hash, Surface) tuples
+        width: atlas width in pixels
+
+    Returns:
+        Tuple of (atlas Surface, index dict for ATLAS_INDEX)
+    """
+    order = sorted(range(len(images)), key=lambda i: -images[i][2].get_height())
+    placements = [None] * len(images)
+    x = y = shelf_height = 0
+    for i in order:
+        image_width, image_height = images[i][2].get_size()
+        if x + image_width > width:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        placements[i] = (x, y, image_width, image_height)
+        x += image_width
+        shelf_height = max(shelf_height, image_height)
+
+    atlas = pygame.Surface((width, max(1, y + shelf_height)), pygame.SRCALPHA)
+    entries = []
+    for ((group, name, file, size), digest, image), rect in zip(images, placements):
+        # MAX onto the transparent atlas copies the pixels without alpha blending
+        atlas.blit(image, rect[:2], special_flags=pygame.BLEND_RGBA_MAX)
+        entries.append({
+            "group": group, "name": name, "file": file, "size": list(size),
+            "rect": list(rect), "hash": digest,
+        })
+    index = {"version": ATLAS_VERSION, "image": ATLAS_IMAGE, "width": width, "entries": entries}
+    return atlas, index
+
+
+def read_index(icons_path):
+    """Load the current atlas index, or None if there is no usable one."""
+    try:
+        with open(os.path.join(icons_path, ATLAS_INDEX)) as f:
+            index = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return index if index.get("version") == ATLAS_VERSION else None
+
+
+def previous_images(icons_path, index):
+    """Get the scaled images in the current atlas, keyed by content hash."""
+    if index is None:
+        return {}
+    try:
+        atlas = pygame.image.load(os.path.join(icons_path, index["image"]))
+    except (pygame.error, FileNotFoundError):
+        return {}
+    return {
+        entry["hash"]: atlas.subsurface(entry["rect"]).copy()
+        for entry in index["entries"]
+        if "hash" in entry
+    }
+
+
+def build(icons_path=ICONS_PATH, width=ATLAS_WIDTH, jobs=None, force=False, check=False):
+    """
+    Bring the atlas up to date with ASSET_MANIFEST and the icon files.
+
+    Args:
+        icons_path: icons folder to read from and write the atlas to
+        width: atlas width in pixels
+        jobs: worker processes for scaling (default: one per CPU)
+        force: rescale every entry even if its hash is unchanged
+        check: only report whether the atlas is up to date
+
+    Returns:
+        Tuple of (up to date before the build, number of entries scaled)
+    """
+    hashes = []
+    for group, name, file, size in ASSET_MANIFEST:
+        with open(os.path.join(icons_path, file), "rb") as f:
+            hashes.append(content_hash(f.read(), size))
+
+    index = read_index(icons_path)
+    current = index is not None and index.get("width") == width and sorted(
+        (entry["group"], entry["name"], entry.get("hash")) for entry in index["entries"]
+    ) == sorted((asset[0], asset[1], digest) for asset, digest in zip(ASSET_MANIFEST, hashes))
+    if check or (current and not force):
+        return current, 0
+
+    reusable = {} if force else previous_images(icons_path, index)
+    tasks = [
+        (i, os.path.join(icons_path, asset[2]), asset[3])
+        for i, (asset, digest) in enumerate(zip(ASSET_MANIFEST, hashes))
+        if digest not in reusable
+    ]
+
+    scaled = {}
+    if len(tasks) > 1 and (jobs or os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(tasks), jobs or os.cpu_count())) as pool:
+            results = pool.map(scale_image, [path for _, path, _ in tasks], [size for _, _, size in tasks])
+            for (i, _, size), data in zip(tasks, results):
+                scaled[i] = pygame.image.frombytes(data, size, "RGBA")
+    else:
+        for i, path, size in tasks:
+            scaled[i] = pygame.image.frombytes(scale_image(path, size), size, "RGBA")
+
+    images = [
+        (asset, digest, scaled[i] if i in scaled else reusable[digest])
+        for i, (asset, digest) in enumerate(zip(ASSET_MANIFEST, hashes))
+    ]
+    atlas, new_index = pack_atlas(images, width)
+    pygame.image.save(atlas, os.path.join(icons_path, ATLAS_IMAGE))
+    with open(os.path.join(icons_path, ATLAS_INDEX), "w") as f:
+        json.dump(new_index, f, indent=1)
+        f.write("\n")
+    return current, len(tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--width", type=int, default=ATLAS_WIDTH, help="atlas width in pixels")
+    parser.add_argument("--force", action="store_true", help="rescale every icon")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 if the atlas is stale")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    current, scaled = build(ICONS_PATH, args.width, args.jobs, args.force, args.check)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    atlas_path = os.path.join(ICONS_PATH, ATLAS_IMAGE)
+    if args.check:
+        print(f"{atlas_path} is {'up to date' if current else 'stale'}")
+        return 0 if current else 1
+    if current and not scaled and not args.force:
+        print(f"{atlas_path} is up to date ({elapsed:.0f} ms)")
+    else:
+        print(
+            f"Scaled {scaled} of {len(ASSET_MANIFEST)} icons into {atlas_path} ({elapsed:.0f} ms)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
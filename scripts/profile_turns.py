@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Profile where turn time goes and export a Chrome trace.
+
+Also prints the AI search metrics (A* nodes, minimax nodes and cutoffs,
+fuzzy decisions) collected over the same games.
+
+Usage:
+    python3 scripts/profile_turns.py [--games N] [--grid-size N] [--enemies N]
+                                     [--trace turns.json]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.metrics import METRICS  # noqa: E402
+from config import GameConfig  # noqa: E402
+from game import SurvivalArenaGame  # noqa: E402
+from profiler import TurnProfiler  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--grid-size", type=int, default=GameConfig.grid_size)
+    parser.add_argument("--enemies", type=int, default=GameConfig.max_enemies)
+    parser.add_argument("--backend", default="objects", choices=["objects", "arrays"])
+    parser.add_argument("--trace", help="write a Chrome trace-event JSON file")
+    args = parser.parse_args()
+
+    config = GameConfig(grid_size=args.grid_size, max_enemies=args.enemies)
+    profiler = TurnProfiler()
+    METRICS.enabled = True
+
+    turns = 0
+    for seed in range(args.games):
+        game = SurvivalArenaGame(args.backend, config=config, seed=seed)
+        game.profiler = profiler
+        while game.is_active():
+            game.execute_turn()
+        turns += game.turn_count
+
+    print(f"{args.games} games, {turns} turns ({args.backend} backend)\n")
+    print(profiler.format_summary())
+    print("\nAI metrics:")
+    for line in METRICS.format_lines():
+        print(f"  {line}")
+
+    if args.trace:
+        profiler.export_chrome_trace(args.trace)
+        print(f"\nTrace written to {args.trace} (open in chrome://tracing or Perfetto)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Compact binary snapshots of a SurvivalArenaGame
+Packs the game state into flat integer arrays so games can be checkpointed,
+restored and forked in O(entities) without copy.deepcopy
+"""
+
+import struct
+from array import array
+
+from constants import ACTIONS, COLORS
+
+
+MAGIC = b"SASN"
+VERSION = 1
+
+# Marker for "no value" (missing target, no winner, ...)
+NONE = -1
+
+# Integers stored per entity, in order
+PLAYER_FIELDS = 9  # x, y, max_health, health, score, alive, decision, target x, target y
+ALLY_FIELDS = 4  # x, y, owner (0 = player 1, 1 = player 2), target resource index
+ENEMY_FIELDS = 4  # x, y, target x, target y
+RESOURCE_FIELDS = 4  # x, y, type, collected
+OBSTACLE_FIELDS = 2  # x, y
+
+# Integers before the entity records in each section
+STATIC_HEADER = 2  # grid size, obstacle count
+DYNAMIC_HEADER = 6  # turn count, game active, winner, ally count, enemy count, resource count
+
+ACTION_CODES = tuple(ACTIONS.values())
+ACTION_INDEX = {action: code for code, action in enumerate(ACTION_CODES)}
+RESOURCE_CODES = ("health", "coin")
+RESOURCE_INDEX = {name: code for code, name in enumerate(RESOURCE_CODES)}
+
+# magic, version, has RNG state, static length, dynamic length, reason length (bytes)
+_HEADER = struct.Struct("<4sBBIII")
+# RNG state version, whether a cached gauss value follows, cached gauss value
+_RNG_TAIL = struct.Struct("<BBd")
+_RNG_WORDS = 625
+
+
+def static_state(game):
+    """
+    Encode the parts of a game that never change during a match.
+
+    Returns:
+        array('i') of [grid size, obstacle count, obstacle x/y pairs...]
+    """
+    data = array("i", (game.grid_size, len(game.obstacles)))
+    for obstacle in game.obstacles:
+        data.extend(obstacle.position)
+    return data
+
+
+def dynamic_state(game):
+    """
+    Encode everything that can change from turn to turn.
+
+    Returns:
+        array('i') with the turn counter, flags and one fixed-size record
+        per player, ally, enemy and resource
+    """
+    if game.winner is None:
+        winner = NONE
+    else:
+        winner = 0 if game.winner is game.player1 else 1
+
+    data = array("i", (
+        game.turn_count,
+        int(game.game_active),
+        winner,
+        len(game.allies),
+        len(game.enemies),
+        len(game.resources),
+    ))
+
+    for player in (game.player1, game.player2):
+        target = player.target_position or (NONE, NONE)
+        data.extend((
+            player.position[0],
+            player.position[1],
+            player.max_health,
+            player.health,
+            player.score,
+            int(player.alive),
+            ACTION_INDEX[player.decision_state],
+            target[0],
+            target[1],
+        ))
+
+    resource_index = {id(resource): i for i, resource in enumerate(game.resources)}
+    for ally in game.allies:
+        target = ally.target_resource
+        data.extend((
+            ally.position[0],
+            ally.position[1],
+            0 if ally.owner is game.player1 else 1,
+            resource_index.get(id(target), NONE) if target is not None else NONE,
+        ))
+
+    for enemy in game.enemies:
+        target = enemy.target_position or (NONE, NONE)
+        data.extend((enemy.position[0], enemy.position[1], target[0], target[1]))
+
+    for resource in game.resources:
+        data.extend((
+            resource.position[0],
+            resource.position[1],
+            RESOURCE_INDEX[resource.type],
+            int(resource.collected),
+        ))
+
+    return data
+
+
+def pack(game, include_rng=True):
+    """
+    Serialize a game to bytes.
+
+    Args:
+        game: SurvivalArenaGame to serialize
+        include_rng: store the game's RNG state so a restored game continues
+            with the same random sequence (adds about 2.5 KB)
+
+    Returns:
+        bytes snapshot
+    """
+    rng_state = game.rng.getstate() if include_rng else None
+    return pack_sections(
+        static_state(game), dynamic_state(game), game.game_over_reason, rng_state
+    )
+
+
+def pack_sections(static, dynamic, reason, rng_state=None):
+    """
+    Serialize already-encoded sections (the inverse of unpack()).
+
+    Returns:
+        bytes snapshot
+    """
+    static = static.tobytes()
+    dynamic = dynamic.tobytes()
+    reason = reason.encode("utf-8")
+
+    parts = [
+        _HEADER.pack(
+            MAGIC, VERSION, int(rng_state is not None), len(static), len(dynamic), len(reason)
+        ),
+        static,
+        dynamic,
+        reason,
+    ]
+
+    if rng_state is not None:
+        version, internal, gauss = rng_state
+        parts.append(array("I", internal).tobytes())
+        parts.append(_RNG_TAIL.pack(version, gauss is not None, gauss or 0.0))
+
+    return b"".join(parts)
+
+
+def unpack(data):
+    """
+    Split a snapshot into its sections.
+
+    Returns:
+        Tuple of (static array, dynamic array, game over reason, RNG state or None)
+    """
+    magic, version, has_rng, static_len, dynamic_len, reason_len = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a Survival Arena snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+
+    offset = _HEADER.size
+    static = array("i")
+    static.frombytes(data[offset:offset + static_len])
+    offset += static_len
+
+    dynamic = array("i")
+    dynamic.frombytes(data[offset:offset + dynamic_len])
+    offset += dynamic_len
+
+    reason = bytes(data[offset:offset + reason_len]).decode("utf-8")
+    offset += reason_len
+
+    rng_state = None
+    if has_rng:
+        internal = array("I")
+        internal.frombytes(data[offset:offset + _RNG_WORDS * internal.itemsize])
+        offset += _RNG_WORDS * internal.itemsize
+        rng_version, has_gauss, gauss = _RNG_TAIL.unpack_from(data, offset)
+        rng_state = (rng_version, tuple(internal), gauss if has_gauss else None)
+
+    return static, dynamic, reason, rng_state
+
+
+def same_obstacles(game, static):
+    """Check whether a game's obstacles already match an encoded static section."""
+    if len(game.obstacles) != static[1]:
+        return False
+    offset = STATIC_HEADER
+    for obstacle in game.obstacles:
+        if obstacle.position != (static[offset], static[offset + 1]):
+            return False
+        offset += OBSTACLE_FIELDS
+    return True
+
+
+def apply_static(game, static):
+    """Rebuild a game's obstacles from an encoded static section."""
+    if static[0] != game.grid_size:
+        raise ValueError(
+            f"Snapshot grid size {static[0]} does not match game grid size {game.grid_size}"
+        )
+
+    acquire = game.pools["obstacle"].acquire
+    color = COLORS["obstacle"]
+    obstacles = []
+    for offset in range(STATIC_HEADER, STATIC_HEADER + static[1] * OBSTACLE_FIELDS, OBSTACLE_FIELDS):
+        obstacles.append(acquire((static[offset], static[offset + 1]), color))
+
+    game.obstacles = obstacles
+    game.obstacle_positions = frozenset(obstacle.position for obstacle in obstacles)
+
+
+def _target(x, y):
+    """Decode an optional (x, y) target."""
+    return None if x == NONE else (x, y)
+
+
+def apply_dynamic(game, dynamic, reason):
+    """
+    Rebuild a game's players, allies, enemies and resources from an encoded
+    dynamic section. The previous entities must already be recycled.
+    """
+    turn_count, active, winner, n_allies, n_enemies, n_resources = dynamic[:DYNAMIC_HEADER]
+    pools = game.pools
+    offset = DYNAMIC_HEADER
+
+    players = []
+    for team, color in (("Blue", COLORS["player1"]), ("Red", COLORS["player2"])):
+        x, y, max_health, health, score, alive, decision, tx, ty = (
+            dynamic[offset:offset + PLAYER_FIELDS]
+        )
+        player = pools["player"].acquire((x, y), team, color, max_health)
+        player.health = health
+        player.score = score
+        player.alive = bool(alive)
+        player.decision_state = ACTION_CODES[decision]
+        player.target_position = _target(tx, ty)
+        players.append(player)
+        offset += PLAYER_FIELDS
+
+    game.player1, game.player2 = players
+
+    # Resources come last in the encoding but allies reference them
+    resource_offset = offset + n_allies * ALLY_FIELDS + n_enemies * ENEMY_FIELDS
+    resources = []
+    for _ in range(n_resources):
+        x, y, kind, collected = dynamic[resource_offset:resource_offset + RESOURCE_FIELDS]
+        resource_type = RESOURCE_CODES[kind]
+        resource = pools["resource"].acquire((x, y), resource_type, COLORS[resource_type])
+        resource.collected = bool(collected)
+        resources.append(resource)
+        resource_offset += RESOURCE_FIELDS
+
+    ally_colors = (COLORS["ally1"], COLORS["ally2"])
+    allies = []
+    for _ in range(n_allies):
+        x, y, owner, target = dynamic[offset:offset + ALLY_FIELDS]
+        ally = pools["ally"].acquire((x, y), players[owner], ally_colors[owner])
+        ally.target_resource = resources[target] if target != NONE else None
+        allies.append(ally)
+        offset += ALLY_FIELDS
+
+    enemies = []
+    for _ in range(n_enemies):
+        x, y, tx, ty = dynamic[offset:offset + ENEMY_FIELDS]
+        enemy = pools["enemy"].acquire((x, y), COLORS["enemy"])
+        enemy.target_position = _target(tx, ty)
+        enemies.append(enemy)
+        offset += ENEMY_FIELDS
+
+    game.allies = allies
+    game.enemies = enemies
+    game.resources = resources
+    game.turn_count = turn_count
+    game.game_active = bool(active)
+    game.winner = None if winner == NONE else players[winner]
+    game.game_over_reason = reason
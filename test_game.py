@@ -114,6 +114,1198 @@ def test_turn_execution():
         return False
 
 
+def test_game_config():
+    """Test running games with different configs in one process."""
+    print("\nTesting game configuration...")
+    try:
+        from ai.fuzzy_logic import FuzzyLogic
+        from config import GameConfig
+        from constants import ACTIONS
+        from game import SurvivalArenaGame
+
+        small = SurvivalArenaGame()
+        large = SurvivalArenaGame(
+            config=GameConfig(grid_size=60, max_enemies=12, max_obstacles=300, minimax_depth=2)
+        )
+
+        for _ in range(3):
+            small.execute_turn()
+            large.execute_turn()
+
+        assert small.grid_size == 20 and len(small.enemies) == 4
+        assert large.grid_size == 60 and len(large.enemies) == 12
+        assert all(0 <= c < 60 for e in large.enemies for c in e.position)
+        print(f"  ✓ 20x20 game: {len(small.obstacles)} obstacles, {len(small.enemies)} enemies")
+        print(f"  ✓ 60x60 game: {len(large.obstacles)} obstacles, {len(large.enemies)} enemies")
+
+        # Distances are scaled to the grid, and FAR covers everything past it
+        assert FuzzyLogic.distance_membership(25)["FAR"] == 1.0
+        assert FuzzyLogic.decide_action(10, 0, 60, 3, grid_size=100) == ACTIONS["SEEK_HEALTH"]
+        assert FuzzyLogic.decide_action(10, 0, 5, 3, grid_size=100) == ACTIONS["FLEE_ENEMY"]
+        assert FuzzyLogic.decide_action(10, 0, 400, 3, grid_size=500) == ACTIONS["SEEK_HEALTH"]
+        print("  ✓ Fuzzy distances scale with the grid size")
+
+        print("\nGame configuration working!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Game configuration test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_snapshot_and_fork():
+    """Test snapshot/restore and fork reproduce the same game."""
+    print("\nTesting snapshots and forks...")
+    try:
+        from game import SurvivalArenaGame
+
+        def state(game):
+            return (
+                game.turn_count,
+                [(p.position, p.health, p.score, p.decision_state) for p in (game.player1, game.player2)],
+                [ally.position for ally in game.allies],
+                [enemy.position for enemy in game.enemies],
+                [(r.position, r.type, r.collected) for r in game.resources],
+                game.game_over_reason,
+            )
+
+        game = SurvivalArenaGame(seed=7)
+        for _ in range(10):
+            game.execute_turn()
+
+        checkpoint = game.snapshot()
+        fork = game.fork()
+        print(f"  ✓ Snapshot size: {len(checkpoint)} bytes")
+
+        while game.is_active():
+            game.execute_turn()
+        final = state(game)
+
+        while fork.is_active():
+            fork.execute_turn()
+        assert state(fork) == final, "fork diverged"
+        print(f"  ✓ Fork finished identically at turn {fork.turn_count}")
+
+        game.restore(checkpoint)
+        assert game.turn_count == 10
+        while game.is_active():
+            game.execute_turn()
+        assert state(game) == final, "restored game diverged"
+        print("  ✓ Restored game replays identically")
+
+        fork.reset()
+        assert game.obstacles and state(game) == final, "resetting a fork touched its parent"
+        print("  ✓ Resetting the fork leaves the parent intact")
+
+        print("\nSnapshots and forks working!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Snapshot test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_replay_recording():
+    """Test recording a game and seeking to any turn of the replay."""
+    print("\nTesting replay recording...")
+    try:
+        import io
+        import snapshot
+        from game import SurvivalArenaGame
+        from replay import ReplayRecorder, ReplayReader
+
+        buffer = io.BytesIO()
+        game = SurvivalArenaGame(seed=3)
+        game.attach_recorder(ReplayRecorder(buffer, keyframe_interval=8))
+
+        states = {0: snapshot.dynamic_state(game)}
+        while game.is_active():
+            game.execute_turn()
+            states[game.turn_count] = snapshot.dynamic_state(game)
+        print(f"  ✓ Recorded {game.turn_count} turns in {len(buffer.getvalue())} bytes")
+
+        buffer.seek(0)
+        reader = ReplayReader(buffer)
+        assert reader.last_turn == game.turn_count
+        for turn in list(reversed(states)) + list(states):
+            _, dynamic, _ = reader.state_at(turn)
+            assert dynamic == states[turn], f"turn {turn} decoded wrong"
+        print("  ✓ Every turn decodes correctly (forward and backward seeks)")
+
+        final = reader.game_at(reader.last_turn)
+        assert final.game_over_reason == game.game_over_reason
+        assert final.player1.score == game.player1.score
+        print(f"  ✓ Final state restored: {final.game_over_reason}")
+
+        view = reader.view_at(reader.last_turn // 2)
+        assert snapshot.dynamic_state(view) == states[reader.last_turn // 2]
+        view = reader.view_at(reader.last_turn)
+        assert view.game_over_reason == game.game_over_reason and not view.is_active()
+        print("  ✓ Playback views match the recorded turns")
+
+        assert reader.seed == 3
+        for seed in (-5, 2 ** 64 + 7, -(2 ** 70)):
+            buffer = io.BytesIO()
+            game = SurvivalArenaGame(seed=seed)
+            recorder = ReplayRecorder(buffer)
+            game.attach_recorder(recorder)
+            game.execute_turn()
+            recorder.close()
+            buffer.seek(0)
+            reader = ReplayReader(buffer)
+            assert reader.seed == seed and reader.last_turn == 1
+        print("  ✓ Negative and wider than 64-bit seeds round-trip")
+
+        print("\nReplay recording working!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Replay test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_replay_playback():
+    """Test the replay viewer's key bindings and playback clock without a window."""
+    print("\nTesting replay playback...")
+    try:
+        import pygame
+        from replay_viewer import PAGE_TURNS, SPEEDS, ReplayPlayback, handle_key
+
+        playback = ReplayPlayback(0, 40, turn_rate=2, speed=3)
+        assert (playback.turn, playback.speed, playback.paused) == (0, 2, False)
+        print("  ✓ Initial speed rounds down to a supported multiplier")
+
+        for key, turn in (
+            (pygame.K_RIGHT, 1), (pygame.K_PAGEUP, 1 + PAGE_TURNS), (pygame.K_LEFT, PAGE_TURNS),
+            (pygame.K_PAGEDOWN, 0), (pygame.K_LEFT, 0), (pygame.K_END, 40), (pygame.K_PAGEUP, 40),
+            (pygame.K_HOME, 0),
+        ):
+            assert handle_key(key, playback)
+            assert playback.turn == turn, f"{pygame.key.name(key)} went to turn {playback.turn}"
+        print("  ✓ Step, page and jump keys seek within the recorded turns")
+
+        assert handle_key(pygame.K_UP, playback) and playback.speed == 4
+        for _ in SPEEDS:
+            handle_key(pygame.K_UP, playback)
+        assert playback.speed == SPEEDS[-1]
+        for _ in SPEEDS:
+            handle_key(pygame.K_DOWN, playback)
+        assert playback.speed == SPEEDS[0]
+        print(f"  ✓ UP/DOWN change the speed within {SPEEDS[0]}x-{SPEEDS[-1]}x")
+
+        assert playback.advance(1.0) and playback.turn == 2
+        assert not playback.advance(0.25) and playback.advance(0.25) and playback.turn == 3
+        handle_key(pygame.K_SPACE, playback)
+        assert playback.paused and not playback.advance(10.0) and playback.turn == 3
+        handle_key(pygame.K_RIGHT, playback)
+        assert playback.turn == 4
+        handle_key(pygame.K_SPACE, playback)
+        handle_key(pygame.K_UP, playback)
+        assert playback.advance(100.0) and playback.turn == 40 and not playback.advance(1.0)
+        print("  ✓ Playback advances with time at the chosen speed and stops while paused")
+
+        assert not handle_key(pygame.K_q, playback) and not handle_key(pygame.K_ESCAPE, playback)
+        print("  ✓ Q and ESC quit")
+
+        print("\nReplay playback working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Replay playback test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_turn_profiler():
+    """Test per-phase turn timing and Chrome trace export."""
+    print("\nTesting turn profiler...")
+    try:
+        from game import SurvivalArenaGame
+        from profiler import TurnProfiler, PHASES
+
+        game = SurvivalArenaGame(seed=4)
+        game.profiler = TurnProfiler(capacity=64)
+        while game.is_active():
+            game.execute_turn()
+
+        stats = game.profiler.summary()
+        for phase in PHASES:
+            assert phase in stats, f"missing phase {phase}"
+            assert stats[phase]["p50"] <= stats[phase]["p99"] <= stats[phase]["max"]
+        assert len(game.profiler.spans()) == 64
+        print(f"  ✓ All {len(PHASES)} phases timed, ring buffer capped at 64 spans")
+
+        trace = game.profiler.chrome_trace()
+        assert all(event["ph"] == "X" for event in trace["traceEvents"])
+        print(f"  ✓ Chrome trace with {len(trace['traceEvents'])} events")
+
+        print("\nTurn profiler working!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Profiler test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_ai_metrics():
+    """Test that the AI algorithms feed the metrics registry."""
+    print("\nTesting AI metrics...")
+    try:
+        from ai.metrics import METRICS
+        from game import SurvivalArenaGame
+
+        METRICS.reset()
+        game = SurvivalArenaGame(seed=6)
+        game.execute_turn()
+        assert METRICS.counters["astar.searches"].value == 0
+        print("  ✓ Nothing recorded while disabled")
+
+        METRICS.enabled = True
+        try:
+            while game.is_active():
+                game.execute_turn()
+        finally:
+            METRICS.enabled = False
+
+        data = METRICS.snapshot()
+        counters = data["counters"]
+        action_total = sum(v for k, v in counters.items() if k.startswith("fuzzy.action."))
+        assert counters["fuzzy.decisions"] == action_total > 0
+        assert data["histograms"]["astar.nodes_expanded"]["count"] == counters["astar.searches"]
+        assert counters["minimax.nodes"] >= counters["minimax.searches"] > 0
+        for line in METRICS.format_lines():
+            print(f"    {line}")
+        print("  ✓ A*, minimax and fuzzy metrics recorded")
+
+        METRICS.reset()
+        print("\nAI metrics working!")
+        return True
+    except Exception as e:
+        print(f"\n✗ AI metrics test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_turn_scheduler():
+    """Test that the turn scheduler degrades AI work only when short of time."""
+    print("\nTesting turn scheduler...")
+    try:
+        import snapshot
+        from ai.astar import AStarPathfinder
+        from ai.metrics import METRICS
+        from ai.profiles import BUILTIN_PROFILES
+        from game import SurvivalArenaGame
+        from scheduler import TurnScheduler
+
+        reference = SurvivalArenaGame(seed=8)
+        while reference.is_active():
+            reference.execute_turn()
+
+        game = SurvivalArenaGame(seed=8)
+        game.scheduler = TurnScheduler(budget_ms=60_000)
+        while game.is_active():
+            game.execute_turn()
+        assert snapshot.dynamic_state(game) == snapshot.dynamic_state(reference)
+        print("  ✓ Generous budget plays the same game as no scheduler")
+
+        profiles = (BUILTIN_PROFILES["greedy"], BUILTIN_PROFILES["default"])
+        reference = SurvivalArenaGame(seed=8, profiles=profiles)
+        while reference.is_active():
+            reference.execute_turn()
+        greedy_step = AStarPathfinder.greedy_step
+        steps = []
+
+        def counted_step(start, goal, obstacles, grid_size):
+            steps.append(start)
+            return greedy_step(start, goal, obstacles, grid_size)
+
+        game = SurvivalArenaGame(seed=8, profiles=profiles)
+        game.scheduler = TurnScheduler(budget_ms=60_000)
+        AStarPathfinder.greedy_step = staticmethod(counted_step)
+        try:
+            while game.is_active():
+                game.execute_turn()
+        finally:
+            AStarPathfinder.greedy_step = staticmethod(greedy_step)
+        assert steps and snapshot.dynamic_state(game) == snapshot.dynamic_state(reference)
+        print(f"  ✓ Greedy profile keeps its greedy steps under a scheduler ({len(steps)} steps)")
+
+        METRICS.reset()
+        game = SurvivalArenaGame(seed=8)
+        game.scheduler = TurnScheduler(budget_ms=0)
+        while game.is_active():
+            game.execute_turn()
+        counters = METRICS.snapshot()["counters"]
+        assert counters.get("scheduler.enemy.greedy", 0) > 0
+        assert counters["scheduler.turns"] == game.turn_count
+        print(f"  ✓ Zero budget falls back to greedy steps ({game.game_over_reason})")
+
+        # Minimax too slow: the enemy searches a path once, then follows it
+        # while A* is too slow as well
+        METRICS.reset()
+        game = SurvivalArenaGame(seed=8)
+        scheduler = TurnScheduler(budget_ms=60_000)
+        scheduler.start_turn(game)
+        depth = game.config.minimax_depth
+        for d in range(1, depth + 1):
+            scheduler._costs[("enemy", f"minimax_{d}")] = 3600.0
+        enemy, player1, player2 = game.enemies[0], game.player1, game.player2
+        args = (player1, player2, game.obstacle_positions, game.grid_size, depth)
+        target, step = scheduler.enemy_move(enemy, *args)
+        goal, path = scheduler._paths[enemy]
+        assert goal == target and path[1] == step
+        scheduler._costs[("enemy", "astar")] = 3600.0
+        enemy.move_to(step)
+        assert scheduler.enemy_move(enemy, *args) == (target, path[2])
+        counters = METRICS.snapshot()["counters"]
+        assert counters["scheduler.enemy.astar"] == counters["scheduler.enemy.cached_path"] == 1
+        print("  ✓ Enemies fall back to A* and then to its cached path")
+
+        METRICS.reset()
+        print("\nTurn scheduler working!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Turn scheduler test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_turn_pipeline():
+    """Test background turn computation, pausing and restart."""
+    print("\nTesting turn pipeline...")
+    try:
+        import time
+        import snapshot
+        from game import SurvivalArenaGame
+        from pipeline import TurnPipeline
+
+        reference = SurvivalArenaGame(seed=9)
+        expected = []
+        while reference.is_active():
+            reference.execute_turn()
+            expected.append(snapshot.dynamic_state(reference))
+
+        game = SurvivalArenaGame(seed=9)
+        pipeline = TurnPipeline(game, buffer_size=2)
+        pipeline.start()
+        try:
+            time.sleep(0.2)
+            assert pipeline.pending() == 2
+            print("  ✓ Worker stalls once the buffer is full (pause)")
+
+            states = []
+            while len(states) < len(expected):
+                state = pipeline.next_state(timeout=5.0)
+                assert state is not None, "worker stopped producing turns"
+                states.append(snapshot.dynamic_state(state))
+            assert states == expected
+            print(f"  ✓ {len(states)} precomputed turns match a direct run")
+
+            game.reset()
+            restarted = game.fork()
+            restarted.execute_turn()
+            pipeline.restart(game)
+            state = pipeline.next_state(timeout=5.0)
+            assert snapshot.dynamic_state(state) == snapshot.dynamic_state(restarted)
+            print("  ✓ Restart discards turns of the previous game")
+        finally:
+            pipeline.stop()
+
+        print("\nTurn pipeline working!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Turn pipeline test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_array_backend():
+    """Test that the NumPy entity backend plays identically to plain objects."""
+    print("\nTesting array entity backend...")
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("  - NumPy not installed, skipping")
+        return True
+
+    try:
+        import random
+        from game import SurvivalArenaGame
+
+        def state(game):
+            return (
+                game.turn_count,
+                [(p.position, p.health, p.score, p.alive) for p in (game.player1, game.player2)],
+                [ally.position for ally in game.allies],
+                [enemy.position for enemy in game.enemies],
+                [(r.position, r.type, r.collected) for r in game.resources],
+                game.game_over_reason,
+            )
+
+        for seed in range(5):
+            random.seed(seed)
+            objects_game = SurvivalArenaGame()
+            while objects_game.is_active():
+                objects_game.execute_turn()
+
+            random.seed(seed)
+            arrays_game = SurvivalArenaGame(backend="arrays")
+            while arrays_game.is_active():
+                arrays_game.execute_turn()
+
+            assert state(objects_game) == state(arrays_game), f"seed {seed} diverged"
+            print(f"  ✓ Seed {seed}: {arrays_game.game_over_reason}")
+
+        assert SurvivalArenaGame("arrays", seed=0).backend == "arrays"
+        print("  ✓ Backend is the first positional argument")
+
+        print("\nArray backend matches object backend!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Array backend test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_entity_pools():
+    """Test that reset() reuses pooled entities and plays like a fresh game."""
+    print("\nTesting entity pools...")
+    try:
+        from game import SurvivalArenaGame
+        from snapshot import dynamic_state
+
+        def entities(game):
+            return [game.player1, game.player2, *game.allies, *game.enemies,
+                    *game.resources, *game.obstacles]
+
+        for backend in ("objects", "arrays"):
+            game = SurvivalArenaGame(backend, seed=3)
+            before = {id(entity) for entity in entities(game)}
+            game.reset()
+            after = entities(game)
+            assert {id(entity) for entity in after} == before
+            assert all(not hasattr(entity, "__dict__") for entity in after)
+            print(f"  ✓ {backend}: reset() reuses all {len(after)} entities, none with a __dict__")
+
+            # Play into the game so the pools hold entities with stale state
+            for _ in range(15):
+                game.execute_turn()
+            game.rng.seed(11)
+            game.reset()
+            fresh = SurvivalArenaGame(backend, seed=11)
+            assert game.obstacle_positions == fresh.obstacle_positions
+            turns = 0
+            while fresh.is_active() and turns < 40:
+                assert dynamic_state(game) == dynamic_state(fresh), (backend, turns)
+                game.execute_turn()
+                fresh.execute_turn()
+                turns += 1
+            assert dynamic_state(game) == dynamic_state(fresh)
+            print(f"  ✓ {backend}: reset game matches a fresh seeded game for {turns} turns")
+
+        print("\nEntity pools working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Entity pool test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_text_cache():
+    """Test the LRU cache of rendered text surfaces."""
+    print("\nTesting text cache...")
+    try:
+        import pygame
+        from rendering import TextCache
+
+        pygame.font.init()
+        font = pygame.font.Font(None, 24)
+        other_font = pygame.font.Font(None, 32)
+        cache = TextCache(capacity=2)
+        color = (0, 0, 0)
+
+        first = cache.render(font, "Score", True, color)
+        assert cache.render(font, "Score", True, color) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        print("  ✓ Repeated text is rendered once")
+
+        assert cache.render(font, "Score", True, (255, 0, 0)) is not first
+        assert cache.render(font, "Score", False, color) is not first
+        assert len(cache) == 2
+        assert cache.render(font, "Score", True, color) is not first
+        print("  ✓ Color and antialias are part of the key; LRU entries are evicted")
+
+        cache.render(other_font, "Score", True, color)
+        cache.invalidate(font)
+        assert len(cache) == 1
+        cache.invalidate()
+        assert len(cache) == 0
+        print(f"  ✓ Invalidation per font and in full (hit rate {cache.hit_rate:.2f})")
+
+        print("\nText cache working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Text cache test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_camera():
+    """Test the board camera and the spatial index used for culling."""
+    print("\nTesting camera...")
+    try:
+        from camera import Camera, SpatialIndex, MAX_CELL_SIZE
+        from constants import COLORS
+        from entities import Obstacle
+
+        camera = Camera(600, 600)
+        camera.fit(20)
+        assert (camera.cell_size, camera.left, camera.top) == (30, 0, 0)
+        assert camera.visible_cells() == (0, 0, 20, 20)
+        camera.pan(-100, -100)
+        assert (camera.left, camera.top) == (0, 0), "a board that fits can't be panned"
+        print("  ✓ Fits a 20x20 board at 30 px per cell")
+
+        camera.zoom(1, anchor=(300, 300))
+        assert camera.cell_size > 30
+        # The cell under the anchor stays under it
+        assert (camera.left + 300) // camera.cell_size == 10
+        camera.pan(10_000, 10_000)
+        assert (camera.left, camera.top) == (0, 0)
+        camera.pan(-10_000, -10_000)
+        assert camera.left == camera.board_size - 600
+        assert camera.visible_cells()[2] == 20
+        camera.zoom(100)
+        assert camera.cell_size == MAX_CELL_SIZE
+        camera.zoom(-100)
+        assert camera.cell_size == 30 and camera.left == 0
+        print("  ✓ Zoom keeps the anchor cell and pan stays on the board")
+
+        camera.fit(1000)
+        assert camera.cell_size == 1
+        camera.pan(-250, -400)
+        assert camera.visible_cells() == (250, 400, 850, 1000)
+        print(f"  ✓ Large board: {camera.visible_cells()} in view at 1 px per cell")
+
+        obstacles = [Obstacle((x, (x * 7) % 50), COLORS["obstacle"]) for x in range(50)]
+        index = SpatialIndex(obstacles, chunk_size=8)
+        expected = [
+            i for i, o in enumerate(obstacles)
+            if 10 <= o.position[0] < 30 and 5 <= o.position[1] < 25
+        ]
+        assert index.query(10, 5, 30, 25) == expected
+        assert index.query(0, 0, 50, 50) == list(range(50))
+        assert index.query(5, 5, 5, 9) == []
+        print(f"  ✓ Spatial index finds {len(expected)} entities in a window, in list order")
+
+        print("\nCamera working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Camera test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_headless_export():
+    """Test offscreen rendering to PNG frames and to an encoder pipe."""
+    print("\nTesting headless export...")
+    try:
+        import os
+        import tempfile
+        import pygame
+        import export
+        from config import GameConfig
+        from game import SurvivalArenaGame
+
+        renderer = export.offscreen_renderer()
+        game = SurvivalArenaGame(config=GameConfig(max_turns=4), seed=1)
+        renderer.render_game(game)
+        rgb = pygame.image.tobytes(renderer.screen, "RGB")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frame.png")
+            with open(path, "wb") as f:
+                f.write(export.encode_png(*renderer.screen.get_size(), rgb))
+            assert pygame.image.tobytes(pygame.image.load(path), "RGB") == rgb
+            print("  ✓ Encoded PNG decodes to the rendered pixels")
+
+            writer = export.PngSequenceWriter(directory, *renderer.screen.get_size(), workers=2)
+            frames = export.export_frames(
+                renderer, export.live_states(game), writer, fps=4, turn_rate=2, hold=0.5
+            )
+            writer.close()
+            assert frames == (game.turn_count + 1) * 2 + 2
+            assert os.path.exists(writer.path(frames - 1)) and not os.path.exists(writer.path(frames))
+            print(f"  ✓ {frames} PNG frames for a {game.turn_count}-turn game")
+
+        consumer = [sys.executable, "-c", "import sys; sys.exit(len(sys.stdin.buffer.read()) != 3 * %d)" % len(rgb)]
+        writer = export.PipeWriter(consumer)
+        for _ in range(3):
+            writer.write(rgb)
+        writer.close()
+        print("  ✓ Raw frames piped to an encoder process")
+
+        print("\nHeadless export working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Headless export test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_dirty_rect_rendering():
+    """Test that incremental frames match a fresh renderer's full redraw."""
+    print("\nTesting dirty-rect rendering...")
+    try:
+        import pygame
+        import export
+        from game import SurvivalArenaGame
+
+        def full_draw(game, previous, alpha):
+            fresh = export.offscreen_renderer()
+            if previous is not None:
+                fresh.render_game(previous)
+                fresh.invalidate()
+            fresh.render_game(game, alpha)
+            return pygame.image.tobytes(fresh.screen, "RGB")
+
+        renderer = export.offscreen_renderer()
+        game = SurvivalArenaGame(seed=5)
+        renderer.render_game(game)
+        assert pygame.image.tobytes(renderer.screen, "RGB") == full_draw(game, None, 1.0)
+
+        frames = 0
+        partial = 0
+        tweened = 0
+        for _ in range(6):
+            if not game.is_active():
+                break
+            previous = game.fork()
+            game.execute_turn()
+            for alpha in (0.0, 0.5, 1.0):
+                dirty = renderer.render_game(game, alpha)
+                partial += dirty != [renderer.screen.get_rect()]
+                frame = pygame.image.tobytes(renderer.screen, "RGB")
+                assert frame == full_draw(game, previous, alpha), (game.turn_count, alpha)
+                frames += 1
+
+            # Tween endpoints: alpha 0 is the previous cell, alpha 1 the current one
+            moved = [(("player", 0), previous.player1.position, game.player1.position),
+                     (("player", 1), previous.player2.position, game.player2.position)]
+            moved += [(("ally", i), before.position, after.position)
+                      for i, (before, after) in enumerate(zip(previous.allies, game.allies))]
+            moved += [(("enemy", i), before.position, after.position)
+                      for i, (before, after) in enumerate(zip(previous.enemies, game.enemies))]
+            for key, before, after in moved:
+                start = (renderer._pixel_x[before[0]], renderer._pixel_y[before[1]])
+                end = (renderer._pixel_x[after[0]], renderer._pixel_y[after[1]])
+                assert renderer._tween(key, after, 0.0) == start
+                assert renderer._tween(key, after, 1.0) == end
+                tweened += before != after
+        assert partial > 0 and tweened > 0
+        print(f"  ✓ {frames} incremental frames at alpha 0, 0.5 and 1 match full redraws")
+        print(f"  ✓ Tweens start at the previous cell and end at the current one ({tweened} moves)")
+
+        walls = set(game.obstacle_positions)
+        shown = renderer._shown_background
+        game.reset()
+        assert set(game.obstacle_positions) != walls
+        renderer.render_game(game)
+        assert renderer._shown_background is not shown
+        assert pygame.image.tobytes(renderer.screen, "RGB") == full_draw(game, None, 1.0)
+        game.execute_turn()
+        renderer.render_game(game, 0.5)
+        previous = game.fork()
+        game.execute_turn()
+        renderer.render_game(game, 0.5)
+        assert pygame.image.tobytes(renderer.screen, "RGB") == full_draw(game, previous, 0.5)
+        print("  ✓ Reset rebuilds the wall layer and keeps frames matching full redraws")
+
+        print("\nDirty-rect rendering working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Dirty-rect rendering test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_texture_atlas():
+    """Test that the texture atlas matches the individually loaded icons."""
+    print("\nTesting texture atlas...")
+    try:
+        import os
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        import pygame
+        from assets import ASSET_MANIFEST, AssetLoader
+
+        pygame.display.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+
+        atlas = AssetLoader()
+        files = AssetLoader(use_atlas=False)
+        assert atlas.from_atlas, "icons/atlas.png is missing or stale; run scripts/build_assets.py"
+        print(f"  ✓ {len(ASSET_MANIFEST)} icons loaded from one atlas image")
+
+        for group, name, file, size in ASSET_MANIFEST:
+            image = atlas._group(group)[name]
+            expected = files._group(group)[name]
+            assert image.get_size() == size
+            assert pygame.image.tobytes(image, "RGBA") == pygame.image.tobytes(expected, "RGBA"), file
+        print("  ✓ Atlas icons match the scaled individual files pixel for pixel")
+
+        import subprocess
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts", "build_assets.py")
+        check = subprocess.run([sys.executable, script, "--check"], capture_output=True, text=True)
+        assert check.returncode == 0, check.stdout
+        print("  ✓ Atlas hashes match the icon files (build_assets.py --check)")
+
+        print("\nTexture atlas working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Texture atlas test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_headless_imports():
+    """Test that the simulation core runs without loading pygame or the UI."""
+    print("\nTesting headless imports...")
+    try:
+        import os
+        import subprocess
+
+        code = (
+            "import sys\n"
+            "import game, entities, constants, ai, config, snapshot, replay, pipeline, scheduler, profiler\n"
+            "g = game.SurvivalArenaGame(seed=0)\n"
+            "for _ in range(20):\n"
+            "    g.execute_turn()\n"
+            "print(' '.join(m for m in ('pygame', 'numpy', 'assets', 'rendering', 'camera') if m in sys.modules))\n"
+        )
+        root = os.path.dirname(os.path.abspath(__file__))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        loaded = result.stdout.split()
+        assert not loaded, f"simulation core imported {', '.join(loaded)}"
+        print("  ✓ Core modules import and play turns without pygame, numpy or assets")
+
+        print("\nHeadless imports working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Headless imports test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_tournament():
+    """Test AI profiles, Elo fitting and checkpointed tournaments."""
+    print("\nTesting tournament runner...")
+    try:
+        import os
+        import tempfile
+        from ai.fuzzy_logic import DEFAULT_RULES, FuzzyRuleSet
+        from ai.profiles import BUILTIN_PROFILES, DEFAULT_PROFILE, AIProfile
+        from game import SurvivalArenaGame
+        from tournament import Tournament, fit_elo
+
+        assert FuzzyRuleSet.from_dict(DEFAULT_RULES.to_dict()) == DEFAULT_RULES
+        profile = BUILTIN_PROFILES["cautious"]
+        assert AIProfile.from_dict(profile.to_dict()) == profile
+        try:
+            FuzzyRuleSet(health_medium=(50, 30, 70))
+            assert False, "unsorted breakpoints accepted"
+        except ValueError:
+            pass
+        print("  ✓ Rule sets and profiles round-trip through dicts and are validated")
+
+        plain = SurvivalArenaGame(seed=5)
+        explicit = SurvivalArenaGame(seed=5, profiles=(DEFAULT_PROFILE, AIProfile()))
+        for _ in range(15):
+            plain.execute_turn()
+            explicit.execute_turn()
+        assert plain.snapshot() == explicit.snapshot()
+        greedy = SurvivalArenaGame(seed=5, profiles=(BUILTIN_PROFILES["greedy"], DEFAULT_PROFILE))
+        assert greedy.fork().profiles == greedy.profiles
+        print("  ✓ Default profiles play exactly like the original AI")
+
+        results = [{"a": "x", "b": "y", "result": 1.0}] * 8 + [{"a": "x", "b": "y", "result": 0.0}] * 2
+        ratings = fit_elo(["x", "y"], results)
+        assert ratings["x"][0] > 1500 > ratings["y"][0]
+        assert abs(ratings["x"][0] + ratings["y"][0] - 3000) < 1e-6
+        even = fit_elo(["x", "y"], [{"a": "x", "b": "y", "result": 0.5}] * 10)
+        assert abs(even["x"][0] - 1500) < 1e-6 and even["x"][1] < ratings["x"][1] * 2
+        print(f"  ✓ 8-2 record rates {ratings['x'][0]:.0f} ± {ratings['x'][1]:.0f} vs {ratings['y'][0]:.0f}")
+
+        profiles = {name: BUILTIN_PROFILES[name] for name in ("default", "greedy", "aggressive")}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "run.jsonl")
+            full = Tournament(profiles, games=2, checkpoint=path)
+            full.run(jobs=1)
+            assert len(full.results) == 6
+
+            # Cut the checkpoint mid-record, as an interrupted run would
+            with open(path) as f:
+                lines = f.read().splitlines()
+            with open(path, "w") as f:
+                f.write("\n".join(lines[:3]) + "\n" + lines[3][:20])
+            resumed = Tournament(profiles, games=2, checkpoint=path)
+            assert 0 < len(resumed.results) < 6
+            resumed.run(jobs=2)
+
+            def key(record):
+                return record["a"], record["b"], record["game"]
+
+            assert sorted(resumed.results, key=key) == sorted(full.results, key=key)
+            assert len(Tournament(profiles, games=2, checkpoint=path).results) == 6
+            print("  ✓ Interrupted tournament resumes on a process pool with the same results")
+
+            swiss = Tournament(profiles, games=2)
+            swiss.run("swiss", rounds=2, jobs=1)
+            assert len(swiss.results) == 4 and len(swiss.format_standings()) == 4
+            sat_out = [
+                set(profiles) - {r[side] for r in swiss.results if r["round"] == i for side in "ab"}
+                for i in range(2)
+            ]
+            assert sat_out[0] != sat_out[1]
+            print("  ✓ Swiss rounds play with one profile sitting out in turn")
+
+        print("\nTournament runner working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Tournament test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_fuzzy_optimizer():
+    """Test the genetic optimizer's encoding, cache and output file."""
+    print("\nTesting fuzzy rule optimizer...")
+    try:
+        import os
+        import random
+        import tempfile
+        from ai.fuzzy_logic import DEFAULT_RULES
+        from ai.profiles import AIProfile, load_profiles, save_profiles
+        from config import GameConfig
+        from optimizer import PARAMETERS, GeneticOptimizer, decode, encode
+
+        assert decode(encode(DEFAULT_RULES)) == DEFAULT_RULES
+        rng = random.Random(1)
+        for _ in range(20):
+            decode([rng.uniform(low - 10, high + 10) for _, _, low, high, _ in PARAMETERS])
+        print(f"  ✓ {len(PARAMETERS)} genes; any vector decodes to a valid rule set")
+
+        config = GameConfig(max_enemies=0)
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = os.path.join(tmp, "cache.jsonl")
+            with GeneticOptimizer(config=config, games=2, population=4, cache=cache, jobs=1) as first:
+                rules, fitness = first.run(generations=3)
+            assert first.evaluations > 0 and first.cache_hits > 0
+
+            with GeneticOptimizer(config=config, games=2, population=4, cache=cache, jobs=1) as again:
+                assert again.run(generations=3) == (rules, fitness)
+            assert again.evaluations == 0
+            print(f"  ✓ {first.evaluations} candidates played; rerun replayed entirely from the cache")
+
+            path = os.path.join(tmp, "tuned.json")
+            save_profiles(path, {"tuned": AIProfile(rules)})
+            assert load_profiles(path)["tuned"].rules == rules
+            print(f"  ✓ Best rule set (fitness {fitness:.3f}) written as a loadable profile")
+
+        print("\nFuzzy rule optimizer working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Fuzzy optimizer test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_arena_env():
+    """Test the reinforcement-learning environments."""
+    print("\nTesting arena environments...")
+    try:
+        import numpy as np
+        from arena_env import CHANNELS, MOVES, ArenaEnv, VectorArenaEnv
+
+        env = ArenaEnv(controlled=(0, 1))
+        obs, _ = env.reset(seed=3)
+        grid = obs["grid"]
+        assert grid.shape == (2, len(CHANNELS), 20, 20) and grid.dtype == np.uint8
+        game = env.game
+        x, y = game.player1.position
+        assert grid[0, CHANNELS.index("self"), y, x] == 1
+        assert (grid[1, CHANNELS.index("opponent")] == grid[0, CHANNELS.index("self")]).all()
+        assert grid[0, CHANNELS.index("obstacle")].sum() == len(game.obstacles)
+        assert grid[0, CHANNELS.index("enemy")].sum() == len(game.enemies)
+        again, _ = ArenaEnv(controlled=(0, 1)).reset(seed=3)
+        assert (again["grid"] == grid).all()
+        print(f"  ✓ {len(CHANNELS)}-channel observations from both players' points of view")
+
+        start = game.player1.position
+        obs, rewards, terminated, truncated, info = env.step([0, MOVES.index((1, 0))])
+        assert game.player1.position == start or not game.player1.alive
+        while not (terminated or truncated):
+            obs, rewards, terminated, truncated, info = env.step([1, 2])
+        if info["winner"] is not None:
+            assert rewards[info["winner"]] >= 1.0 and rewards[1 - info["winner"]] < 0
+        print(f"  ✓ Externally controlled game ended after {info['turn']} turns: {info['reason']}")
+
+        vector = VectorArenaEnv(8, controlled=(0, 1))
+        obs, _ = vector.reset(seed=0)
+        arena = vector.arena
+        assert obs["grid"].shape == (8, 2, len(CHANNELS), 20, 20)
+        for k in range(8):
+            (x1, y1), (x2, y2) = arena.players[k]
+            assert obs["grid"][k, 0, CHANNELS.index("self"), y1, x1] == 1
+            assert obs["grid"][k, 1, CHANNELS.index("self"), y2, x2] == 1
+            assert obs["grid"][k, 0, CHANNELS.index("obstacle")].sum() == arena.walls[k].sum()
+            assert (obs["grid"][k, 0, CHANNELS.index("obstacle")].T == arena.walls[k]).all()
+            assert obs["grid"][k, 0, CHANNELS.index("enemy")].sum() == len(set(map(tuple, arena.enemies[k])))
+        assert (obs["grid"][:, 1, CHANNELS.index("own_ally")] == obs["grid"][:, 0, CHANNELS.index("opponent_ally")]).all()
+        print("  ✓ Batched observations are scattered from the engine's arrays")
+
+        right = MOVES.index((1, 0))
+        finished = 0
+        for _ in range(60):
+            before = arena.players.copy()
+            obs, rewards, terminated, truncated, info = vector.step(np.full((8, 2), right))
+            ended = info["final_observation"]["index"] if "final_observation" in info else []
+            if len(ended):
+                assert (terminated | truncated)[ended].all()
+                assert not (terminated | truncated)[np.setdiff1d(np.arange(8), ended)].any()
+                finished += len(ended)
+            for k in np.setdiff1d(np.arange(8), ended):
+                for player in (0, 1):
+                    target = before[k, player] + (1, 0)
+                    if not arena.alive[k, player]:
+                        continue
+                    if target[0] < 20 and not arena.walls[k, target[0], target[1]]:
+                        assert (arena.players[k, player] == target).all()
+                    else:
+                        assert (arena.players[k, player] == before[k, player]).all()
+        assert finished > 0 and arena.active == 8
+        print(f"  ✓ 8 lockstep games take the actions and auto-reset after {finished} endings")
+
+        again = VectorArenaEnv(8, controlled=(0, 1))
+        again.reset(seed=0)
+        for _ in range(60):
+            repeat, *_ = again.step(np.full((8, 2), right))
+        assert (repeat["grid"] == obs["grid"]).all() and (repeat["stats"] == obs["stats"]).all()
+        print("  ✓ The same seed replays the same batch")
+
+        frozen = VectorArenaEnv(4, autoreset=False)
+        frozen.reset(seed=1)
+        while frozen.arena.active:
+            obs, rewards, terminated, truncated, info = frozen.step(np.zeros(4, int))
+        last = obs["grid"].copy()
+        obs, rewards, terminated, truncated, info = frozen.step(np.zeros(4, int))
+        assert (obs["grid"] == last).all() and not rewards.any() and not (terminated | truncated).any()
+        print("  ✓ Without autoreset finished games keep their final observation")
+
+        print("\nArena environments working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Arena environment test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def test_batch_simulation():
+    """Test the batched simulation engine against SurvivalArenaGame."""
+    print("\nTesting batch simulation...")
+    try:
+        import numpy as np
+        from ai.astar import AStarPathfinder
+        from ai.fuzzy_logic import DEFAULT_RULES, FuzzyLogic
+        from ai.minimax import MinimaxAI
+        from batch_sim import (
+            ACTION_ORDER, BatchArena, compare_outcomes, fuzzy_actions, reference_results, simulate_batch,
+        )
+
+        rng = np.random.default_rng(0)
+        health = rng.integers(0, 101, 300)
+        score = rng.integers(0, 500, 300)
+        distance = rng.integers(0, 121, 300)
+        for grid_size in (20, 60):
+            actions = fuzzy_actions(health, score, distance, DEFAULT_RULES, 100, 500, grid_size)
+            for h, s, d, action in zip(health, score, distance, actions):
+                expected = FuzzyLogic.decide_action(int(h), int(s), int(d), 5, grid_size=grid_size)
+                assert ACTION_ORDER[action] == expected
+        print("  ✓ Vectorized fuzzy decisions match FuzzyLogic")
+
+        arena = BatchArena(50, seed=1)
+        cells = rng.integers(0, 20, arena.enemies.shape)
+        on_wall = arena.walls[np.arange(50)[:, None], cells[..., 0], cells[..., 1]]
+        arena.enemies = np.where(on_wall[..., None], arena.enemies, cells)
+        arena.player_health = rng.integers(1, 101, (50, 2))
+        games = np.repeat(np.arange(50), arena.enemies.shape[1])
+        moves = arena._minimax_moves(arena.enemies.reshape(-1, 2), games)
+        goals = rng.integers(0, 20, (len(games), 2))
+        steps = arena._flow_steps(arena.enemies.reshape(-1, 2), goals, games)
+        for i, g in enumerate(games):
+            obstacles = {tuple(cell) for cell in np.argwhere(arena.walls[g])}
+            players = arena.players[g]
+            _, move = MinimaxAI.choose_target_and_move(
+                tuple(arena.enemies.reshape(-1, 2)[i]), tuple(players[0]), tuple(players[1]),
+                int(arena.player_health[g, 0]), int(arena.player_health[g, 1]), obstacles, 20, 3,
+            )
+            assert tuple(moves[i]) == move
+            path = AStarPathfinder.find_path(tuple(arena.enemies.reshape(-1, 2)[i]), tuple(goals[i]), obstacles, 20)
+            if len(path) > 1:
+                rest = AStarPathfinder.find_path(tuple(steps[i]), tuple(goals[i]), obstacles, 20)
+                assert len(rest) == len(path) - 1 and rest[-1] == path[-1]
+            else:
+                assert tuple(steps[i]) == path[0]
+        print(f"  ✓ {len(games)} enemy searches match MinimaxAI; flow steps follow shortest paths")
+
+        batch = simulate_batch(1200, seed=0)
+        assert len(batch["winner"]) == 1200 and (batch["turns"] > 0).all()
+        reference = reference_results(150, seed=0)
+        tests = compare_outcomes(reference, batch)
+        for name, (statistic, df, p) in tests.items():
+            assert p > 0.001, f"{name} distributions differ (chi2={statistic:.1f}, df={df}, p={p:.2g})"
+        summary = ", ".join(f"{name} p={p:.2f}" for name, (_, _, p) in tests.items())
+        print(f"  ✓ 1200 batched games match 150 reference games ({summary})")
+
+        print("\nBatch simulation working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Batch simulation test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+def _shared_map_walls(map_id):
+    """Worker task for test_shared_maps: attach to a map by ID in another process."""
+    from map_registry import attach
+
+    shared = attach(map_id)
+    return sorted(shared.obstacles), shared.distance((0, 0), (19, 19))
+
+
+def test_shared_maps():
+    """Test the shared memory map registry."""
+    print("\nTesting shared maps...")
+    try:
+        import random
+        from concurrent.futures import ProcessPoolExecutor
+        from ai.astar import AStarPathfinder
+        from game import SurvivalArenaGame
+        from map_registry import MAX_GRID_SIZE, MapRegistry, attach
+        from tournament import Tournament
+        from ai.profiles import BUILTIN_PROFILES
+
+        with MapRegistry() as registry:
+            map_id = registry.add_game_map(None, 11)
+            assert registry.add(20, registry[map_id].obstacles) == map_id and len(registry) == 1
+            shared = attach(map_id)
+            walls = shared.obstacle_set
+            assert walls == SurvivalArenaGame(seed=11).obstacle_positions
+
+            rng = random.Random(0)
+            for _ in range(100):
+                start = (rng.randrange(20), rng.randrange(20))
+                goal = (rng.randrange(20), rng.randrange(20))
+                if start in walls:
+                    continue
+                path = AStarPathfinder.find_path(start, goal, walls, 20)
+                if len(path) > 1:
+                    assert shared.distance(start, goal) == len(path) - 1
+                    assert shared.distance(shared.next_step(start, goal), goal) == len(path) - 2
+                else:
+                    assert shared.next_step(start, goal) == start
+            print("  ✓ Distance table and path steps match A*")
+
+            game = SurvivalArenaGame(seed=5, map_id=map_id)
+            assert game.obstacle_positions == walls
+            fork = game.fork()
+            while game.is_active():
+                game.execute_turn()
+            while fork.is_active():
+                fork.execute_turn()
+            assert fork.turn_count == game.turn_count and fork.game_over_reason == game.game_over_reason
+            game.reset()
+            assert game.obstacle_positions == walls
+            print(f"  ✓ Game on map {map_id} finished after {fork.turn_count} turns; fork and reset keep the map")
+
+            with ProcessPoolExecutor(1) as pool:
+                remote_walls, distance = pool.submit(_shared_map_walls, map_id).result()
+            assert remote_walls == sorted(walls) and distance == shared.distance((0, 0), (19, 19))
+            print("  ✓ Worker process attached by map ID")
+
+        try:
+            attach(map_id)
+            raise AssertionError("map still attached after the registry closed")
+        except KeyError:
+            pass
+        print("  ✓ Closing the registry unlinks its maps")
+
+        with MapRegistry() as registry:
+            try:
+                registry.add(MAX_GRID_SIZE + 1, ())
+                raise AssertionError(f"registered a {MAX_GRID_SIZE + 1}x{MAX_GRID_SIZE + 1} map")
+            except ValueError:
+                pass
+            assert len(registry) == 0
+        print(f"  ✓ Grids above {MAX_GRID_SIZE}x{MAX_GRID_SIZE} are rejected")
+
+        tournament = Tournament(
+            {name: BUILTIN_PROFILES[name] for name in ("default", "greedy")}, games=4, maps=2
+        )
+        tournament.run(jobs=1)
+        assert len(tournament.results) == 4
+        print("  ✓ Tournament played on 2 shared maps")
+
+        print("\nShared maps working correctly!")
+        return True
+    except Exception as e:
+        print(f"\n✗ Shared map test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -125,6 +1317,27 @@ def main():
         test_game_initialization,
         test_ai_algorithms,
         test_turn_execution,
+        test_game_config,
+        test_snapshot_and_fork,
+        test_replay_recording,
+        test_replay_playback,
+        test_turn_profiler,
+        test_ai_metrics,
+        test_turn_scheduler,
+        test_turn_pipeline,
+        test_array_backend,
+        test_entity_pools,
+        test_text_cache,
+        test_camera,
+        test_headless_export,
+        test_dirty_rect_rendering,
+        test_texture_atlas,
+        test_headless_imports,
+        test_tournament,
+        test_fuzzy_optimizer,
+        test_arena_env,
+        test_batch_simulation,
+        test_shared_maps,
     ]
 
     results = []
@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+Tournament runner for the AI vs AI Survival Arena
+Plays round-robin or Swiss tournaments between AI profiles on a pool of
+worker processes, appends every result to a checkpoint file as it arrives
+(so interrupted runs resume where they stopped) and rates the profiles with
+Elo ratings and confidence intervals
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict
+from itertools import combinations
+
+from ai.profiles import BUILTIN_PROFILES, load_profiles
+from config import GameConfig
+from game import SurvivalArenaGame
+from map_registry import MAX_GRID_SIZE, MapRegistry
+
+FORMATS = ("round-robin", "swiss")
+
+# Games per pairing; an even number lets both profiles play each map as Blue and as Red
+DEFAULT_GAMES = 10
+
+# Most games sent to a worker at once (fewer when a round is too small to fill the pool)
+GAMES_PER_TASK = 8
+
+# Tasks queued per worker process, so a worker never waits for the next one
+TASKS_IN_FLIGHT = 4
+
+# Elo scale: a 400 point gap means 10:1 odds
+ELO_BASE = 1500
+ELO_SCALE = 400 / math.log(10)
+
+# Virtual draws of every profile against an average opponent, which keeps
+# the ratings of unbeaten or winless profiles finite
+PRIOR_GAMES = 2
+
+# z for the two-sided 95% confidence intervals
+CONFIDENCE_Z = 1.96
+
+CHECKPOINT_VERSION = 1
+
+
+def game_seed(seed, round_index, a, b, game):
+    """
+    Seed of one game of a pairing.
+
+    Consecutive games (0 and 1, 2 and 3, ...) share a seed with the sides
+    swapped, so every map is played from both corners.
+    """
+    return random.Random(f"{seed}:{round_index}:{a}:{b}:{game // 2}").getrandbits(64)
+
+
+def map_seed(seed, index):
+    """Seed of the game whose walls become shared map number index."""
+    return random.Random(f"{seed}:map:{index}").getrandbits(64)
+
+
+def play_game(profile_a, profile_b, config, seed, a_is_blue, map_id=None):
+    """
+    Play one game between two profiles.
+
+    Args:
+        map_id: shared map to play on (see map_registry.py); the seed's
+            random map if omitted
+
+    Returns:
+        Tuple of (result for a: 1, 0.5 or 0, score of a, score of b, turns)
+    """
+    profiles = (profile_a, profile_b) if a_is_blue else (profile_b, profile_a)
+    game = SurvivalArenaGame(config=config, seed=seed, profiles=profiles, map_id=map_id)
+    while game.is_active():
+        game.execute_turn()
+
+    player_a, player_b = (game.player1, game.player2) if a_is_blue else (game.player2, game.player1)
+    if game.winner is None:
+        result = 0.5
+    else:
+        result = 1.0 if game.winner is player_a else 0.0
+    return result, player_a.score, player_b.score, game.turn_count
+
+
+# Worker process state, set once by _init_worker instead of sent with every task
+_worker_profiles = None
+_worker_config = None
+_worker_maps = ()
+
+
+def _init_worker(profiles, config, map_ids=()):
+    """Pool initializer: keep the profiles, arena config and shared map IDs for the tasks."""
+    global _worker_profiles, _worker_config, _worker_maps
+    _worker_profiles = profiles
+    _worker_config = config
+    _worker_maps = tuple(map_ids)
+
+
+def _play_games(seed, round_index, a, b, games):
+    """
+    Worker task: play some games of one pairing.
+
+    Returns:
+        List of result records (see Tournament.results)
+    """
+    records = []
+    for game in games:
+        game_seed_value = game_seed(seed, round_index, a, b, game)
+        # Both games of a mirrored pair share the seed, and so the map
+        map_id = _worker_maps[game_seed_value % len(_worker_maps)] if _worker_maps else None
+        result, score_a, score_b, turns = play_game(
+            _worker_profiles[a], _worker_profiles[b], _worker_config,
+            game_seed_value, game % 2 == 0, map_id,
+        )
+        records.append({
+            "round": round_index, "a": a, "b": b, "game": game,
+            "result": result, "score_a": score_a, "score_b": score_b, "turns": turns,
+        })
+    return records
+
+
+def fit_elo(names, results, prior=PRIOR_GAMES):
+    """
+    Fit Elo ratings to game results (Bradley-Terry model, draws as half wins).
+
+    The fit uses every result at once, so it doesn't depend on the order
+    the games finished in. Intervals come from the Fisher information of
+    each rating with the others held fixed.
+
+    Args:
+        names: profile names
+        results: iterable of records with "a", "b" and "result" (for a)
+        prior: virtual draws of every profile against an average opponent
+
+    Returns:
+        Dict of name -> (rating, 95% confidence half-width), averaging ELO_BASE
+    """
+    index = {name: i for i, name in enumerate(names)}
+    count = len(names)
+    points = [prior / 2] * count
+    games = [[0] * count for _ in range(count)]
+    for record in results:
+        i, j = index[record["a"]], index[record["b"]]
+        points[i] += record["result"]
+        points[j] += 1 - record["result"]
+        games[i][j] += 1
+        games[j][i] += 1
+
+    # Minorization-maximization updates of the strengths; the prior's
+    # opponent has strength 1
+    strength = [1.0] * count
+    for _ in range(1000):
+        updated = [
+            points[i] / (
+                prior / (strength[i] + 1)
+                + sum(games[i][j] / (strength[i] + strength[j]) for j in range(count) if games[i][j])
+            )
+            for i in range(count)
+        ]
+        change = max((abs(u - s) / s for u, s in zip(updated, strength)), default=0.0)
+        strength = updated
+        if change < 1e-10:
+            break
+
+    logs = [math.log(s) for s in strength]
+    mean = sum(logs) / count if count else 0.0
+    ratings = {}
+    for i, name in enumerate(names):
+        p_prior = strength[i] / (strength[i] + 1)
+        information = prior * p_prior * (1 - p_prior)
+        for j in range(count):
+            if games[i][j]:
+                p = strength[i] / (strength[i] + strength[j])
+                information += games[i][j] * p * (1 - p)
+        margin = CONFIDENCE_Z * ELO_SCALE / math.sqrt(information) if information else math.inf
+        ratings[name] = (ELO_BASE + ELO_SCALE * (logs[i] - mean), margin)
+    return ratings
+
+
+def swiss_pairs(names, ratings, played, byes=()):
+    """
+    Pair profiles for a Swiss round.
+
+    Profiles are taken from the top of the rating order and paired with the
+    highest-rated profile they haven't met yet (or the next one, once they
+    have met everyone). With an odd count the lowest-rated profile that
+    hasn't sat out yet sits this round out.
+
+    Args:
+        names: profile names
+        ratings: fit_elo() output
+        played: set of frozenset({a, b}) pairings already played
+        byes: profiles that already sat out a round
+
+    Returns:
+        List of (a, b) pairs with a < b
+    """
+    order = sorted(names, key=lambda name: (-ratings[name][0], name))
+    if len(order) % 2:
+        order.remove(next((name for name in reversed(order) if name not in byes), order[-1]))
+
+    pairs = []
+    while order:
+        first = order.pop(0)
+        opponent = next((name for name in order if frozenset((first, name)) not in played), order[0])
+        order.remove(opponent)
+        pairs.append(tuple(sorted((first, opponent))))
+    return pairs
+
+
+class Tournament:
+    """
+    Round-robin or Swiss tournament between named AI profiles.
+
+    Every finished game is a record {"round", "a", "b", "game", "result",
+    "score_a", "score_b", "turns"} in ``results`` (result is from a's point
+    of view). With a checkpoint file the records are appended to it as they
+    arrive; reopening the same file skips every game already played, so an
+    interrupted run continues where it stopped and ends with the same results.
+    """
+
+    def __init__(self, profiles, config=None, games=DEFAULT_GAMES, seed=0, checkpoint=None, maps=0):
+        """
+        Initialize the tournament.
+
+        Args:
+            profiles: dict of name -> AIProfile (at least two)
+            config: GameConfig of the arena every game is played in
+            games: games per pairing (each consecutive two share a map, sides swapped)
+            seed: base seed every game seed is derived from
+            checkpoint: JSON-lines file to record results in and resume from
+            maps: play every game on one of this many fixed maps, shared
+                with the workers through a MapRegistry (0: every game on
+                its seed's random map)
+        """
+        if len(profiles) < 2:
+            raise ValueError("a tournament needs at least two profiles")
+        if maps and config is not None and config.grid_size > MAX_GRID_SIZE:
+            raise ValueError(f"shared maps support grids of up to {MAX_GRID_SIZE} cells")
+        self.profiles = dict(sorted(profiles.items()))
+        self.names = list(self.profiles)
+        self.config = config if config is not None else GameConfig()
+        self.games = games
+        self.seed = seed
+        self.checkpoint = checkpoint
+        self.maps = maps
+        self.results = []
+        self._done = set()
+
+        if checkpoint is not None:
+            self._open_checkpoint()
+
+    def _header(self):
+        """First checkpoint line: everything the results depend on."""
+        header = {
+            "version": CHECKPOINT_VERSION,
+            "seed": self.seed,
+            "games": self.games,
+            "config": asdict(self.config),
+            "profiles": {name: profile.to_dict() for name, profile in self.profiles.items()},
+        }
+        if self.maps:
+            header["maps"] = self.maps
+        return header
+
+    def _open_checkpoint(self):
+        """Load the results of an earlier run, or start a new checkpoint file."""
+        header = self._header()
+        try:
+            with open(self.checkpoint) as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            lines = []
+
+        if not lines:
+            with open(self.checkpoint, "w") as f:
+                f.write(json.dumps(header) + "\n")
+            return
+
+        if json.loads(lines[0]) != json.loads(json.dumps(header)):
+            raise ValueError(f"{self.checkpoint} was written by a tournament with other settings")
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except ValueError:  # last line cut off by an interrupted run
+                break
+            self._add(record)
+
+        # Drop a partial last line so new records start on a line of their own
+        with open(self.checkpoint, "w") as f:
+            f.write("\n".join(lines[:1 + len(self.results)]) + "\n")
+
+    def _add(self, record):
+        """Store a finished game."""
+        self.results.append(record)
+        self._done.add((record["round"], record["a"], record["b"], record["game"]))
+
+    def run(self, format="round-robin", rounds=None, jobs=None, progress=None):
+        """
+        Play every game of the tournament that hasn't been played yet.
+
+        Args:
+            format: "round-robin" (every pairing once) or "swiss"
+            rounds: Swiss rounds (default: enough for log2(profiles) + 2)
+            jobs: worker processes (default: one per CPU; 1 plays in this process)
+            progress: optional callback(round index, games done, games in round)
+                called as results arrive
+
+        Returns:
+            fit_elo() ratings of the profiles
+        """
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+        if format == "swiss" and rounds is None:
+            rounds = math.ceil(math.log2(len(self.names))) + 2
+        jobs = jobs or os.cpu_count() or 1
+
+        # Shared maps are built once here; workers attach to them by ID
+        registry = MapRegistry()
+        map_ids = [registry.add_game_map(self.config, map_seed(self.seed, i)) for i in range(self.maps)]
+
+        pool = None
+        if jobs > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker, initargs=(self.profiles, self.config, map_ids)
+            )
+        else:
+            _init_worker(self.profiles, self.config, map_ids)
+
+        try:
+            if format == "round-robin":
+                self._play_round(0, list(combinations(self.names, 2)), pool, jobs, progress)
+            else:
+                played = set()
+                byes = set()
+                for round_index in range(rounds):
+                    # Each round is paired from the results of the rounds before it,
+                    # so resuming reproduces the same pairings
+                    previous = [r for r in self.results if r["round"] < round_index]
+                    pairs = swiss_pairs(self.names, fit_elo(self.names, previous), played, byes)
+                    self._play_round(round_index, pairs, pool, jobs, progress)
+                    played.update(frozenset(pair) for pair in pairs)
+                    byes.update(set(self.names).difference(*pairs))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            registry.close()
+        return self.ratings()
+
+    def _play_round(self, round_index, pairs, pool, jobs, progress):
+        """Play the missing games of one round, recording results as they finish."""
+        missing = [
+            (a, b, [g for g in range(self.games) if (round_index, a, b, g) not in self._done])
+            for a, b in pairs
+        ]
+        total = len(pairs) * self.games
+        remaining = sum(len(games) for _, _, games in missing)
+        # Split small rounds finely enough to give every worker something to do
+        chunk = max(1, min(GAMES_PER_TASK, remaining // (jobs * 2)))
+        tasks = [
+            (self.seed, round_index, a, b, games[start:start + chunk])
+            for a, b, games in missing
+            for start in range(0, len(games), chunk)
+        ]
+
+        checkpoint = open(self.checkpoint, "a") if self.checkpoint is not None else None
+        try:
+            done = total - remaining
+            if pool is None:
+                for task in tasks:
+                    done += self._record(_play_games(*task), checkpoint)
+                    if progress is not None:
+                        progress(round_index, done, total)
+                return
+
+            pending = set()
+            tasks.reverse()
+            while tasks or pending:
+                while tasks and len(pending) < jobs * TASKS_IN_FLIGHT:
+                    pending.add(pool.submit(_play_games, *tasks.pop()))
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done += self._record(future.result(), checkpoint)
+                if progress is not None:
+                    progress(round_index, done, total)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+    def _record(self, records, checkpoint):
+        """Store a task's results and append them to the checkpoint."""
+        for record in records:
+            self._add(record)
+        if checkpoint is not None:
+            checkpoint.write("".join(json.dumps(record) + "\n" for record in records))
+            checkpoint.flush()
+        return len(records)
+
+    def ratings(self):
+        """Elo ratings and 95% confidence half-widths of every profile so far."""
+        return fit_elo(self.names, self.results)
+
+    def standings(self):
+        """
+        Aggregate statistics of every profile, best rated first.
+
+        Returns:
+            List of dicts with name, rating, margin, games, wins, draws,
+            losses, points (share of the available points), mean score and
+            mean game length in turns
+        """
+        rows = {
+            name: {"name": name, "games": 0, "wins": 0, "draws": 0, "losses": 0, "score": 0, "turns": 0}
+            for name in self.names
+        }
+        for record in self.results:
+            for name, result, score in (
+                (record["a"], record["result"], record["score_a"]),
+                (record["b"], 1 - record["result"], record["score_b"]),
+            ):
+                row = rows[name]
+                row["games"] += 1
+                row["wins" if result == 1 else "losses" if result == 0 else "draws"] += 1
+                row["score"] += score
+                row["turns"] += record["turns"]
+
+        ratings = self.ratings()
+        for name, row in rows.items():
+            games = row["games"] or 1
+            row["rating"], row["margin"] = ratings[name]
+            row["points"] = (row["wins"] + row["draws"] / 2) / games
+            row["score"] /= games
+            row["turns"] /= games
+        return sorted(rows.values(), key=lambda row: (-row["rating"], row["name"]))
+
+    def format_standings(self):
+        """Standings as aligned text lines."""
+        width = max(len(name) for name in self.names)
+        lines = [
+            f"{'profile':{width}s}   {'Elo':>12s}  {'games':>5s}  {'W-D-L':>11s}  {'points':>6s}  "
+            f"{'score':>5s}  {'turns':>5s}"
+        ]
+        for row in self.standings():
+            lines.append(
+                f"{row['name']:{width}s}   {row['rating']:5.0f} ± {row['margin']:4.0f}  {row['games']:5d}  "
+                f"{row['wins']:3d}-{row['draws']:3d}-{row['losses']:3d}  {row['points']:6.1%}  "
+                f"{row['score']:5.0f}  {row['turns']:5.1f}"
+            )
+        return lines
+
+
+def main():
+    """Tournament command."""
+    parser = argparse.ArgumentParser(description="Rate Survival Arena AI profiles against each other.")
+    parser.add_argument("names", nargs="*", help="profiles to enter (default: all)")
+    parser.add_argument("--profiles", help="JSON file of extra named profiles (see ai/profiles.py)")
+    parser.add_argument("--format", choices=FORMATS, default="round-robin")
+    parser.add_argument("--rounds", type=int, default=None, help="Swiss rounds")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="games per pairing")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", help="results file to resume from and append to")
+    parser.add_argument("--maps", type=int, default=0, help="play on this many fixed shared maps")
+    parser.add_argument("--grid-size", type=int, default=GameConfig.grid_size)
+    parser.add_argument("--enemies", type=int, default=GameConfig.max_enemies)
+    parser.add_argument("--minimax-depth", type=int, default=GameConfig.minimax_depth)
+    args = parser.parse_args()
+
+    available = dict(BUILTIN_PROFILES)
+    if args.profiles:
+        available.update(load_profiles(args.profiles))
+    unknown = [name for name in args.names if name not in available]
+    if unknown:
+        parser.error(f"unknown profiles: {', '.join(unknown)} (available: {', '.join(available)})")
+    profiles = {name: available[name] for name in args.names} if args.names else available
+
+    config = GameConfig(
+        grid_size=args.grid_size, max_enemies=args.enemies, minimax_depth=args.minimax_depth
+    )
+    try:
+        tournament = Tournament(profiles, config, args.games, args.seed, args.checkpoint, args.maps)
+    except ValueError as e:
+        parser.error(str(e))
+    resumed = len(tournament.results)
+    if resumed:
+        print(f"Resuming from {args.checkpoint}: {resumed} games already played")
+
+    start = time.perf_counter()
+    last_report = [start]
+
+    def progress(round_index, done, total):
+        now = time.perf_counter()
+        if now - last_report[0] >= 1.0 or done == total:
+            last_report[0] = now
+            rate = (len(tournament.results) - resumed) / max(now - start, 1e-9)
+            print(f"  round {round_index + 1}: {done}/{total} games ({rate:.0f} games/s)", flush=True)
+
+    tournament.run(args.format, args.rounds, args.jobs, progress)
+    elapsed = time.perf_counter() - start
+
+    print()
+    print("\n".join(tournament.format_standings()))
+    print(f"\n{len(tournament.results) - resumed} games in {elapsed:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())